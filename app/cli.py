@@ -21,7 +21,7 @@ from utils.models import (
     Label,
     TicketLabelJoin,
     UserTicketJoin,
-    database,
+    initialize_db,
 )
 from utils.path import data_path, path as app_path
 
@@ -350,10 +350,8 @@ def linear_graphql_request(api_key: str, query: str, variables: dict | None = No
 def import_from_linear(api_key: str):  # noqa: C901
     """Import teams, issues, and labels from Linear"""
 
-    # Ensure database is set up
-    database.connect()
-    database.create_tables([Project, Ticket, Label, TicketLabelJoin, UserTicketJoin], safe=True)
-    database.close()
+    # Ensure database is set up (same schema path as the server, incl. column backfills)
+    initialize_db()
 
     print("Connecting to Linear API...")
 
@@ -7,7 +7,9 @@ import flask
 from flask_caching import Cache
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+from jinja2 import FileSystemBytecodeCache
 
+from .fast_json import OrjsonProvider
 from .path import data_path, path
 from .wsgi_application_prefix import ApplicationPrefixMiddleware, normalize_application_prefix
 
@@ -79,6 +81,15 @@ def _persistent_fallback_secret_key() -> str:
     return generated
 
 
+def _warm_template_cache(app: flask.Flask) -> None:
+    """Compile every template at startup so the first request to each page skips parsing."""
+    for name in app.jinja_env.list_templates(extensions=["jinja2", "html"]):
+        try:
+            app.jinja_env.get_template(name)
+        except Exception as e:
+            print(f"Error precompiling template {name}: {e}")
+
+
 def create_app():  # noqa: C901
     """
     Application factory function for creating Flask app instances.
@@ -97,6 +108,7 @@ def create_app():  # noqa: C901
         initialize_db()
 
     app = flask.Flask("Broke")
+    app.json = OrjsonProvider(app)
 
     # Secret key precedence: BROKE_SECRET_KEY -> FLASK_SECRET_KEY -> persisted local key.
     secret_key = (
@@ -143,6 +155,13 @@ def create_app():  # noqa: C901
     app.template_folder = path("templates")
     app.static_folder = path("static")
 
+    # Compiled templates survive restarts and are shared by workers; entries are keyed
+    # by a source checksum, so edited templates are recompiled. Test apps compile in memory.
+    if os.environ.get("FLASK_ENV") != "testing":
+        jinja_cache_dir = data_path("jinja-cache")
+        jinja_cache_dir.mkdir(parents=True, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(str(jinja_cache_dir))
+
     # Register template filters
     @app.template_filter("timestamp_to_date")
     def timestamp_to_date(epoch):
@@ -497,6 +516,9 @@ def create_app():  # noqa: C901
     def inject_current_year():
         return {"current_year": datetime.now().year}
 
+    if os.environ.get("FLASK_ENV") != "testing":
+        _warm_template_cache(app)
+
     if application_prefix:
         app.wsgi_app = ApplicationPrefixMiddleware(app.wsgi_app, application_prefix)
 
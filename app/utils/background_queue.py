@@ -0,0 +1,69 @@
+"""
+Background batch queue
+
+One daemon thread per process drains queued work in batches, so a request can
+hand work off and return immediately. The thread starts on first use, which
+keeps it out of the gunicorn master (threads do not survive fork).
+
+Nothing is persisted: items still queued when the process dies are lost.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class BatchQueue:
+    def __init__(
+        self,
+        handler: Callable[[list], None],
+        *,
+        max_batch: int = 100,
+        max_wait: float = 0.05,
+        name: str = "broke-batch-queue",
+    ):
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.name = name
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def put(self, item: Any) -> None:
+        self._ensure_worker()
+        self._queue.put(item)
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _next_batch(self) -> list:
+        """Block for one item, then collect more until max_batch or max_wait is reached."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            try:
+                self.handler(batch)
+            except Exception:
+                logger.exception("%s: handler failed, dropped %s item(s)", self.name, len(batch))
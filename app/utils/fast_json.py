@@ -0,0 +1,76 @@
+"""
+JSON helpers backed by orjson
+
+orjson is several times faster than the stdlib on both directions. It is
+stricter, though (64-bit integer limit, str keys only), so anything it rejects
+falls back to the stdlib and behaves exactly as before. NaN and Infinity are
+not rejected but written as ``null``; output containing ``null`` is checked for
+non-finite floats and re-serialized with the stdlib so they survive as before.
+"""
+
+import json
+import math
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+def _has_nonfinite(obj) -> bool:
+    """True if ``obj`` holds a NaN/Infinity float that orjson would turn into null."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_nonfinite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite(value) for value in obj)
+    return False
+
+
+def dumps(obj) -> str:
+    """Serialize to a compact JSON string."""
+    try:
+        out = orjson.dumps(obj)
+    except TypeError:
+        return json.dumps(obj)
+    if b"null" in out and _has_nonfinite(obj):
+        return json.dumps(obj)
+    return out.decode("utf-8")
+
+
+def loads(data: str | bytes):
+    """Parse JSON from str or bytes; raises json.JSONDecodeError like the stdlib."""
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider (``jsonify``, ``request.get_json``) using orjson when it can."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        # response() always passes compact separators or indent=2 (debug); orjson
+        # covers both. Any other option goes to the stdlib.
+        stdlib_kwargs = dict(kwargs)
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("separators") == (",", ":"):
+            del kwargs["separators"]
+        if kwargs.get("indent") == 2:
+            del kwargs["indent"]
+            option |= orjson.OPT_INDENT_2
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            out = orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            return super().dumps(obj, **stdlib_kwargs)
+        if b"null" in out and _has_nonfinite(obj):
+            return super().dumps(obj, **stdlib_kwargs)
+        return out.decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return loads(s)
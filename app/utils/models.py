@@ -1,18 +1,22 @@
+import functools
 import logging
+import random
 import time
-import uuid
 
-import pyargon2
 from peewee import (
     AutoField,
+    BlobField,
     CharField,
     ForeignKeyField,
     IntegerField,
     Model,
     SqliteDatabase,
     TextField,
+    chunked,
 )
 
+from .local_cache import LocalCache
+from .passwords import hash_password
 from .path import data_path
 
 logger = logging.getLogger(__name__)
@@ -21,6 +25,11 @@ logger.info(f"Database path: {data_path('app.db')}")
 database = SqliteDatabase(data_path("app.db"))
 
 
+def _now() -> int:
+    """Current unix time; shared column default (one named callable instead of a lambda each)."""
+    return int(time.time())
+
+
 class BaseModel(Model):
     class Meta:
         database = database
@@ -33,21 +42,48 @@ class User(BaseModel):
     email = CharField(unique=True)
     admin = IntegerField(default=0)
 
+    def save(self, *args, **kwargs):
+        result = super().save(*args, **kwargs)
+        _users_ordered.clear()
+        return result
+
+    def delete_instance(self, *args, **kwargs):
+        result = super().delete_instance(*args, **kwargs)
+        _users_ordered.clear()
+        return result
+
+
+# Team list for the settings page. Cleared on User save/delete in this process; the
+# TTL bounds staleness in other workers.
+_users_ordered = LocalCache(maxsize=1, ttl=30)
+
+
+def users_ordered() -> list["User"]:
+    """All users ordered by username."""
+    users = _users_ordered.get("all")
+    if users is None:
+        users = list(User.select().order_by(User.username))
+        _users_ordered.set("all", users)
+    return users
+
 
 def create_user(username: str, password, email: str, admin: int = 0):
     User.create_table(safe=True)
 
-    salt = uuid.uuid4().hex
-    password_hash = pyargon2.hash(password, salt)
+    # Salt and Argon2 parameters live inside the encoded hash; the column is legacy-only.
     user = User.create(
-        username=username, password_hash=password_hash, salt=salt, email=email, admin=admin
+        username=username,
+        password_hash=hash_password(password),
+        salt="",
+        email=email,
+        admin=admin,
     )
     return user
 
 
 class UserCreateToken(BaseModel):  # should be deleted after use
     token = CharField(primary_key=True)
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
     role = IntegerField(default=0)  # For future use
     name = CharField(null=True)  # For friendly identification of the invite
 
@@ -55,12 +91,12 @@ class UserCreateToken(BaseModel):  # should be deleted after use
 class PasswordResetToken(BaseModel):
     token = CharField(primary_key=True)
     user = CharField()
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
 
 
 class DesktopHandshakeToken(BaseModel):
     token = CharField(primary_key=True)
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
     expires_at = IntegerField()
     used = IntegerField(default=0)
 
@@ -71,7 +107,7 @@ class DeviceToken(BaseModel):
     device_id = CharField(index=True)
     device_name = CharField()
     token_hash = CharField(index=True)
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
     expires_at = IntegerField()
     last_used = IntegerField(null=True)
     revoked = IntegerField(default=0)
@@ -89,10 +125,38 @@ class Project(BaseModel):
     settings = TextField(default="{}")
     archived = IntegerField(default=0)  # 1 = hidden from selectors; existing tickets unchanged
 
+    def save(self, *args, **kwargs):
+        result = super().save(*args, **kwargs)
+        _active_projects.clear()
+        return result
 
-def active_projects_ordered():
+    def delete_instance(self, *args, **kwargs):
+        result = super().delete_instance(*args, **kwargs)
+        _active_projects.clear()
+        return result
+
+
+# Rendered in the sidebar of nearly every page (active) and the settings page (all).
+# Cleared on Project save/delete in this process; the TTL bounds staleness in other workers.
+_active_projects = LocalCache(maxsize=2, ttl=30)
+
+
+def active_projects_ordered() -> list["Project"]:
     """Projects available for new tickets, intake, and project pickers."""
-    return Project.select().where(Project.archived == 0).order_by(Project.name)
+    projects = _active_projects.get("active")
+    if projects is None:
+        projects = list(Project.select().where(Project.archived == 0).order_by(Project.name))
+        _active_projects.set("active", projects)
+    return projects
+
+
+def all_projects_ordered() -> list["Project"]:
+    """Every project, archived included, ordered by name."""
+    projects = _active_projects.get("all")
+    if projects is None:
+        projects = list(Project.select().order_by(Project.name))
+        _active_projects.set("all", projects)
+    return projects
 
 
 class ProjectPart(BaseModel):
@@ -102,13 +166,52 @@ class ProjectPart(BaseModel):
     name = CharField(unique=True)
     description = CharField()
 
+    def save(self, *args, **kwargs):
+        result = super().save(*args, **kwargs)
+        _project_parts.pop(self.id)
+        return result
+
+    def delete_instance(self, *args, **kwargs):
+        result = super().delete_instance(*args, **kwargs)
+        _project_parts.pop(self.id)
+        return result
+
+    # Bulk queries can touch any row, and SQLite hands a deleted max id to the next
+    # insert, so they drop the whole cache rather than risk serving a stale part.
+    @classmethod
+    def update(cls, *args, **kwargs):
+        _project_parts.clear()
+        return super().update(*args, **kwargs)
+
+    @classmethod
+    def delete(cls):
+        _project_parts.clear()
+        return super().delete()
+
+
+# Every ingest request resolves its part by id; parts are rarely edited. Cleared per row
+# on save/delete and wholesale on bulk update/delete in this process; the TTL bounds
+# staleness in other workers.
+_project_parts = LocalCache(maxsize=1024, ttl=60)
+
+
+def get_project_part(part_id: int) -> "ProjectPart | None":
+    """ProjectPart by id (or None), served from a short-lived process-local cache."""
+    part = _project_parts.get(part_id)
+    if part is None:
+        part = ProjectPart.get_or_none(ProjectPart.id == part_id)
+        if part is not None:
+            _project_parts.set(part_id, part)
+    return part
+
 
 class ErrorGroup(BaseModel):
     """Groups similar errors together by fingerprint"""
 
     id = AutoField(primary_key=True)
     part = ForeignKeyField(ProjectPart, backref="error_groups")
-    fingerprint = CharField(index=True)  # Hash of message + stacktrace for grouping
+    # Hash of message + stacktrace for grouping; looked up via the (part, fingerprint) index
+    fingerprint = CharField()
 
     # Extracted fields for display/querying
     exception_type = CharField(null=True)  # e.g., "ValueError", "TypeError"
@@ -128,8 +231,8 @@ class ErrorGroup(BaseModel):
 
     # Aggregation
     event_count = IntegerField(default=1)
-    first_seen = IntegerField(default=lambda: int(time.time()))
-    last_seen = IntegerField(default=lambda: int(time.time()))
+    first_seen = IntegerField(default=_now)
+    last_seen = IntegerField(default=_now)
 
     # Status for issue tracking
     status = CharField(default="unresolved")  # unresolved, resolved, ignored
@@ -145,10 +248,16 @@ class ErrorOccurrence(BaseModel):
     """Individual occurrence timestamps for an error group"""
 
     id = AutoField(primary_key=True)
-    error_group = ForeignKeyField(ErrorGroup, backref="occurrences")
-    timestamp = IntegerField(default=lambda: int(time.time()))
+    # Indexed through (error_group, timestamp) below
+    error_group = ForeignKeyField(ErrorGroup, backref="occurrences", index=False)
+    timestamp = IntegerField(default=_now)
     event_id = CharField(null=True)  # Sentry event_id if provided
 
+    class Meta:  # type: ignore
+        # Charts, spike counts and the occurrence list all read one group's time range;
+        # with this index they are range scans that never touch the table rows.
+        indexes = ((("error_group", "timestamp"), False),)
+
 
 class Session(BaseModel):
     """Session data for crash-free rate tracking"""
@@ -177,7 +286,7 @@ class Transaction(BaseModel):
     op = CharField(null=True)  # Operation type (http, db, etc.)
     duration = IntegerField(null=True)  # Duration in milliseconds
     status = CharField(null=True)
-    timestamp = IntegerField(default=lambda: int(time.time()))
+    timestamp = IntegerField(default=_now)
     data = CharField(null=True)  # Additional data as JSON
 
 
@@ -188,15 +297,16 @@ class Attachment(BaseModel):
     error_group = ForeignKeyField(ErrorGroup, backref="attachments", null=True)
     filename = CharField()
     content_type = CharField(null=True)
-    data = CharField()  # Base64 encoded or path to file
-    timestamp = IntegerField(default=lambda: int(time.time()))
+    data = CharField()  # Text attachments (truncated); "" when the payload is binary
+    data_raw = BlobField(null=True)  # Binary attachments, stored as-is (truncated)
+    timestamp = IntegerField(default=_now)
 
 
 # Legacy model - kept for backwards compatibility
 class Error(BaseModel):
     part = ForeignKeyField(ProjectPart, backref="errors")
     data = CharField()  # Json
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
 
 
 class WorkCycle(BaseModel):
@@ -208,7 +318,7 @@ class WorkCycle(BaseModel):
     project = CharField(null=True, index=True)  # null = workspace-wide
     starts_at = IntegerField(null=True)
     ends_at = IntegerField(null=True)
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
 
 
 class Ticket(BaseModel):
@@ -224,7 +334,7 @@ class Ticket(BaseModel):
 
     error = ForeignKeyField(ErrorGroup, null=True)
 
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
     active = IntegerField(default=1)
     parent_ticket_id = CharField(null=True, index=True)
     work_cycle_id = IntegerField(null=True, index=True)
@@ -246,7 +356,7 @@ class Comment(BaseModel):
     ticket = CharField()
     user = ForeignKeyField(User, backref="comments")
     body = CharField()
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
     # 1 when posted via the agent API (display as AI/agent, not the token owner).
     via_agent = IntegerField(default=0)
 
@@ -259,7 +369,7 @@ class TicketUpdateMessage(BaseModel):
     title = CharField()
     icon = CharField()
     message = CharField()
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
     author = ForeignKeyField(User, null=True)
 
     class Meta:  # type: ignore
@@ -270,6 +380,29 @@ class Label(BaseModel):
     name = CharField(primary_key=True)
     color = CharField()
 
+    def save(self, *args, **kwargs):
+        result = super().save(*args, **kwargs)
+        _labels_ordered.clear()
+        return result
+
+    def delete_instance(self, *args, **kwargs):
+        result = super().delete_instance(*args, **kwargs)
+        _labels_ordered.clear()
+        return result
+
+
+# Cleared on Label save/delete in this process; the TTL bounds staleness in other workers.
+_labels_ordered = LocalCache(maxsize=1, ttl=30)
+
+
+def labels_ordered() -> list["Label"]:
+    """All labels ordered by name."""
+    labels = _labels_ordered.get("all")
+    if labels is None:
+        labels = list(Label.select().order_by(Label.name))
+        _labels_ordered.set("all", labels)
+    return labels
+
 
 class TicketLabelJoin(BaseModel):
     ticket = CharField()
@@ -311,14 +444,14 @@ class Webhook(BaseModel):
     """Outgoing webhooks configuration"""
 
     id = AutoField(primary_key=True)
-    user = CharField()  # References User.username
+    user = CharField(index=True)  # References User.username
 
     url = CharField()
     events = TextField()  # JSON array of event types
     secret = CharField(null=True)  # For signing payloads
 
     active = IntegerField(default=1)
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
     last_triggered = IntegerField(null=True)
 
 
@@ -326,12 +459,17 @@ class WebhookDelivery(BaseModel):
     """Log of webhook delivery attempts"""
 
     id = AutoField(primary_key=True)
-    webhook = ForeignKeyField(Webhook, backref="deliveries")
+    # Indexed through (webhook, timestamp) below
+    webhook = ForeignKeyField(Webhook, backref="deliveries", index=False)
 
     event = CharField()
     response_code = IntegerField()
     status = CharField()  # success, error
-    timestamp = IntegerField(default=lambda: int(time.time()))
+    timestamp = IntegerField(default=_now)
+
+    class Meta:  # type: ignore
+        # Recent-activity reads walk one webhook's deliveries newest first.
+        indexes = ((("webhook", "timestamp"), False),)
 
 
 class APIToken(BaseModel):
@@ -344,7 +482,7 @@ class APIToken(BaseModel):
     token_preview = CharField()  # First 8 chars for display
 
     last_used = IntegerField(null=True)
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
 
 
 class AgentToken(BaseModel):
@@ -360,7 +498,7 @@ class AgentToken(BaseModel):
     project = CharField(null=True, index=True)
     work_cycle_id = IntegerField(null=True, index=True)
     ticket_id = CharField(null=True, index=True)  # when set, token is limited to this ticket only
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
 
 
 class DSNToken(BaseModel):
@@ -373,7 +511,7 @@ class DSNToken(BaseModel):
     token_hash = CharField(null=True)
     token_preview = CharField(null=True)
 
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
     last_used = IntegerField(null=True)
 
 
@@ -390,7 +528,7 @@ class NotificationEventLog(BaseModel):
     channel = CharField()
     status = CharField()  # success, error
     detail = TextField(null=True)
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
 
 
 # ============ Changelog Models ============
@@ -404,7 +542,7 @@ class ChangelogRelease(BaseModel):
     title = CharField(null=True)  # Optional release title
     content = TextField()  # The raw Markdown content for the release
     status = CharField(default="draft")  # draft or published
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
 
 
 class Monitor(BaseModel):
@@ -423,7 +561,7 @@ class Monitor(BaseModel):
     last_status_change_at = IntegerField(null=True)
     last_error = TextField(null=True)
     last_response_ms = IntegerField(null=True)
-    created_at = IntegerField(default=lambda: int(time.time()))
+    created_at = IntegerField(default=_now)
 
 
 class MonitorCheck(BaseModel):
@@ -479,19 +617,25 @@ MODELS = [
 
 
 def initialize_db():
-    database.connect(reuse_if_open=True)
-    database.create_tables(MODELS, safe=True)
-    _ensure_ticket_parent_column()
-    _ensure_work_cycle_schema()
-    _ensure_ai_delegate_column()
-    _ensure_comment_via_agent_column()
-    _ensure_agent_token_ticket_id_column()
-    _ensure_dsn_token_columns()
-    _ensure_project_settings_column()
-    _ensure_project_archived_column()
-    _ensure_errorgroup_escalation_spike_column()
-    _ensure_monitor_last_response_ms_column()
-    database.close()
+    """Create tables and backfill columns; the single schema entry point for all callers."""
+    with database.connection_context():
+        database.create_tables(MODELS, safe=True)
+        _ensure_ticket_parent_column()
+        _ensure_work_cycle_schema()
+        _ensure_ai_delegate_column()
+        _ensure_comment_via_agent_column()
+        _ensure_agent_token_ticket_id_column()
+        _ensure_dsn_token_columns()
+        _ensure_project_settings_column()
+        _ensure_project_archived_column()
+        _ensure_errorgroup_escalation_spike_column()
+        _ensure_monitor_last_response_ms_column()
+        _ensure_attachment_data_raw_column()
+        _drop_redundant_errorgroup_fingerprint_index()
+        _drop_redundant_erroroccurrence_group_index()
+        _drop_redundant_webhookdelivery_webhook_index()
+        # Refresh planner statistics for tables whose shape changed since the last run
+        database.execute_sql("PRAGMA optimize;")
 
 
 def _ensure_ticket_parent_column() -> None:
@@ -571,54 +715,85 @@ def _ensure_monitor_last_response_ms_column() -> None:
         database.execute_sql("ALTER TABLE monitor ADD COLUMN last_response_ms INTEGER;")
 
 
-def setup_test_data():  # noqa: C901
-    # Function to setup test data in the database
-    import random
+def _ensure_attachment_data_raw_column() -> None:
+    columns = [row[1] for row in database.execute_sql("PRAGMA table_info(attachment);").fetchall()]
+    if columns and "data_raw" not in columns:
+        database.execute_sql("ALTER TABLE attachment ADD COLUMN data_raw BLOB;")
+
+
+def _drop_redundant_errorgroup_fingerprint_index() -> None:
+    """Older schemas carried a fingerprint-only index shadowed by (part, fingerprint)."""
+    database.execute_sql("DROP INDEX IF EXISTS errorgroup_fingerprint;")
+
+
+def _drop_redundant_erroroccurrence_group_index() -> None:
+    """The foreign-key index on error_group is a prefix of (error_group, timestamp)."""
+    database.execute_sql("DROP INDEX IF EXISTS erroroccurrence_error_group_id;")
 
-    import pyargon2
+
+def _drop_redundant_webhookdelivery_webhook_index() -> None:
+    """The foreign-key index on webhook is a prefix of (webhook, timestamp)."""
+    database.execute_sql("DROP INDEX IF EXISTS webhookdelivery_webhook_id;")
+
+
+# Only the providers the seeder draws from; the full default set is much slower to load.
+_SEED_FAKER_PROVIDERS = [
+    "faker.providers.person",
+    "faker.providers.internet",
+    "faker.providers.lorem",
+    "faker.providers.color",
+    "faker.providers.misc",
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _seed_faker():
+    """Faker for setup_test_data, built once per process (faker is a dev-only dependency)."""
     from faker import Faker
 
+    return Faker(providers=_SEED_FAKER_PROVIDERS)
+
+
+def setup_test_data():  # noqa: C901
+    # Function to setup test data in the database
+    now = _now()
+
     def random_time():
         """Generate a random timestamp within the past year"""
-        return int(time.time() - random.randint(0, 31536000))
+        return now - random.randint(0, 31536000)
 
-    fake = Faker()
+    fake = _seed_faker()
 
-    # Delete existing data
-    database.connect()
-    for model in MODELS:
-        model.delete().execute()
-    database.close()
-
-    salt = "randomsalt"
+    # Delete existing data in one transaction (one commit instead of one per table)
+    with database.connection_context(), database.atomic():
+        for model in MODELS:
+            database.execute_sql(f'DELETE FROM "{model._meta.table_name}";')
 
+    # Rows go in as INSERT OR IGNORE so duplicate fake values are dropped by SQLite
+    # instead of raising IntegrityError per row.
     # Create the main test user (always exists)
-    try:
-        User.create(
-            username="user",
-            password_hash=pyargon2.hash("code", salt),
-            salt=salt,
-            email="user@test.com",
-            admin=1,
-        )
-    except Exception:
-        pass
+    User.insert(
+        username="user",
+        password_hash=hash_password("code"),
+        salt="",
+        email="user@test.com",
+        admin=1,
+    ).on_conflict_ignore().execute()
 
     # Create additional fake users
     usernames = ["user"]
     for _ in range(5):
         username = fake.user_name()
-        try:
-            User.create(
-                username=username,
-                password_hash=pyargon2.hash(fake.password(), salt),
-                salt=salt,
-                email=fake.unique.email(),
-                admin=0,
-            )
-            usernames.append(username)
-        except Exception:
-            pass
+        if username in usernames:
+            continue
+        User.insert(
+            username=username,
+            password_hash=hash_password(fake.password()),
+            salt="",
+            email=fake.unique.email(),
+            admin=0,
+        ).on_conflict_ignore().execute()
+        usernames.append(username)
 
     # Create projects
     project_data = [
@@ -628,59 +803,56 @@ def setup_test_data():  # noqa: C901
         {"id": "INF", "name": "Infrastructure", "icon": "ph ph-cloud", "color": "orange"},
         {"id": "DOC", "name": "Documentation", "icon": "ph ph-book-open", "color": "teal"},
     ]
-    project_ids = []
-    for proj in project_data:
-        try:
-            Project.create(**proj)
-            project_ids.append(proj["id"])
-        except Exception:
-            pass
+    Project.insert_many(project_data).on_conflict_ignore().execute()
+    _active_projects.clear()
+    _users_ordered.clear()
+    project_ids = [proj["id"] for proj in project_data]
 
     # Create tickets
     statuses = ["backlog", "todo", "in-progress", "in-review", "done", "closed", "duplicate"]
     priorities = ["low", "medium", "high", "urgent"]
-    ticket_ids = []
+    ticket_rows = []
 
     for i in range(20):
         project_id = random.choice(project_ids)
-        ticket_id = f"{project_id}-{100 + i}"
-        try:
-            Ticket.create(
-                id=ticket_id,
-                title=fake.sentence(nb_words=5)[:-1],  # Remove trailing period
-                description=fake.paragraph(nb_sentences=10),
-                status=random.choice(statuses),
-                priority=random.choice(priorities),
-                project=project_id,
-                created_at=random_time(),
-            )
-            ticket_ids.append(ticket_id)
-        except Exception as e:
-            print(e)
+        ticket_rows.append(
+            {
+                "id": f"{project_id}-{100 + i}",
+                "title": fake.sentence(nb_words=5)[:-1],  # Remove trailing period
+                "description": fake.paragraph(nb_sentences=10),
+                "status": random.choice(statuses),
+                "priority": random.choice(priorities),
+                "project": project_id,
+                "created_at": random_time(),
+            }
+        )
+    Ticket.insert_many(ticket_rows).on_conflict_ignore().execute()
+    ticket_ids = [row["id"] for row in ticket_rows]
 
     # Assign users to tickets
+    assignment_rows = []
     for ticket_id in ticket_ids:
         # Assign 1-3 random users to each ticket
         assigned_users = random.sample(usernames, k=random.randint(1, min(3, len(usernames))))
         for username in assigned_users:
-            try:
-                UserTicketJoin.create(user=username, ticket=ticket_id)
-            except Exception:
-                pass
+            assignment_rows.append({"user": username, "ticket": ticket_id})
+    UserTicketJoin.insert_many(assignment_rows).on_conflict_ignore().execute()
 
     # Create comments on tickets
+    comment_rows = []
     for ticket_id in ticket_ids:
-        # Add 0-4 comments per ticket
         for _ in range(random.randint(1, 20)):
-            try:
-                Comment.create(
-                    ticket=ticket_id,
-                    user=random.choice(usernames),
-                    body=fake.paragraph(nb_sentences=random.randint(1, 3)),
-                    created_at=random_time(),
-                )
-            except Exception:
-                pass
+            comment_rows.append(
+                {
+                    "ticket": ticket_id,
+                    "user": random.choice(usernames),
+                    "body": fake.paragraph(nb_sentences=random.randint(1, 3)),
+                    "created_at": random_time(),
+                }
+            )
+    # Chunked to stay under SQLite's bound-parameter limit on older builds
+    for batch in chunked(comment_rows, 100):
+        Comment.insert_many(batch).on_conflict_ignore().execute()
 
     # Create ticket update messages
     update_types = [
@@ -691,47 +863,52 @@ def setup_test_data():  # noqa: C901
         {"title": "Description Updated", "icon": "ph ph-pencil"},
     ]
 
+    update_rows = []
     for ticket_id in ticket_ids:
         # Add 0-3 update messages per ticket
         for _ in range(random.randint(0, 3)):
             update_type = random.choice(update_types)
-            try:
-                TicketUpdateMessage.create(
-                    ticket=ticket_id,
-                    title=update_type["title"],
-                    icon=update_type["icon"],
-                    message=fake.sentence(nb_words=8),
-                    created_at=random_time(),
-                )
-            except Exception:
-                pass
+            update_rows.append(
+                {
+                    "ticket": ticket_id,
+                    "title": update_type["title"],
+                    "icon": update_type["icon"],
+                    "message": fake.sentence(nb_words=8),
+                    "created_at": random_time(),
+                }
+            )
+    if update_rows:
+        TicketUpdateMessage.insert_many(update_rows).on_conflict_ignore().execute()
 
     # Add labels
     label_names = ["bug", "feature", "urgent", "low-priority", "documentation"]
-    for label_name in label_names:
-        try:
-            Label.create(name=label_name, color=fake.color_name().lower())
-        except Exception:
-            pass
+    Label.insert_many(
+        [{"name": name, "color": fake.color_name().lower()} for name in label_names]
+    ).on_conflict_ignore().execute()
+    _labels_ordered.clear()
 
     # Assign labels to tickets
+    label_rows = []
     for ticket_id in ticket_ids:
         # Assign 0-2 labels per ticket
         assigned_labels = random.sample(label_names, k=random.randint(0, min(2, len(label_names))))
         for label_name in assigned_labels:
-            try:
-                TicketLabelJoin.create(ticket=ticket_id, label=label_name)
-            except Exception:
-                pass
+            label_rows.append({"ticket": ticket_id, "label": label_name})
+    if label_rows:
+        TicketLabelJoin.insert_many(label_rows).on_conflict_ignore().execute()
 
     # Create workspace-level parts (not tied to ticket projects)
-    for _ in range(random.randint(2, 6)):
-        part_name = fake.word().capitalize() + " Service"
-        try:
-            ProjectPart.create(
-                name=part_name,
-                description=fake.sentence(nb_words=10),
-            )
-        except Exception as e:
-            print(e)
-            continue
+    ProjectPart.insert_many(
+        [
+            {
+                "name": fake.word().capitalize() + " Service",
+                "description": fake.sentence(nb_words=10),
+            }
+            for _ in range(random.randint(2, 6))
+        ]
+    ).on_conflict_ignore().execute()
+    # The bulk DELETE above and these inserts bypass the model hooks
+    _project_parts.clear()
+
+    # Fresh data: gather planner statistics so status/priority filters pick good indexes
+    database.execute_sql("ANALYZE;")
@@ -0,0 +1,56 @@
+"""Password hashing: argon2-cffi encoded hashes, with verification of legacy pyargon2 rows."""
+
+from __future__ import annotations
+
+import functools
+import hmac
+
+import pyargon2
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+# OWASP-recommended Argon2id profile (46 MiB, t=2, p=1). Parameters are stored in
+# the encoded hash, so raising them later only triggers a rehash on next login.
+_hasher = PasswordHasher(time_cost=2, memory_cost=46 * 1024, parallelism=1)
+
+_ENCODED_PREFIX = "$argon2"
+
+
+def _is_encoded(password_hash: str | None) -> bool:
+    return bool(password_hash) and str(password_hash).startswith(_ENCODED_PREFIX)
+
+
+def hash_password(password: str) -> str:
+    """Return a self-describing ``$argon2id$...`` hash (salt and parameters embedded)."""
+    return _hasher.hash(password)
+
+
+def verify_password(password: str, password_hash: str | None, salt: str | None = None) -> bool:
+    """Check ``password`` against a stored hash; ``salt`` is only used for legacy rows."""
+    if not password_hash:
+        return False
+    if _is_encoded(password_hash):
+        try:
+            return _hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    # Legacy rows: raw pyargon2 hex digest with the salt in its own column.
+    legacy = pyargon2.hash(password, str(salt or ""))
+    return hmac.compare_digest(str(password_hash), legacy)
+
+
+@functools.lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    return _hasher.hash("broke-unknown-user")
+
+
+def verify_dummy_password(password: str) -> None:
+    """Spend a real Argon2 verify for unknown usernames so they cost the same as a bad password."""
+    verify_password(password, _dummy_hash())
+
+
+def password_needs_rehash(password_hash: str | None) -> bool:
+    """True for legacy rows and encoded hashes made with weaker parameters."""
+    if not _is_encoded(password_hash):
+        return True
+    return _hasher.check_needs_rehash(str(password_hash))
@@ -1,24 +1,25 @@
 # Relative Time Utility
 
+import bisect
 import time
+from typing import Optional
 
+# (upper bound in seconds, format, unit in seconds); the last step is open-ended
+_STEPS = (
+    (60, "just now", 0),
+    (3600, "%dm ago", 60),
+    (86400, "%dh ago", 3600),
+    (604800, "%dd ago", 86400),
+    (float("inf"), "%dw ago", 604800),
+)
+_STEP_BOUNDS = [step[0] for step in _STEPS]
 
-def time_ago(timestamp: int) -> str:
+
+def time_ago(timestamp: int, now: Optional[int] = None) -> str:
     """Convert Unix timestamp to human-readable time ago string"""
-    now = int(time.time())
+    if now is None:
+        now = int(time.time())
     diff = now - timestamp
 
-    if diff < 60:
-        return "just now"
-    elif diff < 3600:
-        minutes = diff // 60
-        return f"{minutes}m ago"
-    elif diff < 86400:
-        hours = diff // 3600
-        return f"{hours}h ago"
-    elif diff < 604800:
-        days = diff // 86400
-        return f"{days}d ago"
-    else:
-        weeks = diff // 604800
-        return f"{weeks}w ago"
+    _, fmt, unit = _STEPS[bisect.bisect_right(_STEP_BOUNDS, diff)]
+    return fmt % (diff // unit) if unit else fmt
@@ -12,11 +12,15 @@ import hmac
 import secrets
 from functools import wraps
 
-import pyargon2
 from flask import current_app, g, jsonify, redirect, request, session, url_for
-from peewee import DoesNotExist
 
 from .models import User
+from .passwords import (
+    hash_password,
+    password_needs_rehash,
+    verify_dummy_password,
+    verify_password,
+)
 
 # CSRF lives in its own cookie so we never write _csrf_token into the signed session
 # cookie (that caused extra re-signing, races with parallel requests, and empty sessions).
@@ -299,31 +303,39 @@ def init_auth_routes(app):
 
 def authenticate(username, password) -> User | None:
     """Authenticate user with username and password"""
-    # Pseudo authentication function
-    # In real application, verify username and password from database
-
-    try:
-        user: User = User.select().where(User.username == username).first()
-        if not user:
-            return None
+    user = User.get_or_none(User.username == username)
+    if not user:
+        # Equalize timing with the wrong-password path to avoid username enumeration.
+        verify_dummy_password(password)
+        return None
 
-        if user.password_hash == pyargon2.hash(password, str(user.salt)):
-            return user
-    except DoesNotExist:
+    if not verify_password(password, user.password_hash, user.salt):
         return None
 
+    # Upgrade legacy pyargon2 rows (and outdated parameters) to the current encoded hash.
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = hash_password(password)
+        user.salt = ""
+        user.save(only=[User.password_hash, User.salt])
+    return user
+
 
 def get_current_user() -> User | None:
     """
     Get the currently authenticated user from the session.
     Returns None if no user is logged in.
+
+    The resolved user is cached on ``flask.g`` for the rest of the request, so
+    ``@protected`` plus any helpers that call this again cost a single query.
     """
     user_id = session.get("user_id")
     if not user_id:
         return None
 
-    try:
-        user = User.select().where(User.username == user_id).first()
-        return user
-    except DoesNotExist:
-        return None
+    cached = g.get("_current_user")
+    if cached is not None and cached[0] == user_id:
+        return cached[1]
+
+    user = User.get_or_none(User.username == user_id)
+    g._current_user = (user_id, user)
+    return user
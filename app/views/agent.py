@@ -8,7 +8,7 @@ from flask import Blueprint, jsonify, request
 
 from ..utils.agent_auth import agent_api_protected, agent_token_allows_ticket, authenticate_agent_bearer
 from ..utils.events import EventTypes, bus
-from ..utils.models import Comment, Ticket, TicketUpdateMessage, User
+from ..utils.models import Comment, Ticket, TicketUpdateMessage, User, WorkCycle
 from ..utils.ticket_markdown import build_ticket_export_payload
 from .tickets import extract_and_save_images
 
@@ -129,8 +129,6 @@ def agent_patch_ticket(user: User, agent_token, ticket_id: str):
             )
 
     if "work_cycle_id" in data:
-        from ..utils.models import WorkCycle
-
         raw = data["work_cycle_id"]
         if raw is None or raw == "":
             ticket.work_cycle_id = None
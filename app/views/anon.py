@@ -9,7 +9,8 @@ from typing import Literal
 from flask import flash, send_from_directory
 from ..utils.models import User, PasswordResetToken, data_path
 from ..utils.events import EventTypes, bus
-import pyargon2
+from ..utils.passwords import hash_password
+from .tickets import _find_possible_duplicate_tickets, _has_blocking_duplicate
 import os
 
 anon_bp = Blueprint("anon", __name__)
@@ -91,8 +92,6 @@ def api_anon_submit():
     title = str(data.get("title", "Anonymous Ticket")).strip() or "Anonymous Ticket"
     description = str(data.get("description", "")).strip()
 
-    from .tickets import _find_possible_duplicate_tickets, _has_blocking_duplicate
-
     possible_duplicates = _find_possible_duplicate_tickets(title, description)
     has_duplicate_match = _has_blocking_duplicate(possible_duplicates)
 
@@ -227,7 +226,8 @@ def reset_password(token: str):
 
         user = User.get_or_none(User.username == reset_token.user)
         if user:
-            user.password_hash = pyargon2.hash(password, str(user.salt))
+            user.password_hash = hash_password(password)
+            user.salt = ""
             user.save()
             reset_token.delete_instance()
             flash("Password reset successful. Please log in.", "success")
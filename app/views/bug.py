@@ -1,5 +1,8 @@
 import os
 
+from ..utils import fast_json
+from ..utils.background_queue import BatchQueue
+from ..utils.local_cache import LocalCache
 from ..utils.security import protected
 from ..utils.events import EventTypes, bus
 from ..utils.models import (
@@ -14,16 +17,26 @@ from ..utils.models import (
     Transaction,
     DSNToken,
     active_projects_ordered,
+    database,
+    get_project_part,
 )
-from flask import Blueprint, render_template, request
-from peewee import Case, DoesNotExist, fn
+from flask import Blueprint, jsonify, render_template, request
+from peewee import EXCLUDED, Case, DoesNotExist, chunked, fn
 import gzip
+import io
+import zlib
 import json
 import hashlib
 import hmac
 import time
 import re
 import base64
+import codecs
+import functools
+import traceback
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
 from logging import getLogger
 from urllib.parse import urlparse
 
@@ -38,6 +51,30 @@ ERROR_SPIKE_MIN_OCCURRENCES = 5
 ERROR_SPIKE_EMAIL_COOLDOWN_SEC = 3600
 ERROR_NEW_WINDOW_SEC = 24 * 60 * 60
 ERROR_DASHBOARD_GROUP_LIMIT = 150
+ATTACHMENT_MAX_CHARS = 100000
+TRANSACTION_SPANS_MAX_CHARS = 10000
+_MISSING = object()
+
+# Columns the error list templates read; the JSON blobs (stacktrace, contexts, tags,
+# extra) are only needed on the detail page.
+_ERROR_LIST_FIELDS = (
+    ErrorGroup.id,
+    ErrorGroup.part,
+    ErrorGroup.exception_type,
+    ErrorGroup.exception_value,
+    ErrorGroup.culprit,
+    ErrorGroup.platform,
+    ErrorGroup.environment,
+    ErrorGroup.release,
+    ErrorGroup.event_count,
+    ErrorGroup.first_seen,
+    ErrorGroup.last_seen,
+    ErrorGroup.status,
+)
+
+# (error_id, day ordinal, event_count) -> 14-day chart; event_count moves on every new
+# occurrence, so a hit is always current and the TTL only bounds memory.
+_occurrence_charts = LocalCache(maxsize=4096, ttl=300)
 
 
 def _error_status_rank():
@@ -114,9 +151,6 @@ def _relative_time_label(timestamp: int, now: int) -> str:
 
 def _daily_occurrence_counts(start_date, end_date) -> dict[str, int]:
     """Map YYYY-MM-DD -> occurrence count between start_date and end_date inclusive."""
-    from collections import defaultdict
-    from datetime import datetime
-
     cutoff = int(datetime.combine(start_date, datetime.min.time()).timestamp())
     end_ts = int(datetime.combine(end_date, datetime.max.time()).timestamp())
     day_expr = fn.strftime("%Y-%m-%d", ErrorOccurrence.timestamp, "unixepoch")
@@ -134,6 +168,33 @@ def _daily_occurrence_counts(start_date, end_date) -> dict[str, int]:
     return counts
 
 
+@functools.lru_cache(maxsize=2)
+def _chart_days(today: date) -> tuple[tuple[str, str], ...]:
+    """(YYYY-MM-DD key, day-of-month label) for the 14 days ending at ``today``."""
+    days = [today - timedelta(days=i) for i in range(13, -1, -1)]
+    return tuple((day.isoformat(), day.strftime("%d")) for day in days)
+
+
+def _occurrence_chart(error: ErrorGroup, today: date) -> list[tuple[str, int]]:
+    """Daily occurrence counts for the last 14 days as (day label, count) pairs."""
+    cache_key = (error.id, today.toordinal(), error.event_count)
+    chart = _occurrence_charts.get(cache_key)
+    if chart is not None:
+        return chart
+
+    cutoff = int(datetime.combine(today - timedelta(days=13), datetime.min.time()).timestamp())
+    day_expr = fn.strftime("%Y-%m-%d", ErrorOccurrence.timestamp, "unixepoch", "localtime")
+    day_counts = dict(
+        ErrorOccurrence.select(day_expr, fn.COUNT(ErrorOccurrence.id))
+        .where((ErrorOccurrence.error_group == error.id) & (ErrorOccurrence.timestamp >= cutoff))
+        .group_by(day_expr)
+        .tuples()
+    )
+    chart = [(label, day_counts.get(key, 0)) for key, label in _chart_days(today)]
+    _occurrence_charts.set(cache_key, chart)
+    return chart
+
+
 def _heat_level(count: int, max_count: int) -> int:
     if count <= 0 or max_count <= 0:
         return 0
@@ -149,8 +210,6 @@ def _heat_level(count: int, max_count: int) -> int:
 
 def _incident_heatmap(weeks: int = 16) -> dict:
     """GitHub-style week columns × weekday rows for daily incident volume."""
-    from datetime import datetime, timedelta
-
     today = datetime.now().date()
     # Align to Monday so columns are full weeks
     start = today - timedelta(days=weeks * 7 - 1)
@@ -247,6 +306,19 @@ def _error_event_kwargs(part: ProjectPart, error_group: ErrorGroup, details: str
     return kwargs
 
 
+def _emit_or_defer(pending_events: list | None, event_type, **kwargs) -> None:
+    """Emit now, or queue the event for the caller to emit once its transaction commits."""
+    if pending_events is None:
+        bus.emit(event_type, **kwargs)
+    else:
+        pending_events.append((event_type, kwargs))
+
+
+def _emit_pending_events(pending_events: list) -> None:
+    for event_type, kwargs in pending_events:
+        bus.emit(event_type, **kwargs)
+
+
 def _emit_error_notifications_after_occurrence(
     part: ProjectPart,
     error_group: ErrorGroup,
@@ -256,15 +328,22 @@ def _emit_error_notifications_after_occurrence(
     was_ignored: bool,
     old_count: int,
     timestamp: int,
+    pending_events: list | None = None,
 ) -> None:
     core = _format_error_core_details(error_group)
     if is_new:
-        bus.emit(EventTypes.ERROR_NEW, **_error_event_kwargs(part, error_group, core))
+        _emit_or_defer(
+            pending_events, EventTypes.ERROR_NEW, **_error_event_kwargs(part, error_group, core)
+        )
         return
 
     if was_resolved:
         reg_details = f"{core}\nPreviously resolved; reopened on new occurrence."
-        bus.emit(EventTypes.ERROR_REGRESSION, **_error_event_kwargs(part, error_group, reg_details))
+        _emit_or_defer(
+            pending_events,
+            EventTypes.ERROR_REGRESSION,
+            **_error_event_kwargs(part, error_group, reg_details),
+        )
 
     if was_ignored or error_group.status == "ignored":
         return
@@ -298,51 +377,78 @@ def _emit_error_notifications_after_occurrence(
 
     if escalation_reasons:
         details = f"{core}\n" + "\n".join(escalation_reasons)
-        bus.emit(EventTypes.ERROR_ESCALATING, **_error_event_kwargs(part, error_group, details))
+        _emit_or_defer(
+            pending_events,
+            EventTypes.ERROR_ESCALATING,
+            **_error_event_kwargs(part, error_group, details),
+        )
         if spike_notifies:
             error_group.last_escalation_spike_email_at = timestamp
             error_group.save(only=[ErrorGroup.last_escalation_spike_email_at])
 
 
+# Applied in order by normalize_message; compiled once since every ingested event runs them.
+_MESSAGE_NORMALIZERS = (
+    # Remove UUIDs (various formats)
+    (
+        re.compile(
+            r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+        ),
+        "<UUID>",
+    ),
+    # Remove hex addresses/pointers (0x...)
+    (re.compile(r"0x[0-9a-f]+", re.IGNORECASE), "<HEX>"),
+    # Remove pure numbers (but preserve words with numbers like "utf8")
+    (re.compile(r"\b\d+\b"), "<N>"),
+    # Remove quoted strings (file paths, variable values, etc.)
+    (re.compile(r'"[^"]*"'), '"<STR>"'),
+    (re.compile(r"'[^']*'"), "'<STR>'"),
+    # Remove IP addresses
+    (re.compile(r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b"), "<IP>"),
+    # Remove timestamps (ISO format)
+    (re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}"), "<TIMESTAMP>"),
+)
+
+
+# Recurring errors repeat the same message, so the regex passes are memoized; long
+# messages (payload dumps) are normalized directly to keep the cache small.
+_NORMALIZE_CACHE_MAX_CHARS = 1024
+
+
 def normalize_message(message: str | None) -> str:
     """Normalize error message by removing dynamic content for better grouping."""
     if not message:
         return ""
+    if len(message) <= _NORMALIZE_CACHE_MAX_CHARS:
+        return _normalize_message_cached(message)
+    return _apply_message_normalizers(message)
 
-    # Remove UUIDs (various formats)
-    message = re.sub(
-        r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
-        "<UUID>",
-        message,
-        flags=re.IGNORECASE,
-    )
-
-    # Remove hex addresses/pointers (0x...)
-    message = re.sub(r"0x[0-9a-f]+", "<HEX>", message, flags=re.IGNORECASE)
 
-    # Remove pure numbers (but preserve words with numbers like "utf8")
-    message = re.sub(r"\b\d+\b", "<N>", message)
+@functools.lru_cache(maxsize=4096)
+def _normalize_message_cached(message: str) -> str:
+    return _apply_message_normalizers(message)
 
-    # Remove quoted strings (file paths, variable values, etc.)
-    message = re.sub(r'"[^"]*"', '"<STR>"', message)
-    message = re.sub(r"'[^']*'", "'<STR>'", message)
 
-    # Remove IP addresses
-    message = re.sub(r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b", "<IP>", message)
-
-    # Remove timestamps (ISO format)
-    message = re.sub(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}", "<TIMESTAMP>", message)
+def _apply_message_normalizers(message: str) -> str:
+    for pattern, replacement in _MESSAGE_NORMALIZERS:
+        message = pattern.sub(replacement, message)
 
     return message
 
 
-def extract_frame_signatures(stacktrace_json: str | None) -> list[str]:
-    """Extract function call signatures from stacktrace frames for fingerprinting."""
+def extract_frame_signatures(stacktrace_json: str | dict | None) -> list[str]:
+    """Extract function call signatures from stacktrace frames for fingerprinting.
+
+    Accepts the stored JSON string or an already-parsed stacktrace dict.
+    """
     if not stacktrace_json:
         return []
 
     try:
-        stacktrace = json.loads(stacktrace_json)
+        if isinstance(stacktrace_json, dict):
+            stacktrace = stacktrace_json
+        else:
+            stacktrace = fast_json.loads(stacktrace_json)
         frames = stacktrace.get("frames", [])
 
         signatures = []
@@ -354,12 +460,12 @@ def extract_frame_signatures(stacktrace_json: str | None) -> list[str]:
             signatures.append(f"{module}:{function}")
 
         return signatures
-    except (json.JSONDecodeError, TypeError):
+    except (json.JSONDecodeError, TypeError, AttributeError):
         return []
 
 
 def generate_fingerprint(
-    exception_type: str | None, exception_value: str | None, stacktrace: str | None
+    exception_type: str | None, exception_value: str | None, stacktrace: str | dict | None
 ) -> str:
     """Generate a fingerprint for grouping similar errors together.
 
@@ -368,18 +474,45 @@ def generate_fingerprint(
     - Normalized error message (dynamic values removed)
     - Function call chain (module:function, no line numbers)
     """
+    # Extract frame signatures (module:function pairs)
+    frame_signatures = tuple(extract_frame_signatures(stacktrace))
+
+    # Crash loops resend the same exception over and over; reuse their fingerprint.
+    if exception_value is None or len(exception_value) <= _NORMALIZE_CACHE_MAX_CHARS:
+        return _fingerprint_cached(exception_type, exception_value, frame_signatures)
+    return _fingerprint(exception_type, exception_value, frame_signatures)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fingerprint_cached(
+    exception_type: str | None, exception_value: str | None, frame_signatures: tuple[str, ...]
+) -> str:
+    return _fingerprint(exception_type, exception_value, frame_signatures)
+
+
+def _fingerprint(
+    exception_type: str | None, exception_value: str | None, frame_signatures: tuple[str, ...]
+) -> str:
     # Normalize the error message to remove dynamic content
     normalized_value = normalize_message(exception_value)
-
-    # Extract frame signatures (module:function pairs)
-    frame_signatures = extract_frame_signatures(stacktrace)
     frames_str = "|".join(frame_signatures)
 
     # Build fingerprint from stable components
-    fingerprint_data = f"{exception_type or ''}:{normalized_value}:{frames_str}"
+    fingerprint_data = ":".join((exception_type or "", normalized_value, frames_str))
     return hashlib.sha256(fingerprint_data.encode("utf-8")).hexdigest()[:32]
 
 
+def _first_exception(payload: dict) -> dict | None:
+    """``payload["exception"]["values"][0]`` when present and well-formed, else None."""
+    exception = payload.get("exception")
+    if not isinstance(exception, dict):
+        return None
+    values = exception.get("values")
+    if not values or not isinstance(values[0], dict):
+        return None
+    return values[0]
+
+
 def extract_exception_info(payload: dict) -> tuple[str | None, str | None, str | None]:
     """Extract exception type, value, and stacktrace from a Sentry event payload."""
     exception_type = None
@@ -387,82 +520,89 @@ def extract_exception_info(payload: dict) -> tuple[str | None, str | None, str |
     stacktrace_json = None
 
     # Try to get from exception.values (standard Sentry format)
-    if "exception" in payload and "values" in payload["exception"]:
-        values = payload["exception"]["values"]
-        if values:
-            first_exception = values[0]
-            exception_type = first_exception.get("type")
-            exception_value = first_exception.get("value")
-            if "stacktrace" in first_exception:
-                stacktrace_json = json.dumps(first_exception["stacktrace"])
+    first_exception = _first_exception(payload)
+    if first_exception is not None:
+        exception_type = first_exception.get("type")
+        exception_value = first_exception.get("value")
+        stacktrace = first_exception.get("stacktrace")
+        if stacktrace is not None:
+            stacktrace_json = fast_json.dumps(stacktrace)
 
     # Fallback to message field
     if not exception_value:
-        exception_value = payload.get("message", payload.get("logentry", {}).get("message"))
+        if "message" in payload:
+            exception_value = payload["message"]
+        else:
+            exception_value = (payload.get("logentry") or {}).get("message")
 
     return exception_type, exception_value, stacktrace_json
 
 
+def _first_exception_stacktrace(payload: dict) -> dict | None:
+    """The first exception's stacktrace dict, as used by extract_exception_info."""
+    first_exception = _first_exception(payload)
+    stacktrace = first_exception.get("stacktrace") if first_exception is not None else None
+    return stacktrace if isinstance(stacktrace, dict) else None
+
+
 def extract_culprit(payload: dict) -> str | None:
     """Extract the culprit (file/function where error occurred)."""
     # First check if culprit is directly provided
-    if "culprit" in payload:
-        return payload["culprit"]
+    culprit = payload.get("culprit", _MISSING)
+    if culprit is not _MISSING:
+        return culprit
 
     # Try to extract from stacktrace
-    if "exception" in payload and "values" in payload["exception"]:
-        values = payload["exception"]["values"]
-        if values and "stacktrace" in values[0]:
-            frames = values[0]["stacktrace"].get("frames", [])
-            if frames:
-                last_frame = frames[-1]
-                filename = last_frame.get("filename", last_frame.get("abs_path", ""))
-                function = last_frame.get("function", "")
-                lineno = last_frame.get("lineno", "")
-                return f"{filename}:{function}:{lineno}"
+    stacktrace = _first_exception_stacktrace(payload)
+    frames = stacktrace.get("frames") if stacktrace is not None else None
+    if frames:
+        last_frame = frames[-1]
+        filename = last_frame.get("filename", last_frame.get("abs_path", ""))
+        function = last_frame.get("function", "")
+        lineno = last_frame.get("lineno", "")
+        return f"{filename}:{function}:{lineno}"
 
     return None
 
 
-def handle_event_item(part: ProjectPart, payload: dict, event_id: str | None = None) -> ErrorGroup:
-    """Handle an event item from a Sentry envelope."""
+def handle_event_item(
+    part: ProjectPart,
+    payload: dict,
+    event_id: str | None = None,
+    *,
+    now: int | None = None,
+    pending_events: list | None = None,
+) -> ErrorGroup:
+    """Handle an event item from a Sentry envelope; ``now`` is the envelope arrival time.
+
+    Notifications are emitted right away unless ``pending_events`` is given, in which
+    case they are appended to it for the caller to emit after committing.
+    """
     exception_type, exception_value, stacktrace_json = extract_exception_info(payload)
     culprit = extract_culprit(payload)
 
-    # Generate fingerprint for grouping
-    fingerprint = generate_fingerprint(exception_type, exception_value, stacktrace_json)
+    # Generate fingerprint for grouping from the parsed stacktrace, not its JSON re-encoding
+    fingerprint = generate_fingerprint(
+        exception_type, exception_value, _first_exception_stacktrace(payload)
+    )
 
     # Extract additional context
     platform = payload.get("platform")
     environment = payload.get("environment")
     release = payload.get("release")
-    contexts = json.dumps(payload.get("contexts", {})) if payload.get("contexts") else None
-    tags = json.dumps(payload.get("tags", {})) if payload.get("tags") else None
-    extra = json.dumps(payload.get("extra", {})) if payload.get("extra") else None
-
-    timestamp = int(time.time())
-
-    # Try to find existing error group or create new one
-    try:
-        error_group = ErrorGroup.get(
-            (ErrorGroup.part == part) & (ErrorGroup.fingerprint == fingerprint)
-        )
-        old_count = error_group.event_count
-        was_resolved = error_group.status == "resolved"
-        was_ignored = error_group.status == "ignored"
-        error_group.event_count += 1
-        error_group.last_seen = timestamp
-        # Regression detection: reopen issues that were previously resolved.
-        if error_group.status == "resolved":
-            error_group.status = "unresolved"
-        error_group.save()
-        is_new = False
-    except DoesNotExist:
-        old_count = 0
-        was_resolved = False
-        was_ignored = False
-        is_new = True
-        error_group = ErrorGroup.create(
+    contexts = payload.get("contexts")
+    contexts = fast_json.dumps(contexts) if contexts else None
+    tags = payload.get("tags")
+    tags = fast_json.dumps(tags) if tags else None
+    extra = payload.get("extra")
+    extra = fast_json.dumps(extra) if extra else None
+
+    timestamp = now if now is not None else int(time.time())
+
+    # Upsert on the unique (part, fingerprint) index: one statement whether the group exists
+    # or not, and concurrent ingests can no longer race each other into an IntegrityError.
+    error_group = list(
+        ErrorGroup.insert(
             part=part,
             fingerprint=fingerprint,
             exception_type=exception_type,
@@ -480,11 +620,30 @@ def handle_event_item(part: ProjectPart, payload: dict, event_id: str | None = N
             last_seen=timestamp,
             status="unresolved",
         )
+        .on_conflict(
+            conflict_target=[ErrorGroup.part, ErrorGroup.fingerprint],
+            update={
+                ErrorGroup.event_count: ErrorGroup.event_count + 1,
+                ErrorGroup.last_seen: timestamp,
+            },
+        )
+        .returning(ErrorGroup)
+        .execute()
+    )[0]
+
+    is_new = error_group.event_count == 1
+    old_count = error_group.event_count - 1
+    was_resolved = error_group.status == "resolved"
+    was_ignored = error_group.status == "ignored"
+    # Regression detection: reopen issues that were previously resolved.
+    if was_resolved:
+        error_group.status = "unresolved"
+        error_group.save(only=[ErrorGroup.status])
 
-    # Record this occurrence
-    ErrorOccurrence.create(
+    # Record this occurrence (plain INSERT; no model instance is needed afterwards)
+    ErrorOccurrence.insert(
         error_group=error_group, timestamp=timestamp, event_id=event_id or payload.get("event_id")
-    )
+    ).execute()
 
     _emit_error_notifications_after_occurrence(
         part,
@@ -494,65 +653,133 @@ def handle_event_item(part: ProjectPart, payload: dict, event_id: str | None = N
         was_ignored=was_ignored,
         old_count=old_count,
         timestamp=timestamp,
+        pending_events=pending_events,
     )
 
     return error_group
 
 
-def handle_session_item(part: ProjectPart, payload: dict):
+def handle_session_item(part: ProjectPart, payload: dict, *, now: int | None = None):
     """Handle a session item from a Sentry envelope."""
     session_id = payload.get("sid")
     if not session_id:
         return None
 
-    status = payload.get("status", "ok")
-    started = payload.get("started")
-    if isinstance(started, str):
-        # Parse ISO timestamp to unix timestamp
-        try:
-            from datetime import datetime
-
-            started = int(datetime.fromisoformat(started.replace("Z", "+00:00")).timestamp())
-        except ValueError:
-            started = int(time.time())
+    if now is None:
+        now = int(time.time())
 
+    status = payload.get("status", "ok")
+    started = _session_started(payload.get("started"), now)
     duration = payload.get("duration")
     errors = payload.get("errors", 0)
-    release = payload.get("attrs", {}).get("release")
-    environment = payload.get("attrs", {}).get("environment")
-
-    # Update or create session
-    try:
-        session = Session.get((Session.part == part) & (Session.session_id == session_id))
-        # Update existing session
-        session.status = status
-        if duration is not None:
-            session.duration = duration
-        session.errors = errors
-        session.save()
-    except DoesNotExist:
-        session = Session.create(
+    attrs = payload.get("attrs") or {}
+    release = attrs.get("release")
+    environment = attrs.get("environment")
+
+    # Upsert on the unique (part, session_id) index. Updates refresh status and error
+    # count and keep the stored duration when this update does not carry one.
+    session = list(
+        Session.insert(
             part=part,
             session_id=session_id,
             status=status,
-            started=started or int(time.time()),
+            started=started,
             duration=duration,
             errors=errors,
             release=release,
             environment=environment,
         )
+        .on_conflict(
+            conflict_target=[Session.part, Session.session_id],
+            update={
+                Session.status: EXCLUDED.status,
+                Session.duration: fn.COALESCE(EXCLUDED.duration, Session.duration),
+                Session.errors: EXCLUDED.errors,
+            },
+        )
+        .returning(Session)
+        .execute()
+    )[0]
 
     return session
 
 
-def handle_transaction_item(part: ProjectPart, payload: dict):
+def _session_started(started, now: int) -> int:
+    """Unix start time from a session payload (ISO string or number); ``now`` when missing."""
+    if isinstance(started, str):
+        try:
+            return int(datetime.fromisoformat(started.replace("Z", "+00:00")).timestamp())
+        except ValueError:
+            return now
+    return started or now
+
+
+def handle_sessions_item(part: ProjectPart, payload: dict, *, now: int | None = None) -> int:
+    """Handle a ``sessions`` aggregate item: one synthetic ok session per bucket.
+
+    All buckets are written with a single multi-row INSERT; returns the number of rows.
+    """
+    if now is None:
+        now = int(time.time())
+
+    attrs = payload.get("attrs") or {}
+    release = attrs.get("release")
+    environment = attrs.get("environment")
+    rows = [
+        {
+            "part": part,
+            # One row per bucket; a shared sid would collapse the whole item into one row.
+            "session_id": f"aggregate_{now}_{index}",
+            "status": "ok",
+            "started": _session_started(bucket.get("started"), now),
+            "duration": None,
+            "errors": 0,
+            "release": release,
+            "environment": environment,
+        }
+        for index, bucket in enumerate(payload.get("aggregates") or [])
+        if isinstance(bucket, dict)
+    ]
+    # Batches keep each statement under SQLite's bound-parameter limit.
+    for batch in chunked(rows, 100):
+        Session.insert_many(batch).on_conflict(
+            conflict_target=[Session.part, Session.session_id],
+            update={Session.status: EXCLUDED.status, Session.errors: EXCLUDED.errors},
+        ).execute()
+    return len(rows)
+
+
+def _spans_json(spans: list, max_chars: int) -> str:
+    """JSON array of the leading spans that fit in ``max_chars``.
+
+    Spans are serialized one by one and serialization stops at the budget, so a deep
+    trace is never encoded in full just to be cut; the result stays valid JSON.
+    """
+    if not isinstance(spans, list):
+        return fast_json.dumps(spans)[:max_chars]
+    chunks = []
+    used = 2  # the enclosing brackets
+    for span in spans:
+        chunk = fast_json.dumps(span)
+        used += len(chunk) + (1 if chunks else 0)
+        if used > max_chars:
+            break
+        chunks.append(chunk)
+    if not chunks and spans:
+        # A single oversized span: keep its (truncated) text rather than nothing.
+        return fast_json.dumps(spans[:1])[:max_chars]
+    return "[" + ",".join(chunks) + "]"
+
+
+def handle_transaction_item(part: ProjectPart, payload: dict, *, now: int | None = None):
     """Handle a transaction (performance) item from a Sentry envelope."""
     transaction_id = payload.get("event_id") or payload.get("transaction_id")
     if not transaction_id:
         return None
 
     name = payload.get("transaction", "Unknown")
-    op = payload.get("contexts", {}).get("trace", {}).get("op")
+    trace = (payload.get("contexts") or {}).get("trace") or {}
+    op = trace.get("op")
 
     # Calculate duration from start/end timestamps
     start_timestamp = payload.get("start_timestamp")
@@ -561,7 +788,9 @@ def handle_transaction_item(part: ProjectPart, payload: dict):
     if start_timestamp and end_timestamp:
         duration = int((end_timestamp - start_timestamp) * 1000)  # Convert to ms
 
-    status = payload.get("contexts", {}).get("trace", {}).get("status")
+    status = trace.get("status")
+    # Empty span lists are stored as NULL rather than "[]"
+    spans = payload.get("spans")
 
     transaction = Transaction.create(
         part=part,
@@ -570,8 +799,8 @@ def handle_transaction_item(part: ProjectPart, payload: dict):
         op=op,
         duration=duration,
         status=status,
-        timestamp=int(time.time()),
-        data=json.dumps(payload.get("spans", []))[:10000] if payload.get("spans") else None,
+        timestamp=now if now is not None else int(time.time()),
+        data=_spans_json(spans, TRANSACTION_SPANS_MAX_CHARS) if spans else None,
     )
 
     return transaction
@@ -584,11 +813,21 @@ def handle_attachment_item(
     filename = item_headers.get("filename", "unknown")
     content_type = item_headers.get("content_type") or item_headers.get("type")
 
+    # Only the stored prefix is decoded: 4 bytes per char is the UTF-8 worst case, so
+    # the decode never touches bytes that get cut. Binary payloads are kept as raw bytes
+    # in a BLOB column instead of a base64 copy that is a third larger.
+    data = ""
+    data_raw = None
     if isinstance(payload, bytes):
+        limit = ATTACHMENT_MAX_CHARS * 4
+        head = payload[:limit]
         try:
-            data = payload.decode("utf-8")
+            # Only a real cut may end mid-character; a payload that fits must decode fully.
+            data = codecs.getincrementaldecoder("utf-8")().decode(
+                head, final=len(payload) <= limit
+            )
         except UnicodeDecodeError:
-            data = base64.b64encode(payload).decode("ascii")
+            data_raw = payload[:ATTACHMENT_MAX_CHARS]
     else:
         data = payload
 
@@ -596,7 +835,8 @@ def handle_attachment_item(
         error_group=error_group,
         filename=filename,
         content_type=content_type,
-        data=data[:100000],  # Limit size
+        data=data[:ATTACHMENT_MAX_CHARS],  # Limit size
+        data_raw=data_raw,
     )
 
     return attachment
@@ -610,7 +850,7 @@ def parts_view(user: User):
     status_rank = _error_status_rank()
 
     error_groups = list(
-        ErrorGroup.select(ErrorGroup, ProjectPart)
+        ErrorGroup.select(*_ERROR_LIST_FIELDS, ProjectPart)
         .join(ProjectPart)
         .order_by(status_rank, ErrorGroup.event_count.desc(), ErrorGroup.last_seen.desc())
         .limit(ERROR_DASHBOARD_GROUP_LIMIT)
@@ -682,16 +922,16 @@ def api_create_part(user: User):
     description = (data.get("description") or "").strip()
 
     if not name:
-        return json.dumps({"error": "Name is required"}), 400
+        return jsonify({"error": "Name is required"}), 400
 
     existing = ProjectPart.select().where(ProjectPart.name == name).first()
     if existing:
-        return json.dumps({"error": "A part with this name already exists"}), 400
+        return jsonify({"error": "A part with this name already exists"}), 400
 
     part = ProjectPart.create(name=name, description=description or "")
 
     return (
-        json.dumps(
+        jsonify(
             {
                 "success": True,
                 "part": {
@@ -708,14 +948,13 @@ def api_create_part(user: User):
 @bug_bp.route("/errors/<int:part_id>")
 @protected
 def part_view(user: User, part_id: int):
-    try:
-        part = ProjectPart.get(ProjectPart.id == part_id)
-    except DoesNotExist:
+    part = get_project_part(part_id)
+    if part is None:
         return "Part not found", 404
 
     status_rank = _error_status_rank()
     error_groups = list(
-        ErrorGroup.select()
+        ErrorGroup.select(*_ERROR_LIST_FIELDS)
         .where(ErrorGroup.part == part_id)
         .order_by(status_rank, ErrorGroup.event_count.desc(), ErrorGroup.last_seen.desc())
         .limit(100)
@@ -734,75 +973,51 @@ def part_view(user: User, part_id: int):
     )
 
 
+def _load_json_column(value: str | None) -> dict:
+    """Decode a stored JSON object column; empty (NULL, '', '{}') and bad values give ``{}``."""
+    if not value or value == "{}":
+        return {}
+    try:
+        data = fast_json.loads(value)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
 @bug_bp.route("/errors/<int:part_id>/<int:error_id>")
 @protected
 def error_detail_view(user: User, part_id: int, error_id: int):
     """Display detailed view of an error group."""
 
-    try:
-        error = ErrorGroup.get((ErrorGroup.id == error_id) & (ErrorGroup.part == part_id))
-    except DoesNotExist:
+    # Error group and its part in one SELECT; ``error.part`` is then populated.
+    error = (
+        ErrorGroup.select(ErrorGroup, ProjectPart)
+        .join(ProjectPart)
+        .where((ErrorGroup.id == error_id) & (ErrorGroup.part == part_id))
+        .first()
+    )
+    if error is None:
         return "Error not found", 404
+    part = error.part
 
-    try:
-        part = ProjectPart.get(ProjectPart.id == part_id)
-    except DoesNotExist:
-        return "Part not found", 404
-
-    # Parse stacktrace JSON
-    stacktrace_frames = []
-    if error.stacktrace:
-        try:
-            stacktrace_data = json.loads(error.stacktrace)
-            # Sentry stacktrace format has 'frames' array
-            frames = stacktrace_data.get("frames", [])
-            # Reverse to show most recent call first (like Python tracebacks)
-            stacktrace_frames = list(reversed(frames))
-        except json.JSONDecodeError:
-            pass
-
-    # Parse contexts JSON
-    contexts = {}
-    if error.contexts:
-        try:
-            contexts = json.loads(error.contexts)
-        except json.JSONDecodeError:
-            pass
+    # Parse stacktrace JSON; Sentry stacktrace format has a 'frames' array.
+    # Reverse to show most recent call first (like Python tracebacks).
+    stacktrace_data = _load_json_column(error.stacktrace)
+    stacktrace_frames = list(reversed(stacktrace_data.get("frames") or []))
 
-    # Parse tags JSON
-    tags = {}
-    if error.tags:
-        try:
-            tags = json.loads(error.tags)
-        except json.JSONDecodeError:
-            pass
+    contexts = _load_json_column(error.contexts)
+    tags = _load_json_column(error.tags)
 
-    # Get occurrences
+    # Get occurrences (the list only shows timestamp and event_id)
     occurrences = list(
-        ErrorOccurrence.select()
+        ErrorOccurrence.select(ErrorOccurrence.timestamp, ErrorOccurrence.event_id)
         .where(ErrorOccurrence.error_group == error_id)
         .order_by(ErrorOccurrence.timestamp.desc())
         .limit(100)
     )
 
     # Build occurrence chart (last 14 days)
-    from datetime import datetime, timedelta
-    from collections import defaultdict
-
-    today = datetime.now().date()
-    day_counts = defaultdict(int)
-
-    for occ in occurrences:
-        occ_date = datetime.fromtimestamp(occ.timestamp).date()
-        day_counts[occ_date] += 1
-
-    # Create chart data for last 14 days
-    occurrence_chart = []
-    for i in range(13, -1, -1):
-        day = today - timedelta(days=i)
-        day_label = day.strftime("%d")
-        count = day_counts.get(day, 0)
-        occurrence_chart.append((day_label, count))
+    occurrence_chart = _occurrence_chart(error, datetime.now().date())
 
     max_occurrences = max((count for _, count in occurrence_chart), default=1)
 
@@ -830,21 +1045,18 @@ def error_detail_view(user: User, part_id: int, error_id: int):
 @protected
 def update_error_status(user: User, error_id: int):
     """API endpoint to update error status."""
-    try:
-        error = ErrorGroup.get(ErrorGroup.id == error_id)
-    except DoesNotExist:
-        return json.dumps({"error": "Error not found"}), 404
-
     data = request.get_json()
     new_status = data.get("status")
 
     if new_status not in ["unresolved", "resolved", "ignored"]:
-        return json.dumps({"error": "Invalid status"}), 400
+        return jsonify({"error": "Invalid status"}), 400
 
-    error.status = new_status
-    error.save()
+    # Single targeted UPDATE; the affected row count doubles as the existence check.
+    updated = ErrorGroup.update(status=new_status).where(ErrorGroup.id == error_id).execute()
+    if not updated:
+        return jsonify({"error": "Error not found"}), 404
 
-    return json.dumps({"success": True, "status": new_status}), 200
+    return jsonify({"success": True, "status": new_status}), 200
 
 
 def _ingest_content_type_allowed() -> bool:
@@ -859,33 +1071,31 @@ def _ingest_content_type_allowed() -> bool:
     }
 
 
-def _decompressed_ingest_body() -> bytes:
-    raw = request.get_data(cache=False)
-    try:
-        return gzip.decompress(raw)
-    except Exception:
-        return raw
+_GZIP_MAGIC = b"\x1f\x8b"
+# Raised mid-read by a corrupt or truncated gzip body.
+_STREAM_ERRORS = (OSError, EOFError, zlib.error)
 
 
-def _split_envelope_header(raw: bytes) -> tuple[dict, int]:
-    """Parse the envelope header line; return (headers dict, index after first newline)."""
-    if not raw:
-        return {}, 0
-    nl = raw.find(b"\n")
-    if nl < 0:
-        line_b = raw
-        after = len(raw)
-    else:
-        line_b = raw[:nl]
-        after = nl + 1
+def _open_ingest_body(body: io.BufferedReader) -> io.BufferedIOBase:
+    """Readable stream over the envelope; gzip bodies are decompressed as they are read."""
+    # Every gzip stream starts with the magic bytes, whatever Content-Encoding claims;
+    # plain envelopes (they start with "{") are read straight from the body.
+    if body.peek(len(_GZIP_MAGIC)).startswith(_GZIP_MAGIC):
+        return gzip.GzipFile(fileobj=body, mode="rb")
+    return body
+
+
+def _read_envelope_header(src: io.BufferedIOBase) -> dict:
+    """Parse the envelope header line (the first line of the stream)."""
     try:
-        line = line_b.decode("utf-8")
-        headers = json.loads(line)
-        if not isinstance(headers, dict):
-            return {}, after
-        return headers, after
+        line_b = src.readline()
+    except _STREAM_ERRORS:
+        return {}
+    try:
+        headers = fast_json.loads(line_b)
     except (UnicodeDecodeError, json.JSONDecodeError):
-        return {}, after
+        return {}
+    return headers if isinstance(headers, dict) else {}
 
 
 def sentry_public_key_from_dsn(dsn: str | None) -> str | None:
@@ -929,65 +1139,88 @@ def _query_sentry_public_key() -> str | None:
     return key if key else None
 
 
-def iter_sentry_envelope_items(raw: bytes, start: int):
-    """Yield (item_headers dict, payload bytes) per Sentry envelope semantics."""
-    pos = start
-    n = len(raw)
-    while pos < n:
-        while pos < n and raw[pos] == 10:  # \n
-            pos += 1
-        if pos >= n:
-            break
-        nl = raw.find(b"\n", pos)
-        if nl < 0:
-            break
-        try:
-            item_headers = json.loads(raw[pos:nl].decode("utf-8"))
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            break
-        if not isinstance(item_headers, dict):
-            break
-        pos = nl + 1
-        if pos > n:
+def _read_item_header(src: io.BufferedIOBase) -> dict | None:
+    """Next item header, skipping blank separator lines; None at the end of the envelope."""
+    while True:
+        line = src.readline()
+        if line != b"\n":
             break
+    # A header without its newline can only be the tail of a truncated envelope
+    if not line.endswith(b"\n"):
+        return None
+    try:
+        item_headers = fast_json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return item_headers if isinstance(item_headers, dict) else None
 
-        length = item_headers.get("length")
-        if length is not None:
-            try:
-                blen = int(length)
-            except (TypeError, ValueError):
-                break
-            if blen < 0 or pos + blen > n:
-                break
-            payload = raw[pos : pos + blen]
-            pos += blen
-            if pos < n:
-                if raw[pos] == 10:
-                    pos += 1
-                else:
-                    break
-        else:
-            next_nl = raw.find(b"\n", pos)
-            if next_nl < 0:
-                payload = raw[pos:]
-                pos = n
-            else:
-                payload = raw[pos:next_nl]
-                pos = next_nl + 1
 
-        yield item_headers, payload
+def _read_item_payload(src: io.BufferedIOBase, item_headers: dict) -> bytes | None:
+    """Payload of one item: ``length`` bytes if given, else up to the next newline."""
+    length = item_headers.get("length")
+    if length is None:
+        payload = src.readline()
+        return payload[:-1] if payload.endswith(b"\n") else payload
+
+    try:
+        blen = int(length)
+    except (TypeError, ValueError):
+        return None
+    if blen < 0:
+        return None
+    payload = src.read(blen)
+    if len(payload) < blen or src.read(1) not in (b"", b"\n"):
+        return None
+    return payload
+
 
+def iter_sentry_envelope_items(src: io.BufferedIOBase):
+    """Yield (item_headers dict, payload bytes) per Sentry envelope semantics.
 
-def _decode_item_payload(payload: bytes) -> tuple[object, bytes]:
-    """Return (json object or raw bytes) for dispatch; dict/list primitives for JSON."""
+    Items are read from the stream one at a time, so a gzip envelope is never
+    decompressed into one buffer; a truncated or corrupt stream ends the iteration.
+    """
     try:
-        text = payload.decode("utf-8")
-    except UnicodeDecodeError:
+        while True:
+            item_headers = _read_item_header(src)
+            if item_headers is None:
+                return
+            payload = _read_item_payload(src, item_headers)
+            if payload is None:
+                return
+            yield item_headers, payload
+    except _STREAM_ERRORS:
+        return
+
+
+# Item types whose handlers only read the raw bytes (attachments) or ignore the payload
+# (client reports); parsing them as JSON is wasted work, and for binary attachments a
+# failed orjson parse plus a failed stdlib retry.
+_RAW_PAYLOAD_ITEM_TYPES = frozenset({"attachment", "client_report"})
+# Handlers only dispatch on JSON objects. Anything that does not open like one is
+# not worth a parse attempt: a failed orjson parse is retried by the stdlib, so plain
+# text or binary payloads would otherwise be scanned twice just to fail.
+_JSON_CONTAINER_START = re.compile(rb"(?:\xef\xbb\xbf)?\s*[\[{]")
+
+
+def _decode_item_payload(payload: bytes, item_type: str | None = None) -> tuple[object, bytes]:
+    """Return (json object or raw bytes, raw bytes) for dispatch; dict/list primitives for JSON.
+
+    JSON is parsed straight from the bytes slice; only non-JSON items are decoded to text.
+    Only raw-payload handlers read the bytes, so decoded items carry ``b""`` instead and
+    a large event is not held twice (bytes + dict) until the envelope is written.
+    """
+    if item_type in _RAW_PAYLOAD_ITEM_TYPES:
         return payload, payload
+    if _JSON_CONTAINER_START.match(payload):
+        try:
+            return fast_json.loads(payload), b""
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            pass
     try:
-        return json.loads(text), payload
-    except json.JSONDecodeError:
-        return text, payload
+        return payload.decode("utf-8"), b""
+    except UnicodeDecodeError:
+        return payload, payload
 
 
 def verify_dsn_token(*, envelope_public_key: str | None = None) -> bool:
@@ -1044,6 +1277,126 @@ def verify_dsn_token(*, envelope_public_key: str | None = None) -> bool:
         return False
 
 
+def _process_envelope_item(
+    project_part: ProjectPart,
+    item_type: str,
+    item_headers: dict,
+    payload: object,
+    raw_payload: bytes,
+    *,
+    event_id: str | None,
+    current_error_group: ErrorGroup | None,
+    now: int,
+    pending_events: list,
+) -> tuple[str, ErrorGroup | None]:
+    """Dispatch one envelope item; return (processed label, error group for attachments)."""
+    if item_type == "event" and isinstance(payload, dict):
+        error_group = handle_event_item(
+            project_part, payload, event_id, now=now, pending_events=pending_events
+        )
+        return "event", error_group
+
+    if item_type == "session" and isinstance(payload, dict):
+        handle_session_item(project_part, payload, now=now)
+        return "session", current_error_group
+
+    if item_type == "sessions" and isinstance(payload, dict):
+        handle_sessions_item(project_part, payload, now=now)
+        return "sessions", current_error_group
+
+    if item_type == "transaction" and isinstance(payload, dict):
+        handle_transaction_item(project_part, payload, now=now)
+        return "transaction", current_error_group
+
+    if item_type == "attachment":
+        if current_error_group:
+            handle_attachment_item(project_part, current_error_group, item_headers, raw_payload)
+        return "attachment", current_error_group
+
+    if item_type == "client_report":
+        return "client_report", current_error_group
+
+    print(f"Unknown envelope item type: {item_type}")
+    return f"unknown:{item_type}", current_error_group
+
+
+def _ingest_envelope_items(
+    project_part: ProjectPart,
+    items: Iterable,
+    *,
+    event_id: str | None,
+    now: int,
+    pending_events: list,
+) -> list[str]:
+    """Write decoded envelope items; return the labels of the items that were processed.
+
+    ``items`` may be a generator, so the request path can decode each item only when
+    it is written instead of holding the whole envelope in memory.
+
+    Bus events of the items that were kept are appended to ``pending_events``; the caller
+    emits them once the surrounding transaction has committed.
+    """
+    current_error_group = None
+    processed_items = []
+
+    # One transaction per envelope; each item runs in its own savepoint so a bad
+    # item is rolled back and skipped without losing the rest.
+    with database.atomic():
+        for item_headers, payload, raw_payload in items:
+            item_type = item_headers.get("type", "unknown")
+            item_events: list = []
+            try:
+                with database.atomic():
+                    label, error_group = _process_envelope_item(
+                        project_part,
+                        item_type,
+                        item_headers,
+                        payload,
+                        raw_payload,
+                        event_id=event_id,
+                        current_error_group=current_error_group,
+                        now=now,
+                        pending_events=item_events,
+                    )
+            except Exception as e:
+                print(f"Error processing {item_type} item: {e}")
+                traceback.print_exc()
+                continue
+
+            current_error_group = error_group
+            processed_items.append(label)
+            pending_events.extend(item_events)
+
+    return processed_items
+
+
+def _async_ingest_enabled() -> bool:
+    """BROKE_ASYNC_INGEST=1 acknowledges envelopes before they are written."""
+    return str(os.environ.get("BROKE_ASYNC_INGEST", "")).strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+def _drain_envelope_queue(batch: list) -> None:
+    """Background writer: all envelopes of a drain cycle share one connection and commit."""
+    pending_events: list = []
+    with database.connection_context(), database.atomic():
+        for part_id, event_id, now, items in batch:
+            project_part = get_project_part(part_id)
+            if project_part is None:
+                continue
+            _ingest_envelope_items(
+                project_part, items, event_id=event_id, now=now, pending_events=pending_events
+            )
+    _emit_pending_events(pending_events)
+
+
+_envelope_queue = BatchQueue(_drain_envelope_queue, name="broke-envelope-ingest")
+
+
 # Ingest endpoint for Sentry-like error messages
 @bug_bp.route("/ingest/api/<int:part>/envelope/", methods=["POST"])  # type: ignore
 @bug_bp.route("/ingest/<int:part>/envelope", methods=["POST"])  # type: ignore
@@ -1062,75 +1415,43 @@ def ingest_envelope_view(part: int):  # noqa: C901
     if not _ingest_content_type_allowed():
         return "Unsupported Content-Type", 415
 
-    raw = _decompressed_ingest_body()
-    if not raw:
+    # Items are parsed straight off the request stream; only the async path keeps them all.
+    body = io.BufferedReader(request.stream)
+    if not body.peek(1):
         return "Empty envelope", 400
 
-    envelope_headers, items_start = _split_envelope_header(raw)
+    src = _open_ingest_body(body)
+    envelope_headers = _read_envelope_header(src)
     env_key = sentry_public_key_from_dsn(envelope_headers.get("dsn"))
 
     if not verify_dsn_token(envelope_public_key=env_key):
         logger.info("Unauthorized DSN token attempt")
         return "Unauthorized: Invalid or missing DSN token", 401
 
-    try:
-        project_part = ProjectPart.get(ProjectPart.id == part)
-    except DoesNotExist:
+    project_part = get_project_part(part)
+    if project_part is None:
         return "Invalid DSN", 404
 
     event_id = envelope_headers.get("event_id")
-    current_error_group = None
-    processed_items = []
-
-    for item_headers, payload_bytes in iter_sentry_envelope_items(raw, items_start):
-        item_type = item_headers.get("type", "unknown")
-        payload, raw_payload = _decode_item_payload(payload_bytes)
-
-        try:
-            if item_type == "event" and isinstance(payload, dict):
-                current_error_group = handle_event_item(project_part, payload, event_id)
-                processed_items.append("event")
-
-            elif item_type == "session" and isinstance(payload, dict):
-                handle_session_item(project_part, payload)
-                processed_items.append("session")
-
-            elif item_type == "sessions" and isinstance(payload, dict):
-                for session_data in payload.get("aggregates", []):
-                    synthetic_payload = {
-                        "sid": f"aggregate_{int(time.time())}",
-                        "status": "ok",
-                        "started": session_data.get("started"),
-                        "attrs": payload.get("attrs", {}),
-                    }
-                    handle_session_item(project_part, synthetic_payload)
-                processed_items.append("sessions")
-
-            elif item_type == "transaction" and isinstance(payload, dict):
-                handle_transaction_item(project_part, payload)
-                processed_items.append("transaction")
-
-            elif item_type == "attachment":
-                if current_error_group:
-                    handle_attachment_item(
-                        project_part, current_error_group, item_headers, raw_payload
-                    )
-                processed_items.append("attachment")
-
-            elif item_type == "client_report":
-                processed_items.append("client_report")
-
-            else:
-                print(f"Unknown envelope item type: {item_type}")
-                processed_items.append(f"unknown:{item_type}")
-
-        except Exception as e:
-            print(f"Error processing {item_type} item: {e}")
-            import traceback
-
-            traceback.print_exc()
-            continue
+    now = int(time.time())  # every item in the envelope shares the arrival time
+    items = (
+        (item_headers, *_decode_item_payload(payload_bytes, item_headers.get("type")))
+        for item_headers, payload_bytes in iter_sentry_envelope_items(src)
+    )
 
+    if _async_ingest_enabled():
+        items = list(items)
+        if not items:
+            return "No items processed", 400
+        _envelope_queue.put((project_part.id, event_id, now, items))
+        queued = ", ".join(str(headers.get("type", "unknown")) for headers, _, _ in items)
+        return f"OK: queued {queued}", 200
+
+    pending_events: list = []
+    processed_items = _ingest_envelope_items(
+        project_part, items, event_id=event_id, now=now, pending_events=pending_events
+    )
+    _emit_pending_events(pending_events)
     if not processed_items:
         return "No items processed", 400
 
@@ -1144,12 +1465,12 @@ def create_ticket_from_error(user: User, error_id: int):
     try:
         error = ErrorGroup.get(ErrorGroup.id == error_id)
     except DoesNotExist:
-        return json.dumps({"error": "Error not found"}), 404
+        return jsonify({"error": "Error not found"}), 404
 
     existing = Ticket.select().where(Ticket.error == error.id).first()
     if existing:
         return (
-            json.dumps(
+            jsonify(
                 {
                     "success": True,
                     "ticket_id": existing.id,
@@ -1162,11 +1483,11 @@ def create_ticket_from_error(user: User, error_id: int):
     data = request.get_json() or {}
     project_id = (data.get("project_id") or "").strip()
     if not project_id:
-        return json.dumps({"error": "Project is required"}), 400
+        return jsonify({"error": "Project is required"}), 400
 
     project = Project.get_or_none(Project.id == project_id)
     if not project or project.archived == 1:
-        return json.dumps({"error": "Project not found"}), 404
+        return jsonify({"error": "Project not found"}), 404
 
     ticket_id = f"{project.id}-E{error.id}"
     if Ticket.get_or_none(Ticket.id == ticket_id):
@@ -1187,7 +1508,7 @@ def create_ticket_from_error(user: User, error_id: int):
     )
 
     return (
-        json.dumps(
+        jsonify(
             {
                 "success": True,
                 "ticket_id": ticket_id,
@@ -1205,7 +1526,7 @@ def delete_error(user: User, error_id: int):
     try:
         error = ErrorGroup.get(ErrorGroup.id == error_id)
     except DoesNotExist:
-        return json.dumps({"error": "Error not found"}), 404
+        return jsonify({"error": "Error not found"}), 404
 
     # Cascade delete occurrences and attachments
     ErrorOccurrence.delete().where(ErrorOccurrence.error_group == error.id).execute()
@@ -1214,7 +1535,7 @@ def delete_error(user: User, error_id: int):
     # Delete the error group itself
     error.delete_instance()
 
-    return json.dumps({"success": True}), 200
+    return jsonify({"success": True}), 200
 
 
 @bug_bp.route("/api/parts/<int:part_id>/errors", methods=["DELETE"])
@@ -1224,15 +1545,15 @@ def delete_all_part_errors(user: User, part_id: int):
     try:
         ProjectPart.get(ProjectPart.id == part_id)
     except DoesNotExist:
-        return json.dumps({"error": "Part not found"}), 404
+        return jsonify({"error": "Part not found"}), 404
 
     error_ids = [row.id for row in ErrorGroup.select(ErrorGroup.id).where(ErrorGroup.part == part_id)]
     if not error_ids:
-        return json.dumps({"success": True, "deleted": 0}), 200
+        return jsonify({"success": True, "deleted": 0}), 200
 
     ErrorOccurrence.delete().where(ErrorOccurrence.error_group.in_(error_ids)).execute()
     Attachment.delete().where(Attachment.error_group.in_(error_ids)).execute()
     Ticket.update(error=None).where(Ticket.error.in_(error_ids)).execute()
     deleted = ErrorGroup.delete().where(ErrorGroup.id.in_(error_ids)).execute()
 
-    return json.dumps({"success": True, "deleted": deleted}), 200
+    return jsonify({"success": True, "deleted": deleted}), 200
@@ -3,11 +3,13 @@ Changelog Views and API Endpoints
 Public changelog page + admin editor with AI-native changelog generation.
 """
 
-from ..utils.security import protected
+from ..utils.security import get_current_user, protected
 from ..utils.models import (
     User,
     Ticket,
     ChangelogRelease,
+    Comment,
+    TicketUpdateMessage,
     UserTicketJoin,
     WorkCycle,
 )
@@ -27,7 +29,6 @@ SPRINT_DONE_STATUSES = ("done", "closed", "duplicate")
 
 def _get_current_user_or_none():
     """Try to get the current user without requiring auth."""
-    from ..utils.security import get_current_user
     try:
         return get_current_user()
     except Exception:
@@ -70,8 +71,6 @@ def _get_last_published_timestamp():
 
 def _get_available_tickets(since_timestamp=0, limit=50):
     """Get tickets that were created or updated since a given timestamp."""
-    from ..utils.models import TicketUpdateMessage, Comment
-
     query = Ticket.select().where(Ticket.active == 1)
 
     if since_timestamp > 0:
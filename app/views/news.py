@@ -1,12 +1,11 @@
 from ..utils.security import protected, redirect_with_script_root
-from peewee import prefetch
+from peewee import Case, fn
 from ..utils.models import (
     User,
     Ticket,
     UserTicketJoin,
     ErrorGroup,
     Project,
-    ProjectPart,
     Comment,
     TicketUpdateMessage,
     TicketLabelJoin,
@@ -15,10 +14,19 @@ from ..utils.models import (
 )
 from flask import Blueprint, redirect, render_template, request, Response, url_for
 from urllib.parse import urlencode
+import bisect
+from collections import Counter, defaultdict
+import functools
+import heapq
 import json
 import time
 import csv
 import io
+from datetime import datetime
+from operator import itemgetter
+from typing import Callable
+from ..utils import fast_json
+from ..utils.local_cache import LocalCache
 from ..utils.path import data_path, path
 from ..utils.user_display import build_display_name_map_for
 
@@ -34,28 +42,45 @@ LOW_SIGNAL_UPDATE_TITLES = {
 }
 
 
-def time_ago(timestamp: int) -> str:
-    """Convert a Unix timestamp to a human-readable 'time ago' string."""
-    now = int(time.time())
+# (upper bound in seconds, unit length, singular, plural); the last bucket is open-ended.
+_TIME_AGO_UNITS = (
+    (3600, 60, "minute", "minutes"),
+    (86400, 3600, "hour", "hours"),
+    (604800, 86400, "day", "days"),
+    (2592000, 604800, "week", "weeks"),
+    (float("inf"), 2592000, "month", "months"),
+)
+_TIME_AGO_BOUNDS = tuple(unit[0] for unit in _TIME_AGO_UNITS)
+
+
+def time_ago(timestamp: int, now: int | None = None) -> str:
+    """Convert a Unix timestamp to a human-readable 'time ago' string.
+
+    Pass ``now`` when formatting many timestamps so every row uses the same reference.
+    """
+    if now is None:
+        now = int(time.time())
     diff = now - timestamp
 
     if diff < 60:
         return "just now"
-    elif diff < 3600:
-        minutes = diff // 60
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    elif diff < 86400:
-        hours = diff // 3600
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif diff < 604800:
-        days = diff // 86400
-        return f"{days} day{'s' if days != 1 else ''} ago"
-    elif diff < 2592000:
-        weeks = diff // 604800
-        return f"{weeks} week{'s' if weeks != 1 else ''} ago"
-    else:
-        months = diff // 2592000
-        return f"{months} month{'s' if months != 1 else ''} ago"
+    return _time_ago_minutes(diff // 60)
+
+
+@functools.lru_cache(maxsize=4096)
+def _time_ago_minutes(minutes: int) -> str:
+    """Label for an age in whole minutes; every unit is a whole number of minutes."""
+    _, unit_seconds, singular, plural = _TIME_AGO_UNITS[
+        bisect.bisect_right(_TIME_AGO_BOUNDS, minutes * 60)
+    ]
+    value = minutes * 60 // unit_seconds
+    return f"{value} {(plural, singular)[value == 1]} ago"
+
+
+@functools.lru_cache(maxsize=64)
+def update_icon_class(icon: str | None) -> str:
+    """Feed icon class for a TicketUpdateMessage icon ("ph ph-x" -> "ph-x"); few distinct values."""
+    return icon.replace("ph ", "") if icon else "ph-pencil"
 
 
 @news_bp.route("/news")
@@ -69,30 +94,45 @@ def news_view(user: User):
     now = int(time.time())
     today_start = now - (now % 86400)  # Start of today
 
-    # Get tickets assigned to the user
-    user_ticket_ids = [
-        utj.ticket for utj in UserTicketJoin.select().where(UserTicketJoin.user == user.username)
-    ]
+    # Get tickets assigned to the user; (user, ticket) is unique, so the join yields each once
     my_tickets = list(
-        Ticket.select().where(Ticket.id.in_(user_ticket_ids)).order_by(Ticket.created_at.desc())
-    )
-
-    # Count open tickets (tickets that are not closed)
-    open_tickets = (
         Ticket.select()
-        .where((Ticket.id.in_(user_ticket_ids)) & (Ticket.status != "closed"))
-        .count()
+        .join(UserTicketJoin, on=(UserTicketJoin.ticket == Ticket.id))
+        .where(UserTicketJoin.user == user.username)
+        .order_by(Ticket.created_at.desc())
     )
 
-    # Get unresolved errors
-    unresolved_errors = ErrorGroup.select().where(ErrorGroup.status == "unresolved").count()
-
-    # Get errors resolved today
-    resolved_today = (
-        ErrorGroup.select()
-        .where((ErrorGroup.status == "resolved") & (ErrorGroup.last_seen >= today_start))
-        .count()
+    # Count open tickets (tickets that are not closed); my_tickets already holds them all
+    open_tickets = sum(1 for ticket in my_tickets if ticket.status != "closed")
+
+    # Unresolved errors and errors resolved today in a single aggregate pass
+    error_stats = (
+        ErrorGroup.select(
+            fn.COALESCE(
+                fn.SUM(Case(None, [(ErrorGroup.status == "unresolved", 1)], 0)), 0
+            ).alias("unresolved"),
+            fn.COALESCE(
+                fn.SUM(
+                    Case(
+                        None,
+                        [
+                            (
+                                (ErrorGroup.status == "resolved")
+                                & (ErrorGroup.last_seen >= today_start),
+                                1,
+                            )
+                        ],
+                        0,
+                    )
+                ),
+                0,
+            ).alias("resolved_today"),
+        )
+        .dicts()
+        .get()
     )
+    unresolved_errors = error_stats["unresolved"]
+    resolved_today = error_stats["resolved_today"]
 
     # Get recent errors (last 5)
     recent_errors = list(ErrorGroup.select().order_by(ErrorGroup.last_seen.desc()).limit(5))
@@ -104,9 +144,10 @@ def news_view(user: User):
     activities = []
 
     # Add recent comments
+    # Comment.user is keyed by username, so user_id is the name without loading the User row.
     recent_comments = list(Comment.select().order_by(Comment.created_at.desc()).limit(15))
     comment_author_usernames = [
-        c.user.username for c in recent_comments if not bool(getattr(c, "via_agent", 0) or 0)
+        c.user_id for c in recent_comments if not bool(getattr(c, "via_agent", 0) or 0)
     ]
     comment_display_names = build_display_name_map_for(comment_author_usernames)
 
@@ -118,10 +159,10 @@ def news_view(user: User):
                 "icon": "ph-chat-circle",
                 "user": "Agent"
                 if agent_comment
-                else comment_display_names.get(comment.user.username, comment.user.username),
+                else comment_display_names.get(comment.user_id, comment.user_id),
                 "action": f"commented on {comment.ticket}",
                 "text": comment.body,
-                "time_ago": time_ago(comment.created_at),
+                "time_ago": time_ago(comment.created_at, now),
                 "timestamp": comment.created_at,
             }
         )
@@ -134,11 +175,11 @@ def news_view(user: User):
         activities.append(
             {
                 "type": "update",
-                "icon": update.icon.replace("ph ", "") if update.icon else "ph-pencil",
+                "icon": update_icon_class(update.icon),
                 "user": "System",
                 "action": f"{update.title} on {update.ticket}",
                 "text": update.message,
-                "time_ago": time_ago(update.created_at),
+                "time_ago": time_ago(update.created_at, now),
                 "timestamp": update.created_at,
             }
         )
@@ -152,7 +193,7 @@ def news_view(user: User):
                 "user": error.platform or "Unknown",
                 "action": "triggered an error",
                 "text": f"{error.exception_type or 'Error'}: {error.exception_value or 'Unknown error'}",
-                "time_ago": time_ago(error.last_seen),
+                "time_ago": time_ago(error.last_seen, now),
                 "timestamp": error.last_seen,
             }
         )
@@ -174,6 +215,25 @@ def news_view(user: User):
     )
 
 
+@functools.lru_cache(maxsize=16384)
+def _date_parts_for_minute(minute: int) -> dict:
+    """Timeline date fields for a minute bucket; nothing finer than a minute is shown.
+
+    Shared across requests, so callers must treat the dict as read-only (events splat it).
+    """
+    date_str, date_day, date_month, date_full, time_str = datetime.fromtimestamp(
+        minute * 60
+    ).strftime("%Y-%m-%d|%d|%b|%A, %B %d, %Y|%I:%M %p").split("|")
+    return {
+        "date_str": date_str,
+        "date_day": date_day,
+        "date_month": date_month,
+        "date_full": date_full,
+        "time_str": time_str,
+        "date_key": date_str,
+    }
+
+
 def build_timeline_events(  # noqa: C901
     project_id: str | None = None,
     days: int = 30,
@@ -185,76 +245,57 @@ def build_timeline_events(  # noqa: C901
     Build a comprehensive timeline of events across tickets, comments, errors, and updates.
     Uses manual batching to avoid N+1 query problems.
     """
-    from datetime import datetime
-    from collections import defaultdict
-
     now = int(time.time())
     cutoff = now - (days * 86400) if days > 0 else 0
 
-    events = []
+    # One list per source, each newest first; merged once all four are built
+    ticket_events: list[dict] = []
+    comment_events: list[dict] = []
+    update_events: list[dict] = []
+    error_events: list[dict] = []
     # Note: Stats are still calculated over the full range, but events are paginated
-    activity_by_day = defaultdict(int)
     user_activity = defaultdict(int)
 
-    # Helper to format date parts
-    def format_date_parts(timestamp: int) -> dict:
-        dt = datetime.fromtimestamp(timestamp)
-        return {
-            "date_str": dt.strftime("%Y-%m-%d"),
-            "date_day": dt.strftime("%d"),
-            "date_month": dt.strftime("%b"),
-            "date_full": dt.strftime("%A, %B %d, %Y"),
-            "time_str": dt.strftime("%I:%M %p"),
-            "date_key": dt.strftime("%Y-%m-%d"),
-        }
-
-    # 1. Fetch Tickets
-    ticket_query = Ticket.select()
+    # 1. Fetch Tickets (only what the events and stats read; the description is cut in SQL)
+    ticket_query = Ticket.select(
+        Ticket.id,
+        Ticket.title,
+        fn.SUBSTR(Ticket.description, 1, 300).alias("description"),
+        Ticket.status,
+        Ticket.priority,
+        Ticket.project,
+        Ticket.created_at,
+    )
     if project_id:
         ticket_query = ticket_query.where(Ticket.project == project_id)
     if cutoff > 0:
         ticket_query = ticket_query.where(Ticket.created_at >= cutoff)
 
     # We fetch them to a list for manual batching
-    tickets = list(ticket_query)
-    ticket_dict = {t.id: t for t in tickets if getattr(t, 'id', None)}
-    ticket_ids = list(ticket_dict.keys())
-
-    # Bulk Assignees
-    if ticket_ids:
-        utjs = UserTicketJoin.select().where(UserTicketJoin.ticket.in_(ticket_ids))
-        user_ids = [utj.user for utj in utjs]
-        if user_ids:
-            users = {u.username: u for u in User.select().where(User.username.in_(user_ids))}
-            for utj in utjs:
-                if utj.ticket in ticket_dict and utj.user in users:
-                    user_activity[utj.user] += 1
-
-    # Bulk Labels (for stats)
-    for t in tickets:
-        if not hasattr(t, "labels"):
-            t.labels = []
-
-    if ticket_ids:
-        tljs = TicketLabelJoin.select().where(TicketLabelJoin.ticket.in_(ticket_ids))
-        label_ids = [tlj.label for tlj in tljs]
-        if label_ids:
-            labels = {l.name: l for l in Label.select().where(Label.name.in_(label_ids))}
-            for tlj in tljs:
-                if tlj.ticket in ticket_dict and tlj.label in labels:
-                    ticket_dict[tlj.ticket].labels.append(labels[tlj.label])
+    tickets = list(ticket_query.order_by(Ticket.created_at.desc()))
+
+    # Bulk Assignees: the ticket filter is a subquery and the join keeps only existing
+    # users, so neither the id list nor the User rows travel through Python.
+    if tickets:
+        assignee_rows = (
+            UserTicketJoin.select(UserTicketJoin.user)
+            .join(User, on=(UserTicketJoin.user == User.username))
+            .where(UserTicketJoin.ticket.in_(ticket_query.select(Ticket.id)))
+            .tuples()
+        )
+        for (username,) in assignee_rows:
+            user_activity[username] += 1
 
     for ticket in tickets:
-        date_parts = format_date_parts(ticket.created_at)
-        activity_by_day[date_parts["date_key"]] += 1
+        date_parts = _date_parts_for_minute(ticket.created_at // 60)
 
-        events.append(
+        ticket_events.append(
             {
                 "type": "ticket",
                 "type_label": "Ticket Created",
                 "icon": "ph-ticket",
                 "title": f"{ticket.id}: {ticket.title}",
-                "description": ticket.description[:300] if ticket.description else None,
+                "description": ticket.description or None,
                 "timestamp": ticket.created_at,
                 "link": f"/tickets/{ticket.project}/{ticket.id}",
                 "meta": {
@@ -268,88 +309,76 @@ def build_timeline_events(  # noqa: C901
         )
 
     # 2. Fetch Comments (if detailed)
+    # Comments and updates reference tickets by id; joining Ticket brings the project
+    # along in the same query and lets SQLite apply the project filter (orphans drop out).
     if detailed:
-        comment_query = Comment.select()
+        comment_query = (
+            Comment.select(
+                Comment.ticket,
+                Comment.user,
+                fn.SUBSTR(Comment.body, 1, 200).alias("body"),
+                Comment.created_at,
+                Comment.via_agent,
+                Ticket.project.alias("ticket_project"),
+            )
+            .join(Ticket, on=(Comment.ticket == Ticket.id))
+        )
+        if project_id:
+            comment_query = comment_query.where(Ticket.project == project_id)
         if cutoff > 0:
             comment_query = comment_query.where(Comment.created_at >= cutoff)
 
-        comments = list(comment_query)
-        # Fetch tickets and users for comments in bulk
-        c_ticket_ids = [c.ticket for c in comments if c.ticket]
-        if c_ticket_ids:
-            c_tickets = {t.id: t for t in Ticket.select(Ticket.id, Ticket.project).where(Ticket.id.in_(c_ticket_ids))}
-        else:
-            c_tickets = {}
-
-        c_user_ids = [c.user_id for c in comments if c.user_id]
-        if c_user_ids:
-            c_users = {u.username: u for u in User.select(User.username).where(User.username.in_(c_user_ids))}
-        else:
-            c_users = {}
-
-        for comment in comments:
-            c_ticket = c_tickets.get(comment.ticket)
-            if not c_ticket:
-                continue
-
-            # Filter by project if specified
-            if project_id and c_ticket.project != project_id:
-                continue
-
-            date_parts = format_date_parts(comment.created_at)
-            activity_by_day[date_parts["date_key"]] += 1
+        comment_query = comment_query.order_by(Comment.created_at.desc(), Comment.id)
+        for comment in comment_query.objects():
+            date_parts = _date_parts_for_minute(comment.created_at // 60)
 
             via_agent = bool(getattr(comment, "via_agent", 0) or 0)
-            username = (
-                "Agent"
-                if via_agent
-                else (c_users[comment.user_id].username if comment.user_id in c_users else str(comment.user_id))
-            )
+            # user is a username foreign key, so the raw column is already the name.
+            username = "Agent" if via_agent else str(comment.user_id)
             user_activity[username] += 1
 
-            events.append(
+            comment_events.append(
                 {
                     "type": "comment",
                     "type_label": "Comment",
                     "icon": "ph-chat-circle",
                     "title": f"Comment on {comment.ticket}",
-                    "description": comment.body[:200] if comment.body else None,
+                    "description": comment.body or None,
                     "timestamp": comment.created_at,
-                    "link": f"/tickets/{c_ticket.project}/{comment.ticket}",
+                    "link": f"/tickets/{comment.ticket_project}/{comment.ticket}",
                     "meta": {"user": username, "ticket_id": comment.ticket, "via_agent": via_agent},
                     **date_parts,
                 }
             )
 
     # 3. Fetch Updates
-    update_query = TicketUpdateMessage.select()
+    update_query = (
+        TicketUpdateMessage.select(
+            TicketUpdateMessage.ticket,
+            TicketUpdateMessage.title,
+            TicketUpdateMessage.icon,
+            TicketUpdateMessage.message,
+            TicketUpdateMessage.created_at,
+            Ticket.project.alias("ticket_project"),
+        )
+        .join(Ticket, on=(TicketUpdateMessage.ticket == Ticket.id))
+    )
+    if project_id:
+        update_query = update_query.where(Ticket.project == project_id)
     if cutoff > 0:
         update_query = update_query.where(TicketUpdateMessage.created_at >= cutoff)
+    if not detailed:
+        update_query = update_query.where(TicketUpdateMessage.title.not_in(LOW_SIGNAL_UPDATE_TITLES))
 
-    updates = list(update_query)
-    u_ticket_ids = [u.ticket for u in updates if u.ticket]
-    if u_ticket_ids:
-        u_tickets = {t.id: t for t in Ticket.select(Ticket.id, Ticket.project).where(Ticket.id.in_(u_ticket_ids))}
-    else:
-        u_tickets = {}
-
-    for update in updates:
-        u_ticket = u_tickets.get(update.ticket)
-        if not u_ticket:
-            continue
-
-        if project_id and u_ticket.project != project_id:
-            continue
-
-        if not detailed and update.title in LOW_SIGNAL_UPDATE_TITLES:
-            continue
-
-        date_parts = format_date_parts(update.created_at)
-        activity_by_day[date_parts["date_key"]] += 1
+    update_query = update_query.order_by(
+        TicketUpdateMessage.created_at.desc(), TicketUpdateMessage.id
+    )
+    for update in update_query.objects():
+        date_parts = _date_parts_for_minute(update.created_at // 60)
 
-        icon = update.icon.replace("ph ", "") if update.icon else "ph-pencil"
+        icon = update_icon_class(update.icon)
 
-        events.append(
+        update_events.append(
             {
                 "type": "update",
                 "type_label": update.title,
@@ -357,7 +386,7 @@ def build_timeline_events(  # noqa: C901
                 "title": f"{update.title}",
                 "description": update.message,
                 "timestamp": update.created_at,
-                "link": f"/tickets/{u_ticket.project}/{update.ticket}",
+                "link": f"/tickets/{update.ticket_project}/{update.ticket}",
                 "meta": {"ticket_id": update.ticket},
                 **date_parts,
             }
@@ -365,17 +394,26 @@ def build_timeline_events(  # noqa: C901
 
     # 4. Fetch Errors (workspace-level; not scoped to ticket projects)
     if not project_id:
-        error_query = ErrorGroup.select()
+        # Only the columns the event needs, as plain tuples: the stacktrace/context JSON
+        # blobs are skipped and no model instances are built. part_id is enough for the link.
+        error_query = ErrorGroup.select(
+            ErrorGroup.id,
+            ErrorGroup.part.alias("part_id"),
+            ErrorGroup.exception_type,
+            ErrorGroup.exception_value,
+            ErrorGroup.culprit,
+            ErrorGroup.last_seen,
+            ErrorGroup.event_count,
+            ErrorGroup.status,
+        )
         if cutoff > 0:
             error_query = error_query.where(ErrorGroup.last_seen >= cutoff)
 
-        errors_prefetched = prefetch(error_query, ProjectPart.select())
-
-        for error in errors_prefetched:
-            date_parts = format_date_parts(error.last_seen)
-            activity_by_day[date_parts["date_key"]] += 1
+        error_query = error_query.order_by(ErrorGroup.last_seen.desc(), ErrorGroup.id)
+        for error in error_query.namedtuples():
+            date_parts = _date_parts_for_minute(error.last_seen // 60)
 
-            events.append(
+            error_events.append(
                 {
                     "type": "error",
                     "type_label": "Error",
@@ -392,8 +430,18 @@ def build_timeline_events(  # noqa: C901
                 }
             )
 
-    # Sort all events by timestamp (most recent first)
-    events.sort(key=lambda x: x["timestamp"], reverse=True)
+    # Every source arrives newest first from SQL, so a k-way merge replaces a full sort
+    # (ties keep the ticket/comment/update/error source order the old stable sort had).
+    events = list(
+        heapq.merge(
+            ticket_events,
+            comment_events,
+            update_events,
+            error_events,
+            key=itemgetter("timestamp"),
+            reverse=True,
+        )
+    )
 
     # Group consecutive updates for the same ticket
     grouped_events = []
@@ -423,7 +471,7 @@ def build_timeline_events(  # noqa: C901
                         "project": event.get("meta", {}).get("project"),
                     },
                     "events": [event],
-                    **{k: event[k] for k in ["date_str", "date_day", "date_month", "date_full", "time_str", "date_key"]}
+                    **_date_parts_for_minute(event["timestamp"] // 60),
                 }
                 grouped_events.append(current_group)
         else:
@@ -454,26 +502,55 @@ def build_timeline_events(  # noqa: C901
     stats = {}
     if offset == 0:
         # Only calc full stats on first page
-        tickets_all = tickets
-        tickets_created = len([t for t in tickets_all if t.created_at >= cutoff]) if cutoff > 0 else len(tickets_all)
-        tickets_closed = len([t for t in tickets_all if t.status == "closed"])
-        tickets_in_progress = len([t for t in tickets_all if t.status == "in-progress"])
+        # tickets is already loaded for the events and limited to the window by the query,
+        # so one pass over it beats a GROUP BY round trip
+        tickets_created = len(tickets)
+        status_counts = Counter(t.status for t in tickets)
+        tickets_closed = status_counts["closed"]
+        tickets_in_progress = status_counts["in-progress"]
 
         total_comments = Comment.select().count()
-        total_errors = ErrorGroup.select().count()
-        errors_resolved = ErrorGroup.select().where(ErrorGroup.status == "resolved").count()
+        error_counts = (
+            ErrorGroup.select(
+                fn.COUNT(ErrorGroup.id).alias("total"),
+                fn.COALESCE(
+                    fn.SUM(Case(None, [(ErrorGroup.status == "resolved", 1)], 0)), 0
+                ).alias("resolved"),
+            )
+            .dicts()
+            .get()
+        )
+        total_errors = error_counts["total"]
+        errors_resolved = error_counts["resolved"]
 
         active_users = len(set(user_activity.keys()))
 
-        # Effort breakdown
+        # Every event already carries its day key, so the heatmap is one C-level tally
+        activity_by_day = Counter(map(itemgetter("date_key"), events))
+
+        # Effort breakdown: one aggregate row over the bug/feature labels of the tickets
+        # in the window. A ticket labelled both counts as a bug, so features are the
+        # labelled tickets that are not bugs.
         total = tickets_created # Use created in window
-        bug_tickets = 0
-        feature_tickets = 0
-        for t in tickets_all:
-            if t.created_at < cutoff and cutoff > 0: continue
-            labels = [l.name for l in t.labels]
-            if "bug" in labels: bug_tickets += 1
-            elif "feature" in labels: feature_tickets += 1
+        effort = (
+            TicketLabelJoin.select(
+                fn.COUNT(
+                    fn.DISTINCT(
+                        Case(None, [(TicketLabelJoin.label == "bug", TicketLabelJoin.ticket)])
+                    )
+                ).alias("bugs"),
+                fn.COUNT(fn.DISTINCT(TicketLabelJoin.ticket)).alias("labelled"),
+            )
+            .join(Label, on=(TicketLabelJoin.label == Label.name))
+            .where(
+                TicketLabelJoin.ticket.in_(ticket_query.select(Ticket.id))
+                & TicketLabelJoin.label.in_(["bug", "feature"])
+            )
+            .dicts()
+            .get()
+        )
+        bug_tickets = effort["bugs"]
+        feature_tickets = effort["labelled"] - bug_tickets
 
         other_tickets = total - bug_tickets - feature_tickets
         effort_bugs = (bug_tickets / total * 100) if total > 0 else 0
@@ -527,6 +604,46 @@ def build_timeline_events(  # noqa: C901
     }
 
 
+# Timeline payloads do not depend on the viewer, so dashboard refreshes and "load more"
+# pages within the TTL are served from memory instead of re-running every query.
+_timeline_cache = LocalCache(maxsize=64, ttl=30)
+
+
+def _cached_timeline_events(
+    project_id: str | None = None,
+    days: int = 30,
+    detailed: bool = False,
+    offset: int = 0,
+    limit: int = 50,
+) -> dict:
+    """build_timeline_events() behind a 30s process-local cache."""
+    return _timeline_cached(
+        ("events", project_id, days, detailed, offset, limit),
+        lambda: build_timeline_events(project_id, days, detailed, offset, limit),
+    )
+
+
+def _timeline_page_data(project_id: str | None, days: int, detailed: bool) -> dict:
+    """First timeline page plus the JSON blobs the template embeds, cached together."""
+
+    def build() -> dict:
+        data = build_timeline_events(project_id, days, detailed)
+        data["events_json"] = fast_json.dumps(data["events"])
+        data["activity_by_day_json"] = fast_json.dumps(data["activity_by_day"])
+        return data
+
+    return _timeline_cached(("page", project_id, days, detailed), build)
+
+
+def _timeline_cached(key: tuple, build: Callable[[], dict]) -> dict:
+    data = _timeline_cache.get(key)
+    if data is None:
+        data = build()
+        _timeline_cache.set(key, data)
+    # Shallow copy so a caller adding keys cannot change the cached entry.
+    return dict(data)
+
+
 @news_bp.route("/api/timeline/events")
 @protected
 def api_timeline_events(user: User):
@@ -536,7 +653,7 @@ def api_timeline_events(user: User):
     offset = int(request.args.get("offset", 0))
     limit = int(request.args.get("limit", 50))
 
-    data = build_timeline_events(
+    data = _cached_timeline_events(
         project_id=project_id,
         days=days,
         detailed=detail_mode,
@@ -593,8 +710,20 @@ def build_reports_summary(days: int = 30) -> dict:
     tickets_created = Ticket.select().where((Ticket.active == 1) & (Ticket.created_at >= cutoff)).count()
     tickets_closed = Ticket.select().where((Ticket.active == 1) & (Ticket.status.in_(closed_statuses)) & (Ticket.created_at >= cutoff)).count()
 
-    unresolved_errors = ErrorGroup.select().where(ErrorGroup.status == "unresolved").count()
-    resolved_errors = ErrorGroup.select().where(ErrorGroup.status == "resolved").count()
+    error_counts = (
+        ErrorGroup.select(
+            fn.COALESCE(
+                fn.SUM(Case(None, [(ErrorGroup.status == "unresolved", 1)], 0)), 0
+            ).alias("unresolved"),
+            fn.COALESCE(
+                fn.SUM(Case(None, [(ErrorGroup.status == "resolved", 1)], 0)), 0
+            ).alias("resolved"),
+        )
+        .dicts()
+        .get()
+    )
+    unresolved_errors = error_counts["unresolved"]
+    resolved_errors = error_counts["resolved"]
 
     # 2. Triage / Intake Backlog
     triage_tickets = list(Ticket.select().where((Ticket.active == 1) & (Ticket.status.in_(intake_statuses))))
@@ -606,8 +735,6 @@ def build_reports_summary(days: int = 30) -> dict:
 
     # 3. Project-specific stats (Batch)
     # We'll get counts for all projects in one go for each category
-    from peewee import fn
-
     def get_project_counts(filter_expr):
         query = (Ticket.select(Ticket.project, fn.COUNT(Ticket.id).alias('count'))
                 .where((Ticket.active == 1) & filter_expr)
@@ -647,7 +774,7 @@ def build_reports_summary(days: int = 30) -> dict:
 def timeline_view(user: User):
     days = _parse_timeline_days(request.args.get("days"))
     detail_mode = _parse_timeline_detail(request.args.get("detail"))
-    data = build_timeline_events(project_id=None, days=days, detailed=detail_mode)
+    data = _timeline_page_data(None, days, detail_mode)
     summary = build_reports_summary(days=30)
 
     sr = request.script_root or ""
@@ -660,8 +787,8 @@ def timeline_view(user: User):
         projects=list(active_projects_ordered()),
         project=None,
         events=data["events"],  # Already limited by build_timeline_events
-        events_json=json.dumps(data["events"]),
-        activity_by_day=json.dumps(data["activity_by_day"]),
+        events_json=data["events_json"],
+        activity_by_day=data["activity_by_day_json"],
         query_suffix=_timeline_query_suffix(days, detail_mode),
         compact_url=_timeline_mode_url(f"{sr}/timeline", days, False),
         detailed_url=_timeline_mode_url(f"{sr}/timeline", days, True),
@@ -693,7 +820,7 @@ def timeline_project_view(user: User, project_id: str):
 
     days = _parse_timeline_days(request.args.get("days"))
     detail_mode = _parse_timeline_detail(request.args.get("detail"))
-    data = build_timeline_events(project_id=project_id, days=days, detailed=detail_mode)
+    data = _timeline_page_data(project_id, days, detail_mode)
     summary = build_reports_summary(days=30)
 
     sr = request.script_root or ""
@@ -706,8 +833,8 @@ def timeline_project_view(user: User, project_id: str):
         projects=list(active_projects_ordered()),
         project=project,
         events=data["events"],
-        events_json=json.dumps(data["events"]),
-        activity_by_day=json.dumps(data["activity_by_day"]),
+        events_json=data["events_json"],
+        activity_by_day=data["activity_by_day_json"],
         query_suffix=_timeline_query_suffix(days, detail_mode),
         compact_url=_timeline_mode_url(f"{sr}/timeline/{project.id}", days, False),
         detailed_url=_timeline_mode_url(f"{sr}/timeline/{project.id}", days, True),
@@ -10,15 +10,19 @@ import re
 import secrets
 import time
 import uuid
+from types import MappingProxyType
 
-import pyargon2
-from flask import Blueprint, flash, jsonify, redirect, render_template, request, url_for
+import requests
+from flask import Blueprint, flash, g, jsonify, redirect, render_template, request, url_for
 from peewee import DoesNotExist
 
-from ..utils import mail
+from ..utils import fast_json, mail
 from ..utils.mail import EMAIL_TRANSPORT_SETTINGS_KEY, effective_relay_base_url, effective_relay_token
 from ..utils.mail_relay import relay_base_url_from_environment, relay_token_from_environment
+from ..utils.passwords import hash_password, verify_password
 from ..utils.email_branding import render_email
+from ..utils.branding import clear_instance_logo_files, save_instance_logo_from_upload
+from ..utils.public_site import set_show_public_home, show_public_home
 from ..utils.agent_auth import DEFAULT_AGENT_TTL_SECONDS
 from ..utils.ai_changelog import get_ai_config
 from ..utils.models import (
@@ -33,12 +37,17 @@ from ..utils.models import (
     User,
     UserCreateToken,
     UserSettings,
+    UserTicketJoin,
     Webhook,
     WebhookDelivery,
     WorkCycle,
     active_projects_ordered,
+    all_projects_ordered,
     create_user,
     data_path,
+    database,
+    labels_ordered,
+    users_ordered,
 )
 from ..utils.notifications import (
     get_notification_engine_settings,
@@ -52,6 +61,40 @@ from ..utils.security import protected
 settings_bp = Blueprint("settings", __name__)
 
 
+# Pooled keep-alive connections: repeated test deliveries to the same host skip the
+# TCP/TLS handshake.
+_webhook_http = requests.Session()
+_webhook_http.mount("https://", requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20))
+_webhook_http.mount("http://", requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Map sections to their display titles
+_SECTION_TITLES = MappingProxyType(
+    {
+        "profile": "Profile",
+        "preferences": "Preferences",
+        "notifications": "Notifications",
+        "email": "Email Service",
+        "security": "Security",
+        "general": "General",
+        "projects": "Projects",
+        "team": "Team Members",
+        "labels": "Labels",
+        "api": "API & Tokens",
+        "webhooks": "Webhooks",
+        "sentry": "Sentry Integration",
+        "updates": "Updates",
+        "trash": "Trash",
+        "anonymous": "Anonymous Access",
+        "danger": "Danger Zone",
+        "ai": "AI Integration",
+        "branding": "Branding",
+    }
+)
+_ADMIN_ONLY_SECTIONS = frozenset({"email", "webhooks", "sentry", "ai", "branding"})
+_USER_SETTINGS_SECTIONS = frozenset({"profile", "preferences", "notifications"})
+
+_PROJECT_ID_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
 MAX_AVATAR_SIZE_BYTES = 5 * 1024 * 1024
 ALLOWED_AVATAR_TYPES = {
     "image/png": ".png",
@@ -102,8 +145,7 @@ def docs_agent_integration(user: User):
 def settings_section_view(user: User, section: str):  # noqa: C901
     """Render settings page for a specific section"""
 
-    admin_only_sections = {"email", "webhooks", "sentry", "ai", "branding"}
-    if section in admin_only_sections and user.admin != 1:
+    if section in _ADMIN_ONLY_SECTIONS and user.admin != 1:
         flash("Unauthorized. Admins only.", "error")
         return redirect(url_for("settings.settings_section_view", section="profile"))
 
@@ -111,32 +153,12 @@ def settings_section_view(user: User, section: str):  # noqa: C901
         flash("Updates are disabled on this instance.", "error")
         return redirect(url_for("settings.settings_section_view", section="profile"))
 
-    # Map sections to their display titles
-    section_titles = {
-        "profile": "Profile",
-        "preferences": "Preferences",
-        "notifications": "Notifications",
-        "email": "Email Service",
-        "security": "Security",
-        "general": "General",
-        "projects": "Projects",
-        "team": "Team Members",
-        "labels": "Labels",
-        "api": "API & Tokens",
-        "webhooks": "Webhooks",
-        "sentry": "Sentry Integration",
-        "updates": "Updates",
-        "trash": "Trash",
-        "anonymous": "Anonymous Access",
-        "danger": "Danger Zone",
-        "ai": "AI Integration",
-        "branding": "Branding",
-    }
-
-    section_title = section_titles.get(section, section.title())
+    section_title = _SECTION_TITLES.get(section) or section.title()
 
-    # Get or create user settings
-    user_settings = get_or_create_user_settings(user)
+    # Only these sections render per-user settings; the rest skip the lookup entirely
+    user_settings = (
+        get_or_create_user_settings(user) if section in _USER_SETTINGS_SECTIONS else None
+    )
 
     # Base context
     context = {
@@ -148,14 +170,7 @@ def settings_section_view(user: User, section: str):  # noqa: C901
     }
 
     # Section-specific data
-    if section == "profile":
-        context["user_settings"] = user_settings
-
-    elif section == "preferences":
-        context["user_settings"] = user_settings
-
-    elif section == "notifications":
-        context["user_settings"] = user_settings
+    if section == "notifications":
         context["notification_engine"] = get_notification_engine_settings()
 
     elif section == "email":
@@ -168,7 +183,7 @@ def settings_section_view(user: User, section: str):  # noqa: C901
         context["relay_base_url_env_configured"] = bool(relay_base_url_from_environment())
         try:
             setting = GlobalSetting.get(GlobalSetting.key == "smtp_settings")
-            raw = json.loads(setting.value)
+            raw = fast_json.loads(setting.value)
             context["smtp_settings"] = {
                 "host": raw.get("host", ""),
                 "port": raw.get("port", 587),
@@ -191,21 +206,28 @@ def settings_section_view(user: User, section: str):  # noqa: C901
             context["smtp_password_configured"] = bool(env_password.strip())
 
     elif section == "projects":
-        projs = list(Project.select().order_by(Project.name))
+        projs = all_projects_ordered()
         context["projects_active"] = [p for p in projs if not p.archived]
         context["projects_archived"] = [p for p in projs if p.archived]
 
     elif section == "team":
-        context["team_members"] = list(User.select().order_by(User.username))
+        context["team_members"] = users_ordered()
 
     elif section == "labels":
-        context["labels"] = list(Label.select().order_by(Label.name))
+        context["labels"] = labels_ordered()
 
     elif section == "api":
         context["api_tokens"] = list(
-            APIToken.select()
+            APIToken.select(
+                APIToken.id,
+                APIToken.token_hash,
+                APIToken.token_preview,
+                APIToken.last_used,
+                APIToken.created_at,
+            )
             .where(APIToken.user == user.username)
             .order_by(APIToken.created_at.desc())
+            .dicts()
         )
         context["agent_tokens"] = list(
             AgentToken.select()
@@ -221,11 +243,18 @@ def settings_section_view(user: User, section: str):  # noqa: C901
         context["github_webhook_secret_configured"] = bool(get_github_webhook_secret())
 
         # Outgoing webhooks
-        context["outgoing_webhooks"] = list(
-            Webhook.select()
+        outgoing_webhooks = list(
+            Webhook.select(Webhook.id, Webhook.url, Webhook.events, Webhook.active)
             .where(Webhook.user == user.username)
             .order_by(Webhook.created_at.desc())
+            .dicts()
         )
+        for row in outgoing_webhooks:
+            try:
+                row["events"] = fast_json.loads(row["events"] or "[]")
+            except json.JSONDecodeError:
+                row["events"] = []
+        context["outgoing_webhooks"] = outgoing_webhooks
 
         # Recent webhook activity
         context["webhook_activity"] = get_recent_webhook_activity(user, limit=10)
@@ -247,8 +276,6 @@ def settings_section_view(user: User, section: str):  # noqa: C901
             context["dsn_token_preview"] = ""
 
     elif section == "branding":
-        from ..utils.public_site import show_public_home
-
         context["show_public_home"] = show_public_home()
 
     elif section == "trash":
@@ -260,7 +287,7 @@ def settings_section_view(user: User, section: str):  # noqa: C901
     elif section == "anonymous":
         try:
             setting = GlobalSetting.get(GlobalSetting.key == "anonymous_settings")
-            context["anon_settings"] = json.loads(setting.value)
+            context["anon_settings"] = fast_json.loads(setting.value)
         except DoesNotExist:
             context["anon_settings"] = {
                 "enabled": False,
@@ -282,7 +309,7 @@ def settings_section_view(user: User, section: str):  # noqa: C901
 
         try:
             setting = GlobalSetting.get(GlobalSetting.key == "ai_settings")
-            saved = json.loads(setting.value)
+            saved = fast_json.loads(setting.value)
             if saved.get("api_key"):
                 context["ai_settings"] = {
                     **default_ai_settings,
@@ -331,12 +358,9 @@ def api_update_profile(user: User):
         email = data["email"].strip()
         if email and email != user.email:
             # Check if email is already taken
-            try:
-                existing = User.get(User.email == email)
-                if existing.username != user.username:
-                    return json.dumps({"error": "Email already in use"}), 400
-            except DoesNotExist:
-                pass
+            existing = User.get_or_none(User.email == email)
+            if existing is not None and existing.username != user.username:
+                return fast_json.dumps({"error": "Email already in use"}), 400
             user.email = email
             user.save()
 
@@ -344,9 +368,9 @@ def api_update_profile(user: User):
     if "display_name" in data:
         settings = get_or_create_user_settings(user)
         settings.display_name = data["display_name"].strip()
-        settings.save()
+        settings.save(only=[UserSettings.display_name])
 
-    return json.dumps({"success": True}), 200
+    return fast_json.dumps({"success": True}), 200
 
 
 @settings_bp.route("/api/settings/profile/avatar", methods=["POST", "DELETE"])
@@ -357,40 +381,40 @@ def api_update_avatar(user: User):
         avatar_dir = data_path("avatars")
         os.makedirs(avatar_dir, exist_ok=True)
         _delete_existing_avatar_files(avatar_dir, user.username)
-        return json.dumps({"success": True}), 200
+        return fast_json.dumps({"success": True}), 200
 
     if "avatar" not in request.files:
-        return json.dumps({"error": "No file part"}), 400
+        return fast_json.dumps({"error": "No file part"}), 400
 
     file = request.files["avatar"]
     if file.filename == "":
-        return json.dumps({"error": "No selected file"}), 400
+        return fast_json.dumps({"error": "No selected file"}), 400
 
     if file:
         content_type = (file.content_type or "").lower()
         extension = ALLOWED_AVATAR_TYPES.get(content_type)
         if not extension:
-            return json.dumps({"error": "Unsupported avatar format"}), 400
+            return fast_json.dumps({"error": "Unsupported avatar format"}), 400
 
         file.stream.seek(0, os.SEEK_END)
         size = file.stream.tell()
         file.stream.seek(0)
         if size > MAX_AVATAR_SIZE_BYTES:
-            return json.dumps({"error": "Avatar file too large (max 5 MB)"}), 413
+            return fast_json.dumps({"error": "Avatar file too large (max 5 MB)"}), 413
 
         header = file.stream.read(12)
         file.stream.seek(0)
         if not _avatar_magic_is_valid(content_type, header):
-            return json.dumps({"error": "Invalid avatar file"}), 400
+            return fast_json.dumps({"error": "Invalid avatar file"}), 400
 
         avatar_dir = data_path("avatars")
         os.makedirs(avatar_dir, exist_ok=True)
         _delete_existing_avatar_files(avatar_dir, user.username)
         file.save(os.path.join(avatar_dir, f"{user.username}{extension}"))
 
-        return json.dumps({"success": True}), 200
+        return fast_json.dumps({"success": True}), 200
 
-    return json.dumps({"error": "Invalid upload payload"}), 400
+    return fast_json.dumps({"error": "Invalid upload payload"}), 400
 
 
 @settings_bp.route("/api/settings/branding/logo", methods=["POST", "DELETE"])
@@ -398,25 +422,23 @@ def api_update_avatar(user: User):
 def api_instance_branding_logo(user: User):
     """Upload or remove workspace instance logo (admin only)."""
     if user.admin != 1:
-        return json.dumps({"error": "Unauthorized. Admins only."}), 403
-
-    from ..utils.branding import clear_instance_logo_files, save_instance_logo_from_upload
+        return fast_json.dumps({"error": "Unauthorized. Admins only."}), 403
 
     if request.method == "DELETE":
         clear_instance_logo_files()
-        return json.dumps({"success": True}), 200
+        return fast_json.dumps({"success": True}), 200
 
     if "logo" not in request.files:
-        return json.dumps({"error": "No file part"}), 400
+        return fast_json.dumps({"error": "No file part"}), 400
 
     file = request.files["logo"]
     if file.filename == "":
-        return json.dumps({"error": "No selected file"}), 400
+        return fast_json.dumps({"error": "No selected file"}), 400
 
     ok, message, status = save_instance_logo_from_upload(file)
     if not ok:
-        return json.dumps({"error": message}), status
-    return json.dumps({"success": True}), 200
+        return fast_json.dumps({"error": message}), status
+    return fast_json.dumps({"success": True}), 200
 
 
 @settings_bp.route("/api/settings/public-site", methods=["POST"])
@@ -424,16 +446,14 @@ def api_instance_branding_logo(user: User):
 def api_update_public_site_settings(user: User):
     """Toggle public landing page vs redirect root to News (admin only)."""
     if user.admin != 1:
-        return json.dumps({"error": "Unauthorized. Admins only."}), 403
+        return fast_json.dumps({"error": "Unauthorized. Admins only."}), 403
 
     data = request.get_json(silent=True) or {}
     if "show_public_home" not in data:
-        return json.dumps({"error": "Missing show_public_home"}), 400
-
-    from ..utils.public_site import set_show_public_home
+        return fast_json.dumps({"error": "Missing show_public_home"}), 400
 
     settings = set_show_public_home(bool(data["show_public_home"]))
-    return json.dumps({"success": True, "settings": settings}), 200
+    return fast_json.dumps({"success": True, "settings": settings}), 200
 
 
 @settings_bp.route("/api/settings/preferences", methods=["POST"])
@@ -443,25 +463,34 @@ def api_update_preferences(user: User):
     data = request.get_json()
     settings = get_or_create_user_settings(user)
 
-    # Update preferences
+    # Update preferences, writing back only the columns that changed
+    changed = []
     if "theme" in data:
         settings.theme = data["theme"]
+        changed.append(UserSettings.theme)
     if "compact_mode" in data:
         settings.compact_mode = 1 if data["compact_mode"] else 0
+        changed.append(UserSettings.compact_mode)
     if "animations" in data:
         settings.animations = 1 if data["animations"] else 0
+        changed.append(UserSettings.animations)
     if "home_page" in data:
         settings.home_page = data["home_page"]
+        changed.append(UserSettings.home_page)
     if "ticket_view" in data:
         settings.default_ticket_view = data["ticket_view"]
+        changed.append(UserSettings.default_ticket_view)
     if "timezone" in data:
         settings.timezone = data["timezone"]
+        changed.append(UserSettings.timezone)
     if "date_format" in data:
         settings.date_format = data["date_format"]
+        changed.append(UserSettings.date_format)
 
-    settings.save()
+    if changed:
+        settings.save(only=changed)
 
-    return json.dumps({"success": True}), 200
+    return fast_json.dumps({"success": True}), 200
 
 
 @settings_bp.route("/api/settings/notifications", methods=["POST"])
@@ -472,31 +501,31 @@ def api_update_notifications(user: User):
     settings = get_or_create_user_settings(user)
 
     # Update notification preferences (stored as JSON)
-    notification_prefs = json.loads(settings.notification_settings or "{}")
+    notification_prefs = fast_json.loads(settings.notification_settings or "{}")
     notification_prefs.update(data)
-    settings.notification_settings = json.dumps(notification_prefs)
-    settings.save()
+    settings.notification_settings = fast_json.dumps(notification_prefs)
+    settings.save(only=[UserSettings.notification_settings])
 
-    return json.dumps({"success": True}), 200
+    return fast_json.dumps({"success": True}), 200
 
 
 @settings_bp.route("/api/settings/notifications/engine", methods=["GET"])
 @protected
 def api_get_notification_engine_settings(user: User):
     if user.admin != 1:
-        return json.dumps({"error": "Unauthorized. Admins only."}), 403
-    return json.dumps({"success": True, "settings": get_notification_engine_settings()}), 200
+        return fast_json.dumps({"error": "Unauthorized. Admins only."}), 403
+    return fast_json.dumps({"success": True, "settings": get_notification_engine_settings()}), 200
 
 
 @settings_bp.route("/api/settings/notifications/engine", methods=["POST"])
 @protected
 def api_update_notification_engine_settings(user: User):
     if user.admin != 1:
-        return json.dumps({"error": "Unauthorized. Admins only."}), 403
+        return fast_json.dumps({"error": "Unauthorized. Admins only."}), 403
 
     payload = request.get_json(silent=True) or {}
     updated = save_notification_engine_settings(payload)
-    return json.dumps({"success": True, "settings": updated}), 200
+    return fast_json.dumps({"success": True, "settings": updated}), 200
 
 
 @settings_bp.route("/api/settings/anonymous", methods=["POST"])
@@ -516,12 +545,12 @@ def api_update_anonymous(user: User):
     # Save to GlobalSetting
     try:
         setting = GlobalSetting.get(GlobalSetting.key == "anonymous_settings")
-        setting.value = json.dumps(settings)
+        setting.value = fast_json.dumps(settings)
         setting.save()
     except DoesNotExist:
-        GlobalSetting.create(key="anonymous_settings", value=json.dumps(settings))
+        GlobalSetting.create(key="anonymous_settings", value=fast_json.dumps(settings))
 
-    return json.dumps({"success": True}), 200
+    return fast_json.dumps({"success": True}), 200
 
 
 @settings_bp.route("/api/settings/ai", methods=["POST"])
@@ -530,7 +559,7 @@ def api_update_ai(user: User):
     """Update AI configuration (admin only usually, but let's assume they have access to settings)"""
 
     if user.admin != 1:
-        return json.dumps({"error": "Unauthorized. Admins only."}), 403
+        return fast_json.dumps({"error": "Unauthorized. Admins only."}), 403
 
     data = request.get_json()
 
@@ -540,7 +569,7 @@ def api_update_ai(user: User):
     existing_settings = {}
     if existing_record and existing_record.value:
         try:
-            existing_settings = json.loads(existing_record.value)
+            existing_settings = fast_json.loads(existing_record.value)
         except json.JSONDecodeError:
             existing_settings = {}
 
@@ -563,16 +592,16 @@ def api_update_ai(user: User):
             setting.delete_instance()
         except DoesNotExist:
             pass
-        return json.dumps({"success": True, "message": "AI Integration disabled"}), 200
+        return fast_json.dumps({"success": True, "message": "AI Integration disabled"}), 200
 
     # Save to GlobalSetting
     if existing_record:
-        existing_record.value = json.dumps(settings)
+        existing_record.value = fast_json.dumps(settings)
         existing_record.save()
     else:
-        GlobalSetting.create(key="ai_settings", value=json.dumps(settings))
+        GlobalSetting.create(key="ai_settings", value=fast_json.dumps(settings))
 
-    return json.dumps({"success": True, "message": "AI Integration settings saved"}), 200
+    return fast_json.dumps({"success": True, "message": "AI Integration settings saved"}), 200
 
 
 @settings_bp.route("/api/settings/email", methods=["POST"])
@@ -580,7 +609,7 @@ def api_update_ai(user: User):
 def api_update_email_settings(user: User):
     """Update SMTP and/or HTTPS relay email delivery (admin only)."""
     if user.admin != 1:
-        return json.dumps({"error": "Unauthorized. Admins only."}), 403
+        return fast_json.dumps({"error": "Unauthorized. Admins only."}), 403
 
     data = request.get_json(silent=True) or {}
     transport = str(data.get("transport", "smtp")).strip().lower()
@@ -591,7 +620,7 @@ def api_update_email_settings(user: User):
     existing_transport: dict = {}
     if transport_existing and transport_existing.value:
         try:
-            parsed = json.loads(transport_existing.value)
+            parsed = fast_json.loads(transport_existing.value)
             if isinstance(parsed, dict):
                 existing_transport = parsed
         except json.JSONDecodeError:
@@ -614,21 +643,21 @@ def api_update_email_settings(user: User):
 
     if transport == "relay":
         if not effective_relay_base_url(tentative_transport):
-            return json.dumps({"error": "Relay base URL is required (saved value or BROKE_MAIL_RELAY_BASE_URL)."}), 400
+            return fast_json.dumps({"error": "Relay base URL is required (saved value or BROKE_MAIL_RELAY_BASE_URL)."}), 400
         if not effective_relay_token(tentative_transport):
-            return json.dumps({"error": "Relay token is required (saved value or BROKE_MAIL_RELAY_TOKEN)."}), 400
+            return fast_json.dumps({"error": "Relay token is required (saved value or BROKE_MAIL_RELAY_TOKEN)."}), 400
     else:
         host = str(data.get("host", "")).strip()
         if not host:
-            return json.dumps({"error": "SMTP host is required when using SMTP"}), 400
+            return fast_json.dumps({"error": "SMTP host is required when using SMTP"}), 400
 
         try:
             port = int(data.get("port", 587))
         except (TypeError, ValueError):
-            return json.dumps({"error": "SMTP port must be a number"}), 400
+            return fast_json.dumps({"error": "SMTP port must be a number"}), 400
 
         if port <= 0 or port > 65535:
-            return json.dumps({"error": "SMTP port is out of range"}), 400
+            return fast_json.dumps({"error": "SMTP port is out of range"}), 400
 
     transport_payload = {
         "transport": transport,
@@ -637,17 +666,17 @@ def api_update_email_settings(user: User):
     }
 
     if transport_existing:
-        transport_existing.value = json.dumps(transport_payload)
+        transport_existing.value = fast_json.dumps(transport_payload)
         transport_existing.save()
     else:
-        GlobalSetting.create(key=EMAIL_TRANSPORT_SETTINGS_KEY, value=json.dumps(transport_payload))
+        GlobalSetting.create(key=EMAIL_TRANSPORT_SETTINGS_KEY, value=fast_json.dumps(transport_payload))
 
     if transport == "smtp":
         existing_record = GlobalSetting.get_or_none(GlobalSetting.key == "smtp_settings")
         existing_settings = {}
         if existing_record and existing_record.value:
             try:
-                existing_settings = json.loads(existing_record.value)
+                existing_settings = fast_json.loads(existing_record.value)
             except json.JSONDecodeError:
                 existing_settings = {}
 
@@ -668,12 +697,12 @@ def api_update_email_settings(user: User):
         }
 
         if existing_record:
-            existing_record.value = json.dumps(settings)
+            existing_record.value = fast_json.dumps(settings)
             existing_record.save()
         else:
-            GlobalSetting.create(key="smtp_settings", value=json.dumps(settings))
+            GlobalSetting.create(key="smtp_settings", value=fast_json.dumps(settings))
 
-    return json.dumps({"success": True}), 200
+    return fast_json.dumps({"success": True}), 200
 
 
 @settings_bp.route("/api/settings/email/test", methods=["POST"])
@@ -681,19 +710,19 @@ def api_update_email_settings(user: User):
 def api_send_test_email(user: User):
     """Send a test email using the configured delivery method (admin only)."""
     if user.admin != 1:
-        return json.dumps({"error": "Unauthorized. Admins only."}), 403
+        return fast_json.dumps({"error": "Unauthorized. Admins only."}), 403
 
     data = request.get_json(silent=True) or {}
     recipient = str(data.get("recipient", "")).strip() or user.email
     if not recipient:
-        return json.dumps({"error": "Recipient email is required"}), 400
+        return fast_json.dumps({"error": "Recipient email is required"}), 400
 
     html = render_email("email/smtp_test.jinja2", username=user.username)
     text = render_email("email/smtp_test.txt.jinja2", username=user.username)
 
     if not mail.send_email(recipient, "Broke email test", html, text_content=text):
         return (
-            json.dumps(
+            fast_json.dumps(
                 {
                     "error": "Could not send email. For SMTP, verify host, credentials, TLS, and port; "
                     "for relay, verify BROKE_MAIL_RELAY_* env vars or saved relay URL/token. Check server logs.",
@@ -701,32 +730,31 @@ def api_send_test_email(user: User):
             ),
             500,
         )
-    return json.dumps({"success": True}), 200
+    return fast_json.dumps({"success": True}), 200
 
 
 @settings_bp.route("/api/settings/security/password", methods=["POST"])
 @protected
 def api_change_password(user: User):
     """Change user password"""
-    import pyargon2
-
     data = request.get_json()
     current_password = data.get("current_password", "")
     new_password = data.get("new_password", "")
 
     # Verify current password
-    if pyargon2.hash(current_password, str(user.salt)) != user.password_hash:
-        return json.dumps({"error": "Current password is incorrect"}), 400
+    if not verify_password(current_password, user.password_hash, user.salt):
+        return fast_json.dumps({"error": "Current password is incorrect"}), 400
 
     # Validate new password
     if len(new_password) < 8:
-        return json.dumps({"error": "Password must be at least 8 characters"}), 400
+        return fast_json.dumps({"error": "Password must be at least 8 characters"}), 400
 
     # Update password
-    user.password_hash = pyargon2.hash(new_password, str(user.salt))  # type: ignore
+    user.password_hash = hash_password(new_password)  # type: ignore
+    user.salt = ""  # type: ignore
     user.save()
 
-    return json.dumps({"success": True, "message": "Password updated successfully"}), 200
+    return fast_json.dumps({"success": True, "message": "Password updated successfully"}), 200
 
 
 # ============ Webhook API Endpoints ============
@@ -738,7 +766,7 @@ def api_regenerate_webhook_secret(user: User):
     """Regenerate webhook secret"""
 
     if user.admin != 1:
-        return json.dumps({"error": "Unauthorized. Admins only."}), 403
+        return fast_json.dumps({"error": "Unauthorized. Admins only."}), 403
 
     data = request.get_json()
     secret_type = data.get("type", "github")
@@ -755,7 +783,7 @@ def api_regenerate_webhook_secret(user: User):
 
     settings.save()
 
-    return json.dumps({"success": True, "secret": new_secret}), 200
+    return fast_json.dumps({"success": True, "secret": new_secret}), 200
 
 
 @settings_bp.route("/api/settings/webhooks/outgoing", methods=["POST"])
@@ -768,46 +796,45 @@ def api_create_outgoing_webhook(user: User):
     secret = data.get("secret", "")
 
     if not url:
-        return json.dumps({"error": "URL is required"}), 400
+        return fast_json.dumps({"error": "URL is required"}), 400
 
     # Validate URL format
     if not url.startswith(("http://", "https://")):
-        return json.dumps({"error": "Invalid URL format"}), 400
+        return fast_json.dumps({"error": "Invalid URL format"}), 400
 
     webhook = Webhook.create(
         user=user.username,
         url=url,
-        events=json.dumps(events),
+        events=fast_json.dumps(events),
         secret=secret,
         active=True,
         created_at=int(time.time()),
     )
 
-    return json.dumps({"success": True, "webhook_id": webhook.id}), 200
+    return fast_json.dumps({"success": True, "webhook_id": webhook.id}), 200
 
 
 @settings_bp.route("/api/settings/webhooks/<int:webhook_id>", methods=["DELETE"])
 @protected
 def api_delete_webhook(user: User, webhook_id: int):
     """Delete an outgoing webhook"""
-    try:
-        webhook = Webhook.get((Webhook.id == webhook_id) & (Webhook.user == user.username))
-        webhook.delete_instance()
-        return json.dumps({"success": True}), 200
-    except DoesNotExist:
-        return json.dumps({"error": "Webhook not found"}), 404
+    deleted = (
+        Webhook.delete()
+        .where((Webhook.id == webhook_id) & (Webhook.user == user.username))
+        .execute()
+    )
+    if not deleted:
+        return fast_json.dumps({"error": "Webhook not found"}), 404
+    return fast_json.dumps({"success": True}), 200
 
 
 @settings_bp.route("/api/settings/webhooks/<int:webhook_id>/test", methods=["POST"])
 @protected
 def api_test_webhook(user: User, webhook_id: int):
     """Send a test event to a webhook"""
-    import requests
-
-    try:
-        webhook = Webhook.get((Webhook.id == webhook_id) & (Webhook.user == user.username))
-    except DoesNotExist:
-        return json.dumps({"error": "Webhook not found"}), 404
+    webhook = Webhook.get_or_none((Webhook.id == webhook_id) & (Webhook.user == user.username))
+    if webhook is None:
+        return fast_json.dumps({"error": "Webhook not found"}), 404
 
     # Send test payload
     test_payload = {
@@ -817,9 +844,9 @@ def api_test_webhook(user: User, webhook_id: int):
     }
 
     try:
-        response = requests.post(
+        response = _webhook_http.post(
             webhook.url,
-            json=test_payload,
+            data=fast_json.dumps(test_payload),
             headers={
                 "Content-Type": "application/json",
                 "X-Broke-Event": "test",
@@ -833,16 +860,16 @@ def api_test_webhook(user: User, webhook_id: int):
         # Log successful delivery
         log_webhook_delivery(webhook, "test", status_code, "success")
 
-        return json.dumps({"success": True, "status_code": status_code}), 200
+        return fast_json.dumps({"success": True, "status_code": status_code}), 200
 
     except requests.exceptions.HTTPError as e:
         status_code = e.response.status_code if e.response else 0
         log_webhook_delivery(webhook, "test", status_code, "error")
-        return json.dumps({"success": False, "status_code": status_code}), 200
+        return fast_json.dumps({"success": False, "status_code": status_code}), 200
 
     except Exception as e:
         log_webhook_delivery(webhook, "test", 0, "error")
-        return json.dumps({"error": str(e)}), 500
+        return fast_json.dumps({"error": str(e)}), 500
 
 
 # ============ MEMBERS ============
@@ -887,32 +914,33 @@ def api_invite_team_member(user: User):
 def api_delete_team_member(user: User, username: str):
     """Delete a team member (Admin only) using tombstone strategy."""
     if user.admin != 1:
-        return json.dumps({"error": "Unauthorized. Admins only."}), 403
+        return fast_json.dumps({"error": "Unauthorized. Admins only."}), 403
 
     if user.username == username:
-        return json.dumps({"error": "You cannot delete yourself."}), 400
+        return fast_json.dumps({"error": "You cannot delete yourself."}), 400
 
     try:
         target_user = User.get(User.username == username)
 
         # Keep the user row for history references (comments, update authors),
         # but revoke access and clear user-specific settings/integrations.
-        from ..utils.models import APIToken, UserSettings, UserTicketJoin, Webhook
-
-        UserSettings.delete().where(UserSettings.user == username).execute()
-        Webhook.delete().where(Webhook.user == username).execute()
-        APIToken.delete().where(APIToken.user == username).execute()
-        UserTicketJoin.delete().where(UserTicketJoin.user == username).execute()
-
-        target_user.salt = uuid.uuid4().hex
-        target_user.password_hash = pyargon2.hash(uuid.uuid4().hex, target_user.salt)
-        target_user.email = f"deleted+{username}+{int(time.time())}@deleted.local"
-        target_user.admin = 0
-        target_user.save()
-
-        return json.dumps({"success": True}), 200
+        # Hash before opening the transaction so the write lock is not held through Argon2
+        scrambled_hash = hash_password(uuid.uuid4().hex)
+        with database.atomic():
+            UserSettings.delete().where(UserSettings.user == username).execute()
+            Webhook.delete().where(Webhook.user == username).execute()
+            APIToken.delete().where(APIToken.user == username).execute()
+            UserTicketJoin.delete().where(UserTicketJoin.user == username).execute()
+
+            target_user.salt = ""
+            target_user.password_hash = scrambled_hash
+            target_user.email = f"deleted+{username}+{int(time.time())}@deleted.local"
+            target_user.admin = 0
+            target_user.save()
+
+        return fast_json.dumps({"success": True}), 200
     except DoesNotExist:
-        return json.dumps({"error": "User not found"}), 404
+        return fast_json.dumps({"error": "User not found"}), 404
 
 
 @settings_bp.route("/api/settings/team/<username>/temporary-password", methods=["POST"])
@@ -920,25 +948,25 @@ def api_delete_team_member(user: User, username: str):
 def api_set_temporary_password(user: User, username: str):
     """Set a temporary password for a user when admins need manual recovery."""
     if user.admin != 1:
-        return json.dumps({"error": "Unauthorized. Admins only."}), 403
+        return fast_json.dumps({"error": "Unauthorized. Admins only."}), 403
 
     try:
         target_user = User.get(User.username == username)
     except DoesNotExist:
-        return json.dumps({"error": "User not found"}), 404
+        return fast_json.dumps({"error": "User not found"}), 404
 
     # Default to generated secret if admin does not provide one.
     payload = request.get_json(silent=True) or {}
     temp_password = (payload.get("password") or "").strip() or secrets.token_urlsafe(10)
     if len(temp_password) < 8:
-        return json.dumps({"error": "Temporary password must be at least 8 characters"}), 400
+        return fast_json.dumps({"error": "Temporary password must be at least 8 characters"}), 400
 
-    target_user.salt = uuid.uuid4().hex
-    target_user.password_hash = pyargon2.hash(temp_password, target_user.salt)
+    target_user.salt = ""
+    target_user.password_hash = hash_password(temp_password)
     target_user.admin = 0
     target_user.save()
 
-    return json.dumps({"success": True, "temporary_password": temp_password}), 200
+    return fast_json.dumps({"success": True, "temporary_password": temp_password}), 200
 
 
 @settings_bp.route("/welcome/<token>", methods=["GET", "POST"])
@@ -999,7 +1027,7 @@ def api_create_token(user: User):
 
     # Return the full token only once
     return (
-        json.dumps(
+        fast_json.dumps(
             {
                 "success": True,
                 "token": token,
@@ -1015,12 +1043,14 @@ def api_create_token(user: User):
 def api_delete_token(user: User, token_id: int):
     """Delete an API token"""
 
-    try:
-        token = APIToken.get((APIToken.id == token_id) & (APIToken.user == user.username))
-        token.delete_instance()
-        return json.dumps({"success": True}), 200
-    except DoesNotExist:
-        return json.dumps({"error": "Token not found"}), 404
+    deleted = (
+        APIToken.delete()
+        .where((APIToken.id == token_id) & (APIToken.user == user.username))
+        .execute()
+    )
+    if not deleted:
+        return fast_json.dumps({"error": "Token not found"}), 404
+    return fast_json.dumps({"success": True}), 200
 
 
 # ============ Agent token endpoints (Bearer, short-lived) ============
@@ -1035,7 +1065,7 @@ def api_list_agent_tokens(user: User):
     out = []
     for row in rows:
         try:
-            scopes = json.loads(row.scopes or "[]")
+            scopes = fast_json.loads(row.scopes or "[]")
         except json.JSONDecodeError:
             scopes = []
         out.append(
@@ -1093,7 +1123,7 @@ def api_create_agent_token(user: User):
         token_hash=token_hash,
         token_preview=raw[:8],
         expires_at=now + ttl,
-        scopes=json.dumps(scopes),
+        scopes=fast_json.dumps(scopes),
         project=project,
         work_cycle_id=work_cycle_id,
         created_at=now,
@@ -1141,7 +1171,7 @@ def api_create_dsn_token(user: User):
     """Create or replace the DSN token - only one can exist"""
 
     if user.admin != 1:
-        return json.dumps({"error": "Unauthorized. Admins only."}), 403
+        return fast_json.dumps({"error": "Unauthorized. Admins only."}), 403
 
     # Delete any existing DSN token
     DSNToken.delete().execute()
@@ -1157,7 +1187,7 @@ def api_create_dsn_token(user: User):
     )
 
     return (
-        json.dumps(
+        fast_json.dumps(
             {
                 "success": True,
                 "token": token,
@@ -1174,14 +1204,14 @@ def api_revoke_dsn_token(user: User):
     """Revoke the DSN token"""
 
     if user.admin != 1:
-        return json.dumps({"error": "Unauthorized. Admins only."}), 403
+        return fast_json.dumps({"error": "Unauthorized. Admins only."}), 403
 
     count = DSNToken.delete().execute()
 
     if count > 0:
-        return json.dumps({"success": True}), 200
+        return fast_json.dumps({"success": True}), 200
     else:
-        return json.dumps({"error": "No DSN token exists"}), 404
+        return fast_json.dumps({"error": "No DSN token exists"}), 404
 
 
 @settings_bp.route("/api/settings/projects", methods=["POST"])
@@ -1193,21 +1223,17 @@ def api_create_project(user: User):
     name = data.get("name", "").strip()
 
     if not name:
-        return json.dumps({"error": "Project name is required"}), 400
+        return fast_json.dumps({"error": "Project name is required"}), 400
 
     # Generate project ID from name
-    project_id = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")[:3].upper()
+    project_id = _PROJECT_ID_SEPARATORS.sub("-", name.lower()).strip("-")[:3].upper()
 
     # Check if project exists
-    try:
-        Project.get(Project.id == project_id)
-
+    if Project.select(Project.id).where(Project.id == project_id).exists():
         # TODO: Handle ID conflicts better (e.g., append numbers)
         flash("Project ID already exists. Please choose a different name.", "error")
 
         return redirect(url_for("settings.settings_section_view", section="projects"))
-    except DoesNotExist:
-        pass
 
     Project.create(
         id=project_id,
@@ -1340,48 +1366,61 @@ def api_delete_label(user: User, label_name: str):
 @protected
 def api_delete_account(user: User):
     """Delete user account"""
-    import pyargon2
-
     data = request.get_json()
     password = data.get("password", "")
 
     # Verify password
-    if pyargon2.hash(password, user.salt) != user.password_hash:
-        return json.dumps({"error": "Incorrect password"}), 400
+    if not verify_password(password, user.password_hash, user.salt):
+        return fast_json.dumps({"error": "Incorrect password"}), 400
 
-    # Delete user data
-    UserSettings.delete().where(UserSettings.user == user.username).execute()
-    Webhook.delete().where(Webhook.user == user.username).execute()
-    APIToken.delete().where(APIToken.user == user.username).execute()
+    # Delete user data and the user in one transaction (one commit, all or nothing)
+    with database.atomic():
+        UserSettings.delete().where(UserSettings.user == user.username).execute()
+        Webhook.delete().where(Webhook.user == user.username).execute()
+        APIToken.delete().where(APIToken.user == user.username).execute()
 
-    # Finally delete user
-    user.delete_instance()
+        # Finally delete user
+        user.delete_instance()
 
-    return json.dumps({"success": True}), 200
+    return fast_json.dumps({"success": True}), 200
 
 
 # ============ Helper Functions ============
 
 
 def get_or_create_user_settings(user: User) -> "UserSettings":
-    """Get or create user settings"""
-    try:
-        return UserSettings.get(UserSettings.user == user.username)
-    except DoesNotExist:
-        return UserSettings.create(
-            user=user.username,
-            theme="light",
-            compact_mode=0,
-            animations=1,
-            home_page="news",
-            default_ticket_view="list",
-            timezone="UTC",
-            date_format="dmy",
-            notification_settings="{}",
-            github_settings="{}",
-            webhook_secret=secrets.token_hex(16),
-            github_webhook_secret=secrets.token_hex(16),
-        )
+    """Get or create user settings.
+
+    The row is cached on ``flask.g`` for the rest of the request, so a view and the
+    helpers it calls share one SELECT and one (mutable) instance.
+    """
+    cached = g.get("_user_settings")
+    if cached is not None and cached[0] == user.username:
+        return cached[1]
+
+    settings = _load_or_create_user_settings(user)
+    g._user_settings = (user.username, settings)
+    return settings
+
+
+def _load_or_create_user_settings(user: User) -> "UserSettings":
+    settings = UserSettings.get_or_none(UserSettings.user == user.username)
+    if settings is not None:
+        return settings
+    return UserSettings.create(
+        user=user.username,
+        theme="light",
+        compact_mode=0,
+        animations=1,
+        home_page="news",
+        default_ticket_view="list",
+        timezone="UTC",
+        date_format="dmy",
+        notification_settings="{}",
+        github_settings="{}",
+        webhook_secret=secrets.token_hex(16),
+        github_webhook_secret=secrets.token_hex(16),
+    )
 
 
 def get_secret_from_txt_file(fpath: str) -> str:
@@ -1409,20 +1448,28 @@ def get_github_webhook_secret() -> str:
 def get_recent_webhook_activity(user: User, limit: int = 10) -> list:
     """Get recent webhook delivery activity"""
     try:
+        # Only the four displayed columns, as plain dicts; the join just scopes to the user.
         deliveries = (
-            WebhookDelivery.select()
+            WebhookDelivery.select(
+                WebhookDelivery.event,
+                WebhookDelivery.status,
+                WebhookDelivery.response_code,
+                WebhookDelivery.timestamp,
+            )
             .join(Webhook)
             .where(Webhook.user == user.username)
             .order_by(WebhookDelivery.timestamp.desc())
             .limit(limit)
+            .dicts()
         )
 
+        now = int(time.time())
         return [
             {
-                "event": d.event,
-                "status": d.status,
-                "response_code": d.response_code,
-                "time": time_ago(d.timestamp),
+                "event": d["event"],
+                "status": d["status"],
+                "response_code": d["response_code"],
+                "time": time_ago(d["timestamp"], now),
             }
             for d in deliveries
         ]
@@ -1453,14 +1500,14 @@ def api_check_update(user: User):
     """Manually trigger an update check"""
     if not is_feature_enabled(FEATURE_UPDATER):
         return (
-            json.dumps({"error": "Updater is disabled on this instance", "feature": FEATURE_UPDATER}),
+            fast_json.dumps({"error": "Updater is disabled on this instance", "feature": FEATURE_UPDATER}),
             403,
         )
 
     from ..utils.updater import check_for_update
 
     info = check_for_update()
-    return json.dumps(info or {"error": "Failed to check"}), 200
+    return fast_json.dumps(info or {"error": "Failed to check"}), 200
 
 
 @settings_bp.route("/api/settings/updates/apply", methods=["POST"])
@@ -1469,7 +1516,7 @@ def api_apply_update(user: User):
     """Trigger the updater sidecar to pull and restart"""
     if not is_feature_enabled(FEATURE_UPDATER):
         return (
-            json.dumps({"error": "Updater is disabled on this instance", "feature": FEATURE_UPDATER}),
+            fast_json.dumps({"error": "Updater is disabled on this instance", "feature": FEATURE_UPDATER}),
             403,
         )
 
@@ -1477,8 +1524,8 @@ def api_apply_update(user: User):
 
     result = apply_update()
     if "error" in result:
-        return json.dumps(result), 500
-    return json.dumps(result), 200
+        return fast_json.dumps(result), 500
+    return fast_json.dumps(result), 200
 
 
 @settings_bp.route("/api/settings/updates/toggle", methods=["POST"])
@@ -1487,7 +1534,7 @@ def api_toggle_auto_check(user: User):
     """Toggle automatic update checking"""
     if not is_feature_enabled(FEATURE_UPDATER):
         return (
-            json.dumps({"error": "Updater is disabled on this instance", "feature": FEATURE_UPDATER}),
+            fast_json.dumps({"error": "Updater is disabled on this instance", "feature": FEATURE_UPDATER}),
             403,
         )
 
@@ -1496,4 +1543,4 @@ def api_toggle_auto_check(user: User):
     data = request.get_json()
     enabled = data.get("enabled", not is_auto_check_enabled())
     set_auto_check_enabled(enabled)
-    return json.dumps({"success": True, "enabled": enabled}), 200
+    return fast_json.dumps({"success": True, "enabled": enabled}), 200
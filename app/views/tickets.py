@@ -95,23 +95,25 @@ def populateTickets(tickets_or_query: list[Ticket] | Any, lite: bool = False) ->
         t.comments = getattr(t, "comments", [])
         t.updates = getattr(t, "updates", [])
 
-    # 1. Bulk Assignees
-    utjs = UserTicketJoin.select().where(UserTicketJoin.ticket.in_(ticket_ids))
-    user_ids = [utj.user for utj in utjs]
-    if user_ids:
-        users = {u.username: u for u in User.select().where(User.username.in_(user_ids))}
-        for utj in utjs:
-            if utj.ticket in ticket_dict and utj.user in users:
-                ticket_dict[utj.ticket].assignees.append(users[utj.user])
-
-    # 2. Bulk Labels
-    tljs = TicketLabelJoin.select().where(TicketLabelJoin.ticket.in_(ticket_ids))
-    label_ids = [tlj.label for tlj in tljs]
-    if label_ids:
-        labels = {l.name: l for l in Label.select().where(Label.name.in_(label_ids))}
-        for tlj in tljs:
-            if tlj.ticket in ticket_dict and tlj.label in labels:
-                ticket_dict[tlj.ticket].labels.append(labels[tlj.label])
+    # 1. Bulk Assignees, joined to their users in the same query
+    utjs = (
+        UserTicketJoin.select(UserTicketJoin.ticket, User)
+        .join(User, on=(UserTicketJoin.user == User.username), attr="assignee")
+        .where(UserTicketJoin.ticket.in_(ticket_ids))
+    )
+    for utj in utjs:
+        if utj.ticket in ticket_dict:
+            ticket_dict[utj.ticket].assignees.append(utj.assignee)
+
+    # 2. Bulk Labels, joined to their label rows in the same query
+    tljs = (
+        TicketLabelJoin.select(TicketLabelJoin.ticket, Label)
+        .join(Label, on=(TicketLabelJoin.label == Label.name), attr="label_row")
+        .where(TicketLabelJoin.ticket.in_(ticket_ids))
+    )
+    for tlj in tljs:
+        if tlj.ticket in ticket_dict:
+            ticket_dict[tlj.ticket].labels.append(tlj.label_row)
 
     if not lite:
         # 3. Bulk Comments
@@ -1,82 +1,103 @@
 import hashlib
 import hmac
-import json
 import re
+import time
 
 from flask import Blueprint, request
-from peewee import DoesNotExist
+from peewee import chunked
 
-from ..utils.models import Project, Ticket, TicketUpdateMessage
+from ..utils import fast_json
+from ..utils.models import Project, Ticket, TicketUpdateMessage, database
 from .settings import get_github_webhook_secret
 
 # Create blueprint
 webhooks_bp = Blueprint("webhooks", __name__)
 
 # * GitHub Webhook Handlers * #
+# Longer keyword forms come first: with "fix" tried before "fixes", findall on
+# "fixes ABC-1" captures "es" instead of the ticket id.
 TICKET_RESOLVE_PATTERN = re.compile(
-    r"(?:fix|fixes|fixed|close|closes|closed|resolve|resolves|resolved)\s*#?([\w-]+)", re.IGNORECASE
+    r"(?:fixes|fixed|fix|closes|closed|close|resolves|resolved|resolve)\s*#?([\w-]+)",
+    re.IGNORECASE,
+)
+TICKET_REFER_PATTERN = re.compile(r"(?:refs|ref|about|see|related)\s*#?([\w-]+)", re.IGNORECASE)
+# Subset of the resolve keywords that close a ticket (resolve* only marks it done)
+TICKET_CLOSE_PATTERN = re.compile(
+    r"(?:fixes|fixed|fix|closes|closed|close)\s*#?([\w-]+)", re.IGNORECASE
 )
-TICKET_REFER_PATTERN = re.compile(r"(?:ref|refs|about|see|related)\s*#?([\w-]+)", re.IGNORECASE)
-
-
-def _commit_message_closes_ticket(message: str, ticket_id: str) -> bool:
-    """True if message uses fix/close/… with optional # before ticket id (matches resolve pattern)."""
-    escaped = re.escape(ticket_id)
-    return bool(
-        re.search(
-            r"(?:fix|fixes|fixed|close|closes|closed)\s*#?" + escaped + r"(?!\w)",
-            message,
-            re.IGNORECASE,
-        )
-    )
 
 
 def handle_github_push_event(payload: dict, project: Project) -> dict:
     """Handle GitHub push events - link commits to tickets."""
 
     commits = payload.get("commits", [])
-    linked_tickets = []
+    parsed = []
+    mentioned_ids = set()
 
     for commit in commits:
         message = commit.get("message", "")
-        commit_sha = commit.get("id", "")[:8]
-        commit_url = commit.get("url", "")
-        author = commit.get("author", {}).get("name", "Unknown")
-
         matches_resolve = TICKET_RESOLVE_PATTERN.findall(message)
         matches_refere = TICKET_REFER_PATTERN.findall(message)
+        parsed.append((commit, message, matches_resolve, matches_refere))
+        mentioned_ids.update(matches_resolve)
+        mentioned_ids.update(matches_refere)
+
+    # One lookup for every id mentioned in the push instead of one (or two) per match
+    existing_ids = set()
+    if mentioned_ids:
+        existing_ids = {
+            ticket_id
+            for (ticket_id,) in Ticket.select(Ticket.id)
+            .where(Ticket.id.in_(list(mentioned_ids)))
+            .tuples()
+        }
+
+    linked_tickets = []
+    update_rows = []
+    final_status = {}  # ticket id -> last status assigned, in commit order
+    now = int(time.time())
 
-        for ticket_id_str in matches_resolve:
-            try:
-                ticket_id = ticket_id_str
-                ticket = Ticket.get(Ticket.id == ticket_id)
+    for commit, message, matches_resolve, matches_refere in parsed:
+        commit_sha = commit.get("id", "")[:8]
+        commit_url = commit.get("url", "")
+        author = commit.get("author", {}).get("name", "Unknown")
+        closing_ids = set(TICKET_CLOSE_PATTERN.findall(message))
 
-                ticket.status = "done"
-                ticket.save()
+        for ticket_id in matches_resolve:
+            if ticket_id not in existing_ids:
+                continue
+            final_status[ticket_id] = "done"
+            linked_tickets.append({"ticket_id": ticket_id, "commit": commit_sha})
 
-                linked_tickets.append({"ticket_id": ticket_id, "commit": commit_sha})
-            except (DoesNotExist, ValueError):
+        for ticket_id in matches_resolve + matches_refere:
+            if ticket_id not in existing_ids:
                 continue
 
-        for ticket_id_str in matches_resolve + matches_refere:
-            try:
-                ticket_id = ticket_id_str
-                ticket = Ticket.get(Ticket.id == ticket_id)
+            update_rows.append(
+                {
+                    "ticket": ticket_id,
+                    "title": "Commit Linked",
+                    "icon": "ph ph-git-commit",
+                    "message": f"Commit [{commit_sha}]({commit_url}) by {author}\n\n> {message.split(chr(10))[0]}",
+                    "created_at": now,
+                }
+            )
 
-                TicketUpdateMessage.create(
-                    ticket=ticket.id,
-                    title="Commit Linked",
-                    icon="ph ph-git-commit",
-                    message=f"Commit [{commit_sha}]({commit_url}) by {author}\n\n> {message.split(chr(10))[0]}",
-                )
+            if ticket_id in closing_ids:
+                final_status[ticket_id] = "closed"
 
-                if _commit_message_closes_ticket(message, ticket_id_str):
-                    ticket.status = "closed"
-                    ticket.save()
+            linked_tickets.append({"ticket_id": ticket_id, "commit": commit_sha})
 
-                linked_tickets.append({"ticket_id": ticket_id, "commit": commit_sha})
-            except (DoesNotExist, ValueError):
-                continue
+    # Only the final status of each ticket is written: one UPDATE per distinct status
+    ids_by_status = {}
+    for ticket_id, status in final_status.items():
+        ids_by_status.setdefault(status, []).append(ticket_id)
+
+    with database.atomic():
+        for batch in chunked(update_rows, 100):
+            TicketUpdateMessage.insert_many(batch).execute()
+        for status, ticket_ids in ids_by_status.items():
+            Ticket.update(status=status).where(Ticket.id.in_(ticket_ids)).execute()
 
     return {"action": "push", "commits_processed": len(commits), "linked_tickets": linked_tickets}
 
@@ -98,20 +119,18 @@ def handle_github_pr_event(payload: dict, project: Project) -> dict:
         all_text = f"{pr_title} {pr_body}"
         matches = TICKET_REFER_PATTERN.findall(all_text)
         for ticket_id_str in matches:
-            try:
-                ticket = Ticket.get(Ticket.id == ticket_id_str)
-                ticket.status = "in-review"
-                ticket.save()
-
-                TicketUpdateMessage.create(
-                    ticket=ticket.id,
-                    title="PR Opened",
-                    icon="ph ph-git-pull-request",
-                    message=f"PR #{pr_number} opened: [{pr_title}]({pr_url})",
-                )
-
-            except (DoesNotExist, ValueError):
+            ticket = Ticket.get_or_none(Ticket.id == ticket_id_str)
+            if ticket is None:
                 continue
+            ticket.status = "in-review"
+            ticket.save()
+
+            TicketUpdateMessage.create(
+                ticket=ticket.id,
+                title="PR Opened",
+                icon="ph ph-git-pull-request",
+                message=f"PR #{pr_number} opened: [{pr_title}]({pr_url})",
+            )
 
     if action == "closed" and merged:
         all_text = f"{pr_title} {pr_body}"
@@ -119,21 +138,20 @@ def handle_github_pr_event(payload: dict, project: Project) -> dict:
         closed_tickets = []
 
         for ticket_id_str in matches:
-            try:
-                ticket = Ticket.get(Ticket.id == ticket_id_str)
-                ticket.status = "closed"
-                ticket.save()
-
-                TicketUpdateMessage.create(
-                    ticket=ticket.id,
-                    title="PR Merged - Ticket Closed",
-                    icon="ph ph-check-fat",
-                    message=f"Closed via PR #{pr_number}: [{pr_title}]({pr_url})",
-                )
-
-                closed_tickets.append(ticket_id_str)
-            except (DoesNotExist, ValueError):
+            ticket = Ticket.get_or_none(Ticket.id == ticket_id_str)
+            if ticket is None:
                 continue
+            ticket.status = "closed"
+            ticket.save()
+
+            TicketUpdateMessage.create(
+                ticket=ticket.id,
+                title="PR Merged - Ticket Closed",
+                icon="ph ph-check-fat",
+                message=f"Closed via PR #{pr_number}: [{pr_title}]({pr_url})",
+            )
+
+            closed_tickets.append(ticket_id_str)
 
         return {"action": "merged", "pr_number": pr_number, "closed_tickets": closed_tickets}
 
@@ -162,32 +180,24 @@ def github_webhook():
     if event_type == "ping":
         return {"message": "Pong! Webhook configured successfully."}, 200
 
-    # Verify signature
-    payload_body = request.data
-    try:
-        payload = request.get_json()
-        repo = payload.get("repository", {})
-        repo_name = repo.get("name", "")
-
-        # Get the webhook secret for this project
-        github_secret = get_github_webhook_secret()
-
-        computed_signature = (
-            "sha256=" + hmac.new(github_secret.encode(), payload_body, hashlib.sha256).hexdigest()
-        )
-
-        if not hmac.compare_digest(computed_signature, secret):
-            return json.dumps({"error": "Invalid signature"}), 401
-    except Exception:
-        return json.dumps({"error": "Error verifying signature"}), 400
-
-    try:
-        payload = request.get_json()
-    except Exception:
-        return json.dumps({"error": "Invalid JSON payload"}), 400
+    # Verify the signature over the raw body before parsing JSON or touching the DB
+    if not secret:
+        return fast_json.dumps({"error": "Invalid signature"}), 401
+    computed_signature = (
+        "sha256="
+        + hmac.new(get_github_webhook_secret().encode(), request.get_data(), hashlib.sha256).hexdigest()
+    )
+    if not hmac.compare_digest(computed_signature, secret):
+        return fast_json.dumps({"error": "Invalid signature"}), 401
 
+    payload = request.get_json(silent=True)
     if not payload:
-        return json.dumps({"error": "Empty payload"}), 400
+        return fast_json.dumps({"error": "Invalid JSON payload"}), 400
+
+    response_data = {"event": event_type, "delivery_id": delivery_id}
+    if event_type not in ("push", "pull_request"):
+        response_data["message"] = f'Event type "{event_type}" received but not processed'
+        return response_data, 200
 
     # Get repository info
     repo = payload.get("repository", {})
@@ -203,16 +213,12 @@ def github_webhook():
         project = Project.select().first()
 
     if not project:
-        return json.dumps({"error": "No projects found"}), 404
-
-    response_data = {"event": event_type, "delivery_id": delivery_id}
+        return fast_json.dumps({"error": "No projects found"}), 404
 
     # Handle different event types
     if event_type == "push":
         response_data.update(handle_github_push_event(payload, project))
-    elif event_type == "pull_request":
-        response_data.update(handle_github_pr_event(payload, project))
     else:
-        response_data["message"] = f'Event type "{event_type}" received but not processed'
+        response_data.update(handle_github_pr_event(payload, project))
 
     return response_data, 200
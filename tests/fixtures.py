@@ -3,6 +3,7 @@ from app.utils.app import create_app
 import faker
 import time
 from app.utils.models import Ticket, Project, initialize_db, create_user
+from app.views.news import _timeline_cache
 
 
 def create_test_project(project_id, name="Test Project", _unused_description=None):
@@ -55,6 +56,8 @@ def auth_user(fake: faker.Faker = fake):
 @fixture(scope=Scope.Test)
 def auth_client(app=app, auth_user=auth_user):
     """Authenticated test client with logged-in user"""
+    # Timeline payloads are cached per process; start each test from fresh queries
+    _timeline_cache.clear()
     with app.test_client() as client:
         # Login the user via the callback endpoint
         response = client.post('/callback', data={
@@ -6,7 +6,7 @@ import time
 from unittest.mock import patch
 
 from app.utils.models import PasswordResetToken, User
-import pyargon2
+from app.utils.passwords import verify_password
 
 
 @test("/callback POST with valid credentials")
@@ -152,5 +152,5 @@ def _(c=client, user=auth_user):
 
     assert response.status_code == 302
     updated_user = User.get(User.username == user.username)
-    assert updated_user.password_hash == pyargon2.hash(new_password, str(updated_user.salt))
+    assert verify_password(new_password, updated_user.password_hash, updated_user.salt)
     assert PasswordResetToken.get_or_none(PasswordResetToken.token == token_value) is None
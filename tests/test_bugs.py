@@ -100,3 +100,20 @@ def _(f=fake):
             part.delete_instance()
         if Project.get_or_none(Project.id == project.id):
             project.delete_instance()
+
+
+@test("get_project_part drops cached parts on bulk update and delete")
+def _(f=fake):
+    from app.utils.models import ProjectPart, get_project_part
+
+    part = ProjectPart.create(name=f"cached-part-{f.uuid4()}", description="before")
+    try:
+        assert get_project_part(part.id).description == "before"
+
+        ProjectPart.update(description="after").where(ProjectPart.id == part.id).execute()
+        assert get_project_part(part.id).description == "after"
+
+        ProjectPart.delete().where(ProjectPart.id == part.id).execute()
+        assert get_project_part(part.id) is None
+    finally:
+        ProjectPart.delete().where(ProjectPart.id == part.id).execute()
@@ -3,7 +3,7 @@ from unittest.mock import patch
 
 from ward import test, fixture, Scope
 from tests.fixtures import app, client, auth_client, auth_user, create_test_project
-from app.utils.models import Project, ProjectPart, ErrorGroup, ErrorOccurrence, DSNToken
+from app.utils.models import Project, ProjectPart, ErrorGroup, ErrorOccurrence, DSNToken, Session
 from app.views.bug import (
     normalize_message,
     extract_frame_signatures,
@@ -573,6 +573,78 @@ def _(part=error_project_part):
     eg.delete_instance()
 
 
+@test("handle_event_item upsert creates a group once and bumps it on repeats")
+def _(part=error_project_part):
+    from app.utils.events import EventTypes
+    from app.views.bug import handle_event_item
+
+    payload = {
+        "exception": {
+            "values": [
+                {
+                    "type": "LookupError",
+                    "value": f"upsert-{time.time()}",
+                    "stacktrace": {"frames": [{"module": "u", "function": "v"}]},
+                }
+            ]
+        }
+    }
+    with patch("app.views.bug.bus.emit") as emit_mock:
+        eg = handle_event_item(part, payload, "u1", now=1700000000)
+
+    assert eg.event_count == 1
+    assert eg.first_seen == eg.last_seen == 1700000000
+    assert [c[0][0] for c in emit_mock.call_args_list] == [EventTypes.ERROR_NEW]
+
+    with patch("app.views.bug.bus.emit") as emit_mock:
+        again = handle_event_item(part, payload, "u2", now=1700000060)
+
+    assert again.id == eg.id
+    assert again.event_count == 2
+    assert again.first_seen == 1700000000
+    assert again.last_seen == 1700000060
+    assert EventTypes.ERROR_NEW not in [c[0][0] for c in emit_mock.call_args_list]
+    assert ErrorGroup.select().where(ErrorGroup.part == part.id).count() == 1
+
+    ErrorOccurrence.delete().where(ErrorOccurrence.error_group == eg).execute()
+    eg.delete_instance()
+
+
+@test("handle_session_item merges a repeated sid into the stored session")
+def _(part=error_project_part):
+    from app.views.bug import handle_session_item
+
+    sid = f"merge-{time.time()}"
+    handle_session_item(
+        part,
+        {
+            "sid": sid,
+            "status": "ok",
+            "started": "2024-10-01T10:00:00Z",
+            "duration": 12,
+            "errors": 0,
+            "attrs": {"release": "1.0.0", "environment": "production"},
+        },
+        now=1700000000,
+    )
+    # A later update carries only the changed fields
+    handle_session_item(part, {"sid": sid, "status": "exited", "errors": 2}, now=1700000100)
+
+    rows = list(Session.select().where((Session.part == part.id) & (Session.session_id == sid)))
+    assert len(rows) == 1
+    session = rows[0]
+    # Status and errors come from the update; duration survives it being absent
+    assert session.status == "exited"
+    assert session.errors == 2
+    assert session.duration == 12
+    # Columns outside the update set keep their first values
+    assert session.started == 1727776800
+    assert session.release == "1.0.0"
+    assert session.environment == "production"
+
+    Session.delete().where(Session.part == part.id).execute()
+
+
 @test("/api/errors/<id>/status requires authentication")
 def _(c=client, error_group=error_group_fixture):
     with c.session_transaction() as sess:
@@ -598,6 +670,24 @@ def _(c=auth_client, error_group=error_group_fixture):
     assert response.status_code == 200
 
 
+@test("/api/errors/<id>/status persists the status and 404s for unknown errors")
+def _(c=auth_client, error_group=error_group_fixture):
+    response = c.post(
+        f"/api/errors/{error_group.id}/status",
+        data=json.dumps({"status": "ignored"}),
+        content_type="application/json",
+    )
+    assert response.status_code == 200
+    assert ErrorGroup.get_by_id(error_group.id).status == "ignored"
+
+    response = c.post(
+        "/api/errors/999999999/status",
+        data=json.dumps({"status": "resolved"}),
+        content_type="application/json",
+    )
+    assert response.status_code == 404
+
+
 @test("/api/errors/<id>/create_ticket requires authentication")
 def _(c=client, error_group=error_group_fixture):
     response = c.post(
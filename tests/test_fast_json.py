@@ -0,0 +1,61 @@
+"""Tests for the orjson-backed JSON helpers"""
+
+from unittest.mock import patch
+
+import orjson
+from flask import Flask, jsonify
+from ward import test
+
+from app.utils import fast_json
+from app.utils.fast_json import OrjsonProvider
+
+
+def _jsonify_with_orjson_spy(obj, debug=False):
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    app.debug = debug
+    with app.app_context(), patch.object(fast_json.orjson, "dumps", wraps=orjson.dumps) as spy:
+        body = jsonify(obj).get_data(as_text=True)
+    return body, spy.call_count
+
+
+@test("fast_json.dumps writes compact JSON through orjson")
+def _():
+    assert fast_json.dumps({"a": 1, "b": [None, 1.5]}) == '{"a":1,"b":[null,1.5]}'
+
+
+@test("fast_json.dumps keeps NaN and Infinity instead of writing null")
+def _():
+    out = fast_json.dumps({"a": float("nan"), "b": [1, float("inf")], "c": None})
+
+    assert '"a": NaN' in out
+    assert "Infinity" in out
+    assert '"c": null' in out
+
+
+@test("fast_json.dumps falls back to the stdlib for integers orjson rejects")
+def _():
+    assert fast_json.dumps({"n": 2**70}) == '{"n": %d}' % 2**70
+
+
+@test("jsonify serializes through orjson with compact output")
+def _():
+    body, calls = _jsonify_with_orjson_spy({"a": 1, "b": [1, 2]})
+
+    assert calls == 1
+    assert body == '{"a":1,"b":[1,2]}\n'
+
+
+@test("jsonify in debug mode pretty-prints through orjson")
+def _():
+    body, calls = _jsonify_with_orjson_spy({"a": 1}, debug=True)
+
+    assert calls == 1
+    assert body == '{\n  "a": 1\n}\n'
+
+
+@test("jsonify keeps NaN by falling back to the stdlib")
+def _():
+    body, _calls = _jsonify_with_orjson_spy({"a": float("nan")})
+
+    assert body == '{"a":NaN}\n'
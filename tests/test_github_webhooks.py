@@ -1,6 +1,8 @@
 from ward import test
+import hashlib
+import hmac
 import json
-from fixtures import client
+from fixtures import client, test_project
 
 
 @test("/api/webhooks/github/ Ping event", tags=["webhooks"])
@@ -21,3 +23,60 @@ def _(client=client):
     assert response.status_code == 200
     data = response.get_json()
     assert data["message"] == "Pong! Webhook configured successfully."
+
+
+def _signed_headers(body: bytes, event: str) -> dict:
+    from app.views.webhooks import get_github_webhook_secret
+
+    secret = get_github_webhook_secret().encode()
+    return {
+        "X-GitHub-Event": event,
+        "X-Hub-Signature-256": "sha256=" + hmac.new(secret, body, hashlib.sha256).hexdigest(),
+        "Content-Type": "application/json",
+    }
+
+
+@test("/api/webhooks/github/ Missing signature is rejected", tags=["webhooks"])
+def _(client=client):
+    payload_bytes = json.dumps({"repository": {"name": "test-repo"}, "commits": []}).encode()
+    headers = {"X-GitHub-Event": "push", "Content-Type": "application/json"}
+
+    response = client.post("/api/webhooks/github/", data=payload_bytes, headers=headers)
+    assert response.status_code == 401
+
+
+@test("/api/webhooks/github/ Signature over a different body is rejected", tags=["webhooks"])
+def _(client=client):
+    headers = _signed_headers(b'{"commits": []}', "push")
+    payload_bytes = json.dumps({"repository": {"name": "test-repo"}, "commits": []}).encode()
+
+    response = client.post("/api/webhooks/github/", data=payload_bytes, headers=headers)
+    assert response.status_code == 401
+
+
+@test("/api/webhooks/github/ Signed non-JSON body returns 400", tags=["webhooks"])
+def _(client=client):
+    body = b"not json at all"
+
+    response = client.post("/api/webhooks/github/", data=body, headers=_signed_headers(body, "push"))
+    assert response.status_code == 400
+
+
+@test("/api/webhooks/github/ Signed push is processed", tags=["webhooks"])
+def _(client=client, test_project=test_project):
+    body = json.dumps({"repository": {"name": "test-repo"}, "commits": []}).encode()
+
+    response = client.post("/api/webhooks/github/", data=body, headers=_signed_headers(body, "push"))
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["event"] == "push"
+    assert data["commits_processed"] == 0
+
+
+@test("/api/webhooks/github/ Signed unsupported event is acknowledged", tags=["webhooks"])
+def _(client=client):
+    body = json.dumps({"repository": {"name": "test-repo"}}).encode()
+
+    response = client.post("/api/webhooks/github/", data=body, headers=_signed_headers(body, "issues"))
+    assert response.status_code == 200
+    assert "not processed" in response.get_json()["message"]
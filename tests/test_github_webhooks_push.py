@@ -112,3 +112,55 @@ def _(client=client):
 
     response = client.post("/api/webhooks/github/", data=payload_bytes, headers=headers)
     assert response.status_code == 401
+
+
+@test("/api/webhooks/github/ Push with several commits keeps the last status", tags=["webhooks"])
+def _(client=client, test_ticket=test_ticket):
+    # ? Resolve then fix the same ticket across two commits; an unknown id is skipped
+    test_ticket.status = "todo"
+    test_ticket.save()
+    unknown_id = "NOPE-404"
+
+    github_secret = get_github_webhook_secret().encode()
+    payload = {
+        "ref": "refs/heads/main",
+        "repository": {"name": "test-repo"},
+        "pusher": {"name": "test-user"},
+        "commits": [
+            {
+                "author": {"name": "Test User"},
+                "message": "resolves " + test_ticket.id,
+                "id": "commitsha789",
+            },
+            {
+                "author": {"name": "Test User"},
+                "message": f"fixes #{test_ticket.id} and closes {unknown_id}",
+                "id": "commitshaabc",
+            },
+        ],
+    }
+    payload_bytes = json.dumps(payload).encode()
+    signature = "sha256=" + hmac.new(github_secret, payload_bytes, hashlib.sha256).hexdigest()
+    headers = {
+        "X-GitHub-Event": "push",
+        "X-Hub-Signature-256": signature,
+        "Content-Type": "application/json",
+    }
+
+    response = client.post("/api/webhooks/github/", data=payload_bytes, headers=headers)
+    assert response.status_code == 200
+    data = response.get_json()
+    assert data["commits_processed"] == 2
+    assert all(link["ticket_id"] == test_ticket.id for link in data["linked_tickets"])
+
+    # "resolves" marks done, the later "fixes" closes: only the last status sticks
+    ticket = Ticket.get(Ticket.id == test_ticket.id)
+    assert ticket.status == "closed"
+
+    # One "Commit Linked" message per commit that mentions the ticket, none for the unknown id
+    linked = TicketUpdateMessage.select().where(
+        (TicketUpdateMessage.ticket == test_ticket.id)
+        & (TicketUpdateMessage.title == "Commit Linked")
+    )
+    assert linked.count() == 2
+    assert TicketUpdateMessage.select().where(TicketUpdateMessage.ticket == unknown_id).count() == 0
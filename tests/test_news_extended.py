@@ -2,8 +2,10 @@
 from ward import test, fixture, Scope
 from tests.fixtures import app, client, auth_client, auth_user, create_test_project
 from app.utils.models import Project, Ticket, Comment, TicketUpdateMessage
+from app.views.news import _cached_timeline_events
 import json
 import time
+from unittest.mock import patch
 
 
 @fixture(scope=Scope.Test)
@@ -241,3 +243,20 @@ def _(c=auth_client, user=auth_user):
     label_update.delete_instance()
     ticket.delete_instance()
     project.delete_instance()
+
+
+@test("Timeline events are served from the cache within the TTL")
+def _():
+    """A second call with the same arguments reuses the first payload."""
+    project_id = f"cache-proj-{int(time.time() * 1000000)}"
+    payload = {"events": [], "has_more": False, "total": 0}
+    with patch("app.views.news.build_timeline_events", return_value=payload) as build:
+        first = _cached_timeline_events(project_id=project_id, days=7)
+        first["extra"] = "caller-added"
+        second = _cached_timeline_events(project_id=project_id, days=7)
+        other = _cached_timeline_events(project_id=project_id, days=7, offset=50)
+
+    assert build.call_count == 2
+    assert second == payload
+    assert "extra" not in second
+    assert other == payload
@@ -20,24 +20,47 @@ def _(f=fake):
     assert user.username == username
     assert user.email == email
     assert user.password_hash != password  # Should be hashed
-    assert len(user.salt) > 0
+    assert user.password_hash.startswith("$argon2id$")  # Salt + parameters embedded
 
 
 @test("password verification works")
 def _(f=fake):
     """Test password hashing and verification"""
-    import pyargon2
     from app.utils.models import create_user
+    from app.utils.passwords import verify_password
 
     username = f.user_name()
     password = "test_password_123"
     user = create_user(username, password, f.email())
 
     # Verify correct password
-    assert pyargon2.hash(password, str(user.salt)) == user.password_hash
+    assert verify_password(password, user.password_hash, user.salt)
 
     # Verify incorrect password fails
-    assert pyargon2.hash("wrong_password", str(user.salt)) != user.password_hash
+    assert not verify_password("wrong_password", user.password_hash, user.salt)
+
+
+@test("authenticate accepts legacy pyargon2 rows and upgrades them")
+def _(f=fake):
+    """Test that pre-argon2-cffi hashes still log in and are rewritten on success"""
+    import pyargon2
+    from app.utils.models import User
+    from app.utils.security import authenticate
+
+    username = f.user_name() + "_legacy"
+    User.create(
+        username=username,
+        password_hash=pyargon2.hash("legacy_password_1", "legacysalt"),
+        salt="legacysalt",
+        email=f.email(),
+    )
+
+    assert authenticate(username, "wrong_password") is None
+    assert authenticate(username, "legacy_password_1") is not None
+
+    upgraded = User.get(User.username == username)
+    assert upgraded.password_hash.startswith("$argon2id$")
+    assert authenticate(username, "legacy_password_1") is not None
 
 
 @test("get_current_user returns None without session")
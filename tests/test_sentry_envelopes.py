@@ -6,9 +6,31 @@ Tests based on official Sentry documentation:
 - https://develop.sentry.dev/sdk/data-model/event-payloads/
 """
 
+import os
+from unittest.mock import patch
+
 from ward import test, fixture, Scope
 from tests.fixtures import app, client, create_test_project
-from app.utils.models import Project, ProjectPart, ErrorGroup, ErrorOccurrence, DSNToken
+from app.utils.events import EventTypes
+from app.views import bug as bug_views
+from app.utils.models import (
+    Attachment,
+    Project,
+    ProjectPart,
+    ErrorGroup,
+    ErrorOccurrence,
+    DSNToken,
+    Session,
+    database,
+)
+from app.views.bug import (
+    _drain_envelope_queue,
+    _envelope_queue,
+    _open_ingest_body,
+    _read_envelope_header,
+    iter_sentry_envelope_items,
+)
+import io
 import json
 import gzip
 import time
@@ -220,6 +242,47 @@ def _(c=client, part=sentry_project_part, token=dsn_token):
     assert b"session" in response.data
 
 
+@test("Sessions aggregate item stores one session per bucket")
+def _(c=client, part=sentry_project_part, token=dsn_token):
+    """Each aggregate bucket gets its own synthetic session row"""
+    envelope = '{}\n'
+    envelope += '{"type":"sessions"}\n'
+    envelope += json.dumps(
+        {
+            "aggregates": [
+                {"started": "2024-10-01T10:00:00Z", "exited": 3},
+                {"started": "2024-10-01T10:01:00Z", "exited": 1},
+                {"started": "2024-10-01T10:02:00Z", "errored": 1},
+            ],
+            "attrs": {"release": "1.0.0", "environment": "production"},
+        }
+    ) + "\n"
+
+    response = c.post(
+        f"/ingest/{part.id}/envelope",
+        data=envelope.encode("utf-8"),
+        headers={"X-Sentry-Auth": f"Sentry sentry_key={token.token}"},
+        content_type="application/x-sentry-envelope",
+    )
+
+    assert response.status_code == 200
+    assert b"sessions" in response.data
+
+    sessions = list(
+        Session.select()
+        .where((Session.part == part.id) & Session.session_id.startswith("aggregate_"))
+        .order_by(Session.started)
+    )
+    assert len(sessions) == 3
+    assert len({s.session_id for s in sessions}) == 3
+    assert sessions[0].started == 1727776800
+    assert all(s.release == "1.0.0" and s.environment == "production" for s in sessions)
+
+    Session.delete().where(
+        (Session.part == part.id) & Session.session_id.startswith("aggregate_")
+    ).execute()
+
+
 @test("Empty lines between items are ignored")
 def _(c=client, part=sentry_project_part, token=dsn_token):
     """Test that empty lines in envelope are safely ignored"""
@@ -693,6 +756,98 @@ def _(c=client, part=sentry_project_part, token=dsn_token):
     assert b"event" in response.data
 
 
+@test("Binary attachments land in data_raw and UTF-8 ones in data")
+def _(c=client, part=sentry_project_part, token=dsn_token):
+    """Undecodable bytes are kept as-is in the BLOB column; text stays in the text column"""
+    event_id = uuid.uuid4().hex
+    binary = b"\x89PNG\r\n\x1a\n\x00\xff\xfe"
+    text = "caf\u00e9 log\n".encode("utf-8")
+
+    envelope = b"".join(
+        [
+            f'{{"event_id":"{event_id}"}}\n'.encode(),
+            b'{"type":"event"}\n',
+            json.dumps(
+                {
+                    "event_id": event_id,
+                    "level": "error",
+                    "exception": {"values": [{"type": "AttachmentError", "value": event_id}]},
+                }
+            ).encode()
+            + b"\n",
+            f'{{"type":"attachment","length":{len(binary)},"filename":"shot.png"}}\n'.encode(),
+            binary + b"\n",
+            f'{{"type":"attachment","length":{len(text)},"filename":"app.log"}}\n'.encode(),
+            text + b"\n",
+        ]
+    )
+
+    response = c.post(
+        f"/ingest/{part.id}/envelope",
+        data=envelope,
+        headers={"X-Sentry-Auth": f"Sentry sentry_key={token.token}"},
+        content_type="application/x-sentry-envelope",
+    )
+    assert response.status_code == 200
+
+    group = ErrorGroup.get((ErrorGroup.part == part.id) & (ErrorGroup.exception_value == event_id))
+    attachments = {a.filename: a for a in Attachment.select().where(Attachment.error_group == group)}
+    try:
+        assert bytes(attachments["shot.png"].data_raw) == binary
+        assert attachments["shot.png"].data == ""
+        assert attachments["app.log"].data == "caf\u00e9 log\n"
+        assert attachments["app.log"].data_raw is None
+    finally:
+        Attachment.delete().where(Attachment.error_group == group).execute()
+
+
+@test("Attachments ending in a truncated UTF-8 sequence land in data_raw")
+def _(c=client, part=sentry_project_part, token=dsn_token):
+    """Only a payload cut at the stored limit may drop a partial trailing character"""
+    event_id = uuid.uuid4().hex
+    broken = "log caf\u00e9".encode("utf-8")[:-1]
+    # 14 bytes; with a 3-char limit the 12-byte decode window ends inside the euro sign
+    long_text = b"abcdefghij" + "\u20ac".encode("utf-8") + b"z"
+
+    envelope = b"".join(
+        [
+            f'{{"event_id":"{event_id}"}}\n'.encode(),
+            b'{"type":"event"}\n',
+            json.dumps(
+                {
+                    "event_id": event_id,
+                    "level": "error",
+                    "exception": {"values": [{"type": "AttachmentError", "value": event_id}]},
+                }
+            ).encode()
+            + b"\n",
+            f'{{"type":"attachment","length":{len(broken)},"filename":"broken.log"}}\n'.encode(),
+            broken + b"\n",
+            f'{{"type":"attachment","length":{len(long_text)},"filename":"long.log"}}\n'.encode(),
+            long_text + b"\n",
+        ]
+    )
+
+    with patch.object(bug_views, "ATTACHMENT_MAX_CHARS", 3):
+        response = c.post(
+            f"/ingest/{part.id}/envelope",
+            data=envelope,
+            headers={"X-Sentry-Auth": f"Sentry sentry_key={token.token}"},
+            content_type="application/x-sentry-envelope",
+        )
+    assert response.status_code == 200
+
+    group = ErrorGroup.get((ErrorGroup.part == part.id) & (ErrorGroup.exception_value == event_id))
+    attachments = {a.filename: a for a in Attachment.select().where(Attachment.error_group == group)}
+    try:
+        assert attachments["broken.log"].data == ""
+        assert bytes(attachments["broken.log"].data_raw) == broken[:3]
+        assert attachments["long.log"].data == "abc"
+        assert attachments["long.log"].data_raw is None
+    finally:
+        Attachment.delete().where(Attachment.error_group == group).execute()
+
+
 @test("Unsupported Content-Type returns 415")
 def _(c=client, part=sentry_project_part, token=dsn_token):
     event_id = uuid.uuid4().hex
@@ -733,6 +888,100 @@ def _(c=client, part=sentry_project_part, token=dsn_token):
     assert response.status_code in [200, 400]
 
 
+# ==============================================================================
+# ENVELOPE PARSER TESTS
+# ==============================================================================
+
+
+def _parse_envelope(raw: bytes):
+    """Run the ingest parser over raw body bytes; return (envelope headers, items)."""
+    src = _open_ingest_body(io.BufferedReader(io.BytesIO(raw)))
+    return _read_envelope_header(src), list(iter_sentry_envelope_items(src))
+
+
+@test("Parser decompresses gzip bodies by magic bytes")
+def _():
+    envelope = b'{"event_id":"abc"}\n{"type":"event"}\n{"message":"zipped"}\n'
+
+    headers, items = _parse_envelope(gzip.compress(envelope))
+
+    assert headers == {"event_id": "abc"}
+    assert items == [({"type": "event"}, b'{"message":"zipped"}')]
+
+
+@test("Parser reads length-prefixed payloads across embedded newlines")
+def _():
+    payload = b"line one\nline two\r\n"
+    envelope = (
+        b"{}\n"
+        + f'{{"type":"attachment","length":{len(payload)}}}\n'.encode()
+        + payload
+        + b"\n"
+        + b'{"type":"event"}\n{"message":"after"}\n'
+    )
+
+    _, items = _parse_envelope(envelope)
+
+    assert items == [
+        ({"type": "attachment", "length": len(payload)}, payload),
+        ({"type": "event"}, b'{"message":"after"}'),
+    ]
+
+
+@test("Parser accepts a final item without a trailing newline")
+def _():
+    _, items = _parse_envelope(b'{}\n{"type":"event"}\n{"message":"last"}')
+    assert items == [({"type": "event"}, b'{"message":"last"}')]
+
+    _, items = _parse_envelope(b'{}\n{"type":"attachment","length":4}\nabcd')
+    assert items == [({"type": "attachment", "length": 4}, b"abcd")]
+
+
+@test("Parser stops at a truncated payload and keeps earlier items")
+def _():
+    envelope = b'{}\n{"type":"event"}\n{"message":"ok"}\n{"type":"attachment","length":100}\nshort'
+
+    _, items = _parse_envelope(envelope)
+    assert items == [({"type": "event"}, b'{"message":"ok"}')]
+
+    # A gzip stream cut mid-way ends the iteration instead of raising
+    compressed = gzip.compress(b'{}\n{"type":"event"}\n{"message":"ok"}\n' * 50)
+    _, items = _parse_envelope(compressed[: len(compressed) // 2])
+    assert all(item == ({"type": "event"}, b'{"message":"ok"}') for item in items)
+
+
+@test("Synchronous ingest writes each item before decoding the next")
+def _(c=client, part=sentry_project_part, token=dsn_token):
+    envelope = (
+        '{}\n'
+        '{"type":"client_report"}\n{"discarded_events":[]}\n'
+        '{"type":"client_report"}\n{"discarded_events":[]}\n'
+    )
+    calls = []
+    decode = bug_views._decode_item_payload
+    process = bug_views._process_envelope_item
+
+    def record_decode(payload, item_type=None):
+        calls.append("decode")
+        return decode(payload, item_type)
+
+    def record_process(*args, **kwargs):
+        calls.append("process")
+        return process(*args, **kwargs)
+
+    with patch.object(bug_views, "_decode_item_payload", side_effect=record_decode), \
+            patch.object(bug_views, "_process_envelope_item", side_effect=record_process):
+        response = c.post(
+            f"/ingest/{part.id}/envelope",
+            data=envelope.encode("utf-8"),
+            headers={"X-Sentry-Auth": f"Sentry sentry_key={token.token}"},
+            content_type="application/x-sentry-envelope",
+        )
+
+    assert response.status_code == 200
+    assert calls == ["decode", "process", "decode", "process"]
+
+
 # ==============================================================================
 # ITEM TYPE TESTS
 # ==============================================================================
@@ -1034,3 +1283,76 @@ def _(c=client, token=dsn_token):
     ErrorGroup.delete().where(ErrorGroup.part == part.id).execute()
     part.delete_instance()
     project.delete_instance()
+
+
+@test("New-error notifications are emitted after the envelope commits")
+def _(c=client, part=sentry_project_part, token=dsn_token):
+    """Subscribers must only see committed rows, and not run under the write lock"""
+    event_id = uuid.uuid4().hex
+    envelope = f'{{"event_id":"{event_id}"}}\n'
+    envelope += '{"type":"event"}\n'
+    envelope += json.dumps(
+        {
+            "event_id": event_id,
+            "level": "error",
+            "exception": {"values": [{"type": "CommitOrderError", "value": event_id}]},
+        }
+    ) + "\n"
+
+    seen = []
+
+    def record(event_type, **kwargs):
+        seen.append((event_type, database.in_transaction()))
+
+    with patch("app.views.bug.bus.emit", side_effect=record):
+        response = c.post(
+            f"/ingest/{part.id}/envelope",
+            data=envelope.encode("utf-8"),
+            headers={"X-Sentry-Auth": f"Sentry sentry_key={token.token}"},
+            content_type="application/x-sentry-envelope",
+        )
+
+    assert response.status_code == 200
+    assert seen == [(EventTypes.ERROR_NEW, False)]
+
+
+@test("Async ingest writes queued envelopes when the queue drains")
+def _(c=client, part=sentry_project_part, token=dsn_token):
+    """BROKE_ASYNC_INGEST acknowledges first; rows appear once the batch is drained"""
+    event_id = uuid.uuid4().hex
+    envelope = f'{{"event_id":"{event_id}"}}\n'
+    envelope += '{"type":"event"}\n'
+    envelope += json.dumps(
+        {
+            "event_id": event_id,
+            "level": "error",
+            "exception": {"values": [{"type": "QueuedError", "value": event_id}]},
+        }
+    ) + "\n"
+
+    queued = []
+    # Capture instead of handing off to the worker thread, then drain in this thread
+    with patch.dict(os.environ, {"BROKE_ASYNC_INGEST": "1"}), patch.object(
+        _envelope_queue, "put", side_effect=queued.append
+    ):
+        response = c.post(
+            f"/ingest/{part.id}/envelope",
+            data=envelope.encode("utf-8"),
+            headers={"X-Sentry-Auth": f"Sentry sentry_key={token.token}"},
+            content_type="application/x-sentry-envelope",
+        )
+
+    assert response.status_code == 200
+    assert b"queued event" in response.data
+    assert len(queued) == 1
+    group_query = ErrorGroup.select().where(
+        (ErrorGroup.part == part.id) & (ErrorGroup.exception_value == event_id)
+    )
+    assert group_query.count() == 0
+
+    with patch("app.views.bug.bus.emit"):
+        _drain_envelope_queue(queued)
+
+    group = group_query.get()
+    assert group.event_count == 1
+    assert ErrorOccurrence.select().where(ErrorOccurrence.error_group == group).count() == 1
@@ -9,7 +9,7 @@ import time
 from app.utils.models import User, create_user, UserSettings, GlobalSetting, DSNToken
 from app.utils.mail import EMAIL_TRANSPORT_SETTINGS_KEY
 from app.utils.path import data_path
-import pyargon2
+from app.utils.passwords import verify_password
 from unittest.mock import patch
 
 
@@ -393,7 +393,7 @@ def _(c=client, f=fake):
     assert payload.get("temporary_password") == "temp-pass-123"
 
     updated_user = User.get(User.username == target_username)
-    assert updated_user.password_hash == pyargon2.hash("temp-pass-123", str(updated_user.salt))
+    assert verify_password("temp-pass-123", updated_user.password_hash, updated_user.salt)
 
 
 @test("Non-admin cannot set temporary password")
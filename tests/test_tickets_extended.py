@@ -2,7 +2,8 @@
 
 from ward import test, fixture, Scope
 from tests.fixtures import app, client, auth_client, auth_user, create_test_project
-from app.utils.models import Ticket, Project, Comment, Label, TicketLabelJoin
+from app.utils.models import Ticket, Project, Comment, Label, TicketLabelJoin, UserTicketJoin
+from app.views.tickets import populateTickets
 import json
 import time
 
@@ -224,3 +225,24 @@ def _(c=auth_client):
     other_project.delete_instance()
     proj1.delete_instance()
     proj1.delete_instance()
+
+
+@test("populateTickets attaches assignees and labels from the joined rows")
+def _(ticket=sample_ticket, label=sample_label, user=auth_user):
+    """Test that join rows resolve to full User and Label objects"""
+    TicketLabelJoin.create(ticket=ticket.id, label=label.name)
+    UserTicketJoin.create(ticket=ticket.id, user=user.username)
+    # Rows pointing at missing users/labels are skipped
+    TicketLabelJoin.create(ticket=ticket.id, label="no-such-label")
+    UserTicketJoin.create(ticket=ticket.id, user="no-such-user")
+
+    tickets = [Ticket.get_by_id(ticket.id)]
+    populateTickets(tickets, lite=True)
+
+    assert [row.name for row in tickets[0].labels] == [label.name]
+    assert tickets[0].labels[0].color == label.color
+    assert [u.username for u in tickets[0].assignees] == [user.username]
+
+    # Cleanup
+    TicketLabelJoin.delete().where(TicketLabelJoin.ticket == ticket.id).execute()
+    UserTicketJoin.delete().where(UserTicketJoin.ticket == ticket.id).execute()